@@ -1,2 +1,5 @@
 from .jsonablize import Parse as jsonablize, quickJSONExport, sortHashableAhead
-from .quick import quickJSON, quickListCSV, quickRead
+from .quick import quickJSON, quickListCSV, quickRead, quickJSONAsync, quickReadAsync, quickJSONL, quickReadJSONL
+from .writebehind import WriteBehindExporter
+from .resultstore import ResultStore
+from .jsonl import JSONLWriter
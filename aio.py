@@ -0,0 +1,67 @@
+from concurrent.futures import Executor
+from typing import Optional, Callable, TypeVar, Any
+import weakref
+import functools
+import asyncio
+
+R = TypeVar('R')
+
+defaultMaxInFlight = 8
+"""The default number of exportations and readings running at once in an event loop."""
+
+_loopLimiters: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = weakref.WeakKeyDictionary()
+
+
+def loopLimiter() -> asyncio.Semaphore:
+    """The semaphore shared by the async exportations and readings in the running event loop,
+    which allows :data:`defaultMaxInFlight` of them at once.
+
+    Returns:
+        asyncio.Semaphore: The semaphore of the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    limiter = _loopLimiters.get(loop, None)
+    if limiter is None:
+        limiter = asyncio.Semaphore(defaultMaxInFlight)
+        _loopLimiters[loop] = limiter
+    return limiter
+
+
+async def runInExecutor(
+    func: Callable[..., R],
+    *args,
+    executor: Optional[Executor] = None,
+    **kwargs,
+) -> R:
+    """Run a blocking function in an executor without blocking the event loop.
+
+    Args:
+        func (Callable[..., R]): The function, which needs to be picklable for a process pool.
+        executor (Optional[Executor], optional): The executor. Defaults to None as the default one of event loop.
+
+    Returns:
+        R: The result of function.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(func, *args, **kwargs))
+
+
+def writeText(
+    target: Any,
+    text: str,
+    openArgs: dict,
+) -> Any:
+    """Write a text into a file and return the path."""
+    with open(target, **openArgs) as File:
+        File.write(text)
+    return target
+
+
+def readText(
+    target: Any,
+    openArgs: dict,
+) -> str:
+    """Read a whole file as text."""
+    with open(target, **openArgs) as File:
+        return File.read()
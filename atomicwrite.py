@@ -0,0 +1,48 @@
+from pathlib import Path
+from stat import S_IMODE
+import tempfile
+import os
+
+# read once at import, since reading the umask needs to set it for a moment,
+# which would race with the files made by the other threads.
+_umask = os.umask(0)
+os.umask(_umask)
+
+
+def fileMode(target: Path) -> int:
+    """The mode of an existing file, or the mode of a new file under the umask."""
+    try:
+        return S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_umask
+
+
+def atomicWrite(
+    target: Path,
+    content: str,
+    fsync: bool = False,
+    **openArgs,
+) -> None:
+    """Write a file by replacing it with a completed temporary file,
+    which has the mode of the file replaced instead of the private one of :func:`tempfile.mkstemp`.
+
+    Args:
+        target (Path): The file.
+        content (str): The text written.
+        fsync (bool, optional): Whether to sync the file to disk before replacing. Defaults to False.
+        openArgs: The other arguments for :func:`open` in text mode, like `encoding`.
+    """
+    fd, tmpName = tempfile.mkstemp(
+        dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        os.chmod(tmpName, fileMode(target))
+        with os.fdopen(fd, 'w', **openArgs) as File:
+            File.write(content)
+            if fsync:
+                File.flush()
+                os.fsync(File.fileno())
+        os.replace(tmpName, target)
+    except BaseException:
+        if os.path.exists(tmpName):
+            os.remove(tmpName)
+        raise
@@ -336,6 +336,7 @@ class Hoshi:
 
         self.__name__ = 'Hoshi'
         self._raw = []
+        self._dirty = True
         for item in raw:
             if isinstance(item, (tuple, list)):
                 if item[0] in self._availablePrint:
@@ -383,6 +384,8 @@ class Hoshi:
         return item_input
 
     def _update(self):
+        if not self._dirty:
+            return
         self._print_lines = []
         _formated = []
 
@@ -470,6 +473,7 @@ class Hoshi:
             else:
                 raise TypeError(
                     f"Unknown item type. '{item['type']}', '{type(item)}'.")
+        self._dirty = False
 
     def __str__(self):
         self._update()
@@ -491,6 +495,7 @@ class Hoshi:
 
     def newline(self, item):
         self._raw.append(item)
+        self._dirty = True
 
     @property
     def lines(self) -> list[str]:
@@ -499,27 +504,35 @@ class Hoshi:
 
     def h1(self, text: str):
         self._raw.append(hnprint(text, heading=1, raw_input=True))
+        self._dirty = True
 
     def h2(self, text: str):
         self._raw.append(hnprint(text, heading=2, raw_input=True))
+        self._dirty = True
 
     def h3(self, text: str):
         self._raw.append(hnprint(text, heading=3, raw_input=True))
+        self._dirty = True
 
     def h4(self, text: str):
         self._raw.append(hnprint(text, heading=4, raw_input=True))
+        self._dirty = True
 
     def h5(self, text: str):
         self._raw.append(hnprint(text, heading=5, raw_input=True))
+        self._dirty = True
 
     def h6(self, text: str):
         self._raw.append(hnprint(text, heading=6, raw_input=True))
+        self._dirty = True
 
     def txt(self, text: str, listing_level: int = 1):
         self._raw.append(txt(text, listing_level, raw_input=True))
+        self._dirty = True
 
     def divider(self, length: int = 60):
         self._raw.append(divider(length, raw_input=True))
+        self._dirty = True
 
     def itemize(
         self,
@@ -535,3 +548,4 @@ class Hoshi:
             'hint': hint,
             'listing_level': listing_level,
         })
+        self._dirty = True
@@ -1,8 +1,13 @@
 import requests
 import pickle
-from typing import NamedTuple
+import json
+import os
+import threading
+from typing import NamedTuple, Iterable, Optional
 from pathlib import Path
 
+from ...atomicwrite import atomicWrite
+
 
 class BasicHookArguments(NamedTuple):
     url: str
@@ -24,6 +29,16 @@ class BasicHook(object):
         self,
         saveLocation: Path | str = None,
     ) -> None:
+        """Save the config of webhook as json, the file is replaced atomically.
+
+        Args:
+            saveLocation (Path | str, optional): 
+                The file to save. Defaults to None as :attr:`config.saveLocation`.
+
+        Raises:
+            ValueError: When saveLocation is None.
+            FileNotFoundError: When the directory of saveLocation does not exist.
+        """
 
         if saveLocation is None:
             saveLocation = self.config.saveLocation
@@ -32,15 +47,11 @@ class BasicHook(object):
 
         if isinstance(saveLocation, str):
             saveLocation = Path(saveLocation)
-        if not saveLocation.exists():
-            raise FileNotFoundError(f"{saveLocation} does not exist")
-
-        export = self.config._asdict()
-        if isinstance(export["saveLocation"], Path):
-            export["saveLocation"] = str(export["saveLocation"])
+        if not saveLocation.parent.exists():
+            raise FileNotFoundError(f"{saveLocation.parent} does not exist")
 
-        with open(saveLocation, "wb") as f:
-            pickle.dump(export, f)
+        atomicWrite(
+            saveLocation, json.dumps(_configExport(self.config)), fsync=True, encoding="utf-8")
 
     def post(
         self,
@@ -69,7 +80,23 @@ class BasicHook(object):
     def read(
         cls,
         saveLocation: Path | str,
+        allowPickle: bool = False,
     ):
+        """Read the config of webhook saved by :meth:`save`.
+
+        Args:
+            saveLocation (Path | str): The file to read.
+            allowPickle (bool, optional): 
+                Whether to read the legacy pickle file, only do it for trusted files. 
+                Defaults to False.
+
+        Raises:
+            ValueError: When saveLocation is None or the file is not a json.
+            FileNotFoundError: When saveLocation does not exist.
+
+        Returns:
+            BasicHook: The webhook.
+        """
         if saveLocation is None:
             raise ValueError("saveLocation cannot be None")
         if isinstance(saveLocation, str):
@@ -80,8 +107,160 @@ class BasicHook(object):
 
         export = {}
         with open(saveLocation, "rb") as f:
-            export: dict[str, str] = pickle.load(f)
+            raw = f.read()
+        try:
+            export: dict[str, str] = json.loads(raw)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            if not allowPickle:
+                raise ValueError(
+                    f"{saveLocation} is not a json, "
+                    "use 'allowPickle=True' to read the legacy pickle file.")
+            export: dict[str, str] = pickle.loads(raw)
 
         export["saveLocation"] = Path(saveLocation)
 
         return cls(**export)
+
+
+def _configExport(config: NamedTuple) -> dict[str, str]:
+    export = config._asdict()
+    if isinstance(export["saveLocation"], Path):
+        export["saveLocation"] = str(export["saveLocation"])
+    return export
+
+
+class HookRegistry(object):
+    """A json store of many webhook configs.
+
+    The store is read once and cached in process until the file is changed,
+    so loading all hooks of a worker costs one read.
+
+    >>> registry = HookRegistry('./hooks.json')
+    >>> registry.update({'status': BasicHook(url1), 'alert': BasicHook(url2)})
+    >>> hooks = registry.read_many(['status', 'alert'])
+
+    """
+    __version__ = (0, 1, 0)
+
+    _cache: dict[Path, tuple[tuple[int, int], dict[str, dict[str, str]]]] = {}
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        saveLocation: Path | str,
+    ):
+        if saveLocation is None:
+            raise ValueError("saveLocation cannot be None")
+        if isinstance(saveLocation, str):
+            saveLocation = Path(saveLocation)
+        self.saveLocation = saveLocation.resolve()
+
+    def _stat(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = os.stat(self.saveLocation)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def load(self) -> dict[str, dict[str, str]]:
+        """Read the configs of all hooks, cached until the file is changed.
+
+        Returns:
+            dict[str, dict[str, str]]: A copy of the configs by names.
+        """
+        signature = self._stat()
+        if signature is None:
+            return {}
+        cached = self._cache.get(self.saveLocation, None)
+        if cached is None or cached[0] != signature:
+            with open(self.saveLocation, "r", encoding="utf-8") as f:
+                hooks: dict[str, dict[str, str]] = json.load(f)["hooks"]
+            cached = (signature, hooks)
+            self._cache[self.saveLocation] = cached
+        return {name: dict(config) for name, config in cached[1].items()}
+
+    def names(self) -> list[str]:
+        return list(self.load())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.load()
+
+    def get(
+        self,
+        name: str,
+        hookType: type[BasicHook] = BasicHook,
+    ) -> BasicHook:
+        """Get a webhook from the store.
+
+        Args:
+            name (str): Name of the hook.
+            hookType (type[BasicHook], optional): The class of hook. Defaults to BasicHook.
+
+        Raises:
+            KeyError: When the hook is not in the store.
+
+        Returns:
+            BasicHook: The webhook.
+        """
+        hooks = self.load()
+        if name not in hooks:
+            raise KeyError(f"'{name}' is not in {self.saveLocation}")
+        return hookType(**hooks[name])
+
+    def read_many(
+        self,
+        names: Optional[Iterable[str]] = None,
+        hookType: type[BasicHook] = BasicHook,
+    ) -> dict[str, BasicHook]:
+        """Get many webhooks from the store by one read.
+
+        Args:
+            names (Optional[Iterable[str]], optional): Names of the hooks. Defaults to None as all.
+            hookType (type[BasicHook], optional): The class of hook. Defaults to BasicHook.
+
+        Returns:
+            dict[str, BasicHook]: The webhooks by names.
+        """
+        hooks = self.load()
+        names = list(hooks) if names is None else list(names)
+        missing = [name for name in names if name not in hooks]
+        if len(missing) > 0:
+            raise KeyError(f"{missing} are not in {self.saveLocation}")
+        return {name: hookType(**hooks[name]) for name in names}
+
+    def update(
+        self,
+        hooks: dict[str, BasicHook] = {},
+        remove: Iterable[str] = [],
+    ) -> None:
+        """Add, replace and remove hooks, the store is replaced atomically.
+
+        Args:
+            hooks (dict[str, BasicHook], optional): The hooks by names. Defaults to {}.
+            remove (Iterable[str], optional): Names of the hooks to remove. Defaults to [].
+        """
+        with self._lock:
+            current = dict(self.load())
+            for name, hook in hooks.items():
+                current[name] = _configExport(hook.config)
+            for name in remove:
+                current.pop(name, None)
+
+            atomicWrite(self.saveLocation, json.dumps(
+                {"version": 1, "hooks": current}, indent=2), fsync=True, encoding="utf-8")
+            stat = self._stat()
+            if stat is not None:
+                self._cache[self.saveLocation] = (stat, current)
+
+    def set(
+        self,
+        name: str,
+        hook: BasicHook,
+    ) -> None:
+        self.update({name: hook})
+
+    def remove(
+        self,
+        name: str,
+    ) -> None:
+        self.update(remove=[name])
@@ -0,0 +1,265 @@
+import re
+from concurrent.futures import Executor, ThreadPoolExecutor, Future
+from typing import Optional, Callable, Iterable, Literal, Union, Any
+
+from ..hoshi import Hoshi
+from .basic import BasicHook
+from .dispatcher import BasicHookDispatcher
+
+_headingPattern = re.compile(r"^ (#{1,6}) (.*)$")
+_dividerPattern = re.compile(r"^-+$")
+
+
+def chunkLines(
+    lines: Iterable[str],
+    maxLength: int = 2000,
+    prefix: str = '',
+    suffix: str = '',
+) -> list[str]:
+    """Join lines into chunks, each chunk with prefix and suffix is not longer than `maxLength`.
+
+    Args:
+        lines (Iterable[str]): The lines.
+        maxLength (int, optional): Max length of chunk. Defaults to 2000.
+        prefix (str, optional): The text before each chunk. Defaults to ''.
+        suffix (str, optional): The text after each chunk. Defaults to ''.
+
+    Returns:
+        list[str]: The chunks.
+    """
+    room = maxLength - len(prefix) - len(suffix)
+    if room < 1:
+        raise ValueError(
+            f"'maxLength' {maxLength} is too short for prefix and suffix.")
+
+    chunks = []
+    current = []
+    currentLength = -1
+    for line in lines:
+        while len(line) > room:
+            if len(current) > 0:
+                chunks.append(current)
+                current, currentLength = [], -1
+            chunks.append([line[:room]])
+            line = line[room:]
+            if len(line) == 0:
+                break
+        else:
+            if currentLength + 1 + len(line) > room:
+                chunks.append(current)
+                current, currentLength = [], -1
+            current.append(line)
+            currentLength += 1 + len(line)
+    if len(current) > 0:
+        chunks.append(current)
+
+    return [prefix+'\n'.join(chunk)+suffix for chunk in chunks]
+
+
+def renderContent(
+    hoshi: Hoshi,
+    maxLength: int = 2000,
+    codeBlock: bool = True,
+) -> list[dict[str, Any]]:
+    """Render a :cls:`Hoshi` as message payloads with `content`.
+
+    Args:
+        hoshi (Hoshi): The report.
+        maxLength (int, optional): Max length of `content`. Defaults to 2000.
+        codeBlock (bool, optional): Whether to wrap each message in a code block. Defaults to True.
+
+    Returns:
+        list[dict[str, Any]]: The payloads.
+    """
+    chunks = chunkLines(
+        hoshi.lines,
+        maxLength=maxLength,
+        prefix='```\n' if codeBlock else '',
+        suffix='\n```' if codeBlock else '',
+    )
+    return [{'content': chunk} for chunk in chunks]
+
+
+def renderEmbeds(
+    hoshi: Hoshi,
+    title: Optional[str] = None,
+    color: Optional[int] = None,
+    maxFields: int = 25,
+    maxFieldNameLength: int = 256,
+    maxFieldLength: int = 1024,
+    maxEmbedLength: int = 6000,
+    maxEmbeds: int = 10,
+    maxMessageLength: int = 6000,
+) -> list[dict[str, Any]]:
+    """Render a :cls:`Hoshi` as message payloads with `embeds`.
+
+    Each heading of the report starts a field, the following lines become its value.
+
+    Args:
+        hoshi (Hoshi): The report.
+        title (Optional[str], optional): Title of embeds. Defaults to None as the name of report.
+        color (Optional[int], optional): Color of embeds. Defaults to None.
+        maxFields (int, optional): Max number of fields per embed. Defaults to 25.
+        maxFieldNameLength (int, optional): Max length of field name. Defaults to 256.
+        maxFieldLength (int, optional): Max length of field value. Defaults to 1024.
+        maxEmbedLength (int, optional): Max total characters per embed. Defaults to 6000.
+        maxEmbeds (int, optional): Max number of embeds per message. Defaults to 10.
+        maxMessageLength (int, optional): Max total characters of all embeds in a message. Defaults to 6000.
+
+    Returns:
+        list[dict[str, Any]]: The payloads.
+    """
+    title = hoshi.__name__ if title is None else title
+    title = title[:maxFieldNameLength]
+
+    sections: list[tuple[str, list[str]]] = []
+    for line in hoshi.lines:
+        heading = _headingPattern.match(line)
+        if heading:
+            sections.append((heading.group(2), []))
+        elif _dividerPattern.match(line):
+            continue
+        else:
+            if len(sections) == 0:
+                sections.append(('\u200b', []))
+            sections[-1][1].append(line)
+
+    fields = []
+    for name, lines in sections:
+        name = name[:maxFieldNameLength]
+        values = chunkLines(
+            lines, maxLength=maxFieldLength, prefix='```\n', suffix='\n```'
+        ) if len(lines) > 0 else ['\u200b']
+        for i, value in enumerate(values):
+            fields.append({
+                'name': name if i == 0 else '\u200b',
+                'value': value,
+                'inline': False,
+            })
+
+    maxEmbedLength = min(maxEmbedLength, maxMessageLength)
+    embeds = []
+    current = None
+    for field in fields:
+        fieldLength = len(field['name']) + len(field['value'])
+        if (
+            current is None or
+            len(current['fields']) >= maxFields or
+            current['_length'] + fieldLength > maxEmbedLength
+        ):
+            current = {'title': title, 'fields': [], '_length': len(title)}
+            if color is not None:
+                current['color'] = color
+            embeds.append(current)
+        current['fields'].append(field)
+        current['_length'] += fieldLength
+
+    # the limit of length is also for the total of embeds in a message.
+    payloads = []
+    messageLength = 0
+    for embed in embeds:
+        embedLength = embed.pop('_length')
+        if (
+            len(payloads) == 0 or
+            len(payloads[-1]['embeds']) >= maxEmbeds or
+            messageLength + embedLength > maxMessageLength
+        ):
+            payloads.append({'embeds': []})
+            messageLength = 0
+        payloads[-1]['embeds'].append(embed)
+        messageLength += embedLength
+
+    return payloads
+
+
+class HoshiBridge(object):
+    """Render :cls:`Hoshi` reports and post them to a webhook in background.
+
+    The producer only pays one enqueue for each report, the rendering reuses
+    the cached lines of the report. The report should not be changed until
+    the returned future is done.
+
+    >>> bridge = HoshiBridge(BasicHook(url), render='embeds')
+    >>> bridge.post(report)
+    >>> bridge.close()
+
+    """
+    __version__ = (0, 1, 0)
+
+    def __init__(
+        self,
+        hook: Union[BasicHook, BasicHookDispatcher],
+        render: Union[
+            Literal['content', 'embeds'],
+            Callable[[Hoshi], list[dict[str, Any]]]
+        ] = 'content',
+        header: dict[str, str] = {},
+        executor: Optional[Executor] = None,
+        renderArgs: dict[str, Any] = {},
+        hide_print: bool = True,
+    ):
+        """Set the bridge.
+
+        Args:
+            hook (Union[BasicHook, BasicHookDispatcher]):
+                The webhook to post, or a dispatcher to enqueue the payloads.
+            render (Union[Literal['content', 'embeds'], Callable], optional):
+                How to render reports. Defaults to 'content'.
+            header (dict[str, str], optional): The header of webhook. Defaults to {}.
+            executor (Optional[Executor], optional):
+                The executor to render and post. Defaults to None as a single thread owned by the bridge.
+            renderArgs (dict[str, Any], optional): The other arguments for rendering. Defaults to {}.
+            hide_print (bool, optional): Whether to mute the message of each sending. Defaults to True.
+        """
+
+        if render == 'content':
+            render = renderContent
+        elif render == 'embeds':
+            render = renderEmbeds
+        elif not callable(render):
+            raise ValueError(
+                f"Instead of '{render}', only 'content', 'embeds' or a callable can be used.")
+
+        self.hook = hook
+        self.render = render
+        self.header = header
+        self.renderArgs = renderArgs
+        self.hide_print = hide_print
+
+        self._ownExecutor = executor is None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='HoshiBridge'
+        ) if executor is None else executor
+
+    def _send(self, hoshi: Hoshi) -> list:
+        payloads = self.render(hoshi, **self.renderArgs)
+        if isinstance(self.hook, BasicHookDispatcher):
+            for payload in payloads:
+                self.hook.post(payload, self.header)
+            return []
+
+        return [
+            self.hook.post(payload, self.header, hide_print=self.hide_print)
+            for payload in payloads
+        ]
+
+    def post(self, hoshi: Hoshi) -> Future:
+        """Enqueue a report to render and post.
+
+        Args:
+            hoshi (Hoshi): The report.
+
+        Returns:
+            Future: The responses of posting, or an empty list for a dispatcher.
+        """
+        return self._executor.submit(self._send, hoshi)
+
+    def close(self, wait: bool = True) -> None:
+        if self._ownExecutor:
+            self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,357 @@
+import requests
+import threading
+import time
+from typing import Optional, Iterable, Literal, Union, Any
+from pathlib import Path
+
+from ..hoshi import Hoshi
+from .basic import BasicHook
+from .bridge import renderContent, renderEmbeds
+
+# Limits of a Discord message,
+# https://discord.com/developers/docs/resources/channel#embed-object-embed-limits
+DISCORD_LIMITS = {
+    'content': 2000,
+    'embeds': 10,
+    'title': 256,
+    'description': 4096,
+    'fields': 25,
+    'field_name': 256,
+    'field_value': 1024,
+    'footer': 2048,
+    'author': 256,
+    'embed_total': 6000,
+}
+
+
+def _cut(text: Optional[str], limit: int) -> Optional[str]:
+    if text is None:
+        return None
+    text = str(text)
+    return text if len(text) <= limit else text[:limit-3]+'...'
+
+
+def embedLength(embed: dict[str, Any]) -> int:
+    """The characters of an embed counted by the limit `embed_total` of Discord."""
+    length = len(embed.get('title', '')) + len(embed.get('description', ''))
+    length += len(embed.get('footer', {}).get('text', ''))
+    length += len(embed.get('author', {}).get('name', ''))
+    for field in embed.get('fields', []):
+        length += len(field['name']) + len(field['value'])
+    return length
+
+
+class DiscordHook(BasicHook):
+    """A Discord webhook.
+
+    All messages are sent through one pooled connection and paced by the
+    rate limit headers of Discord, a `429` response is waited and retried.
+
+    >>> hook = DiscordHook(url, username='Job runner')
+    >>> hook.send(hook.message('Job 1 done.'))
+    >>> hook.send_hoshi(report)
+
+    """
+    __version__ = (0, 1, 0)
+
+    def __init__(
+        self,
+        url: str,
+        saveLocation: Path | str | None = None,
+        username: Optional[str] = None,
+        avatar_url: Optional[str] = None,
+        maxRetries: int = 5,
+        timeout: float = 10.0,
+    ):
+        super().__init__(url=url, saveLocation=saveLocation)
+        self.username = username
+        self.avatar_url = avatar_url
+        self.maxRetries = maxRetries
+        self.timeout = timeout
+
+        self._session = requests.Session()
+        self._lock = threading.Lock()
+        self._remaining: Optional[int] = None
+        self._resetAt = 0.0
+        self._globalResetAt = 0.0
+
+    @staticmethod
+    def embed(
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        fields: Iterable[Union[tuple[str, Any], tuple[str, Any, bool], dict[str, Any]]] = [],
+        color: Optional[int] = None,
+        url: Optional[str] = None,
+        footer: Optional[str] = None,
+        timestamp: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Build an embed, the texts are cut to the limits of Discord.
+
+        Args:
+            title (Optional[str], optional): Title. Defaults to None.
+            description (Optional[str], optional): Description. Defaults to None.
+            fields (Iterable, optional):
+                Fields as `(name, value)`, `(name, value, inline)` or dicts. Defaults to [].
+            color (Optional[int], optional): Color as integer. Defaults to None.
+            url (Optional[str], optional): Link of title. Defaults to None.
+            footer (Optional[str], optional): Footer text. Defaults to None.
+            timestamp (Optional[str], optional): ISO8601 timestamp. Defaults to None.
+
+        Returns:
+            dict[str, Any]: The embed.
+        """
+        embed = {}
+        if title is not None:
+            embed['title'] = _cut(title, DISCORD_LIMITS['title'])
+        if description is not None:
+            embed['description'] = _cut(
+                description, DISCORD_LIMITS['description'])
+        if url is not None:
+            embed['url'] = url
+        if color is not None:
+            embed['color'] = color
+        if footer is not None:
+            embed['footer'] = {'text': _cut(footer, DISCORD_LIMITS['footer'])}
+        if timestamp is not None:
+            embed['timestamp'] = timestamp
+
+        embedFields = []
+        for field in fields:
+            if isinstance(field, dict):
+                name, value = field['name'], field['value']
+                inline = field.get('inline', False)
+            else:
+                name, value = field[0], field[1]
+                inline = field[2] if len(field) > 2 else False
+            embedFields.append({
+                'name': _cut(name, DISCORD_LIMITS['field_name']),
+                'value': _cut(value, DISCORD_LIMITS['field_value']),
+                'inline': inline,
+            })
+        if len(embedFields) > DISCORD_LIMITS['fields']:
+            raise ValueError(
+                f"An embed can only have {DISCORD_LIMITS['fields']} fields.")
+        if len(embedFields) > 0:
+            embed['fields'] = embedFields
+
+        return embed
+
+    def message(
+        self,
+        content: Optional[str] = None,
+        embeds: Iterable[dict[str, Any]] = [],
+        username: Optional[str] = None,
+        avatar_url: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Build a message payload.
+
+        Args:
+            content (Optional[str], optional): The text. Defaults to None.
+            embeds (Iterable[dict[str, Any]], optional): The embeds. Defaults to [].
+            username (Optional[str], optional): Name of sender. Defaults to None as :attr:`username`.
+            avatar_url (Optional[str], optional): Avatar of sender. Defaults to None as :attr:`avatar_url`.
+
+        Raises:
+            ValueError: When the message is empty or over the limits of Discord.
+
+        Returns:
+            dict[str, Any]: The payload.
+        """
+        payload = {}
+        if content is not None:
+            if len(content) > DISCORD_LIMITS['content']:
+                raise ValueError(
+                    f"The content is longer than {DISCORD_LIMITS['content']}.")
+            payload['content'] = content
+        embeds = list(embeds)
+        if len(embeds) > DISCORD_LIMITS['embeds']:
+            raise ValueError(
+                f"A message can only have {DISCORD_LIMITS['embeds']} embeds.")
+        if sum(embedLength(embed) for embed in embeds) > DISCORD_LIMITS['embed_total']:
+            raise ValueError(
+                f"The embeds of a message are longer than {DISCORD_LIMITS['embed_total']} in total.")
+        if len(embeds) > 0:
+            payload['embeds'] = embeds
+        if len(payload) == 0:
+            raise ValueError("A message needs content or embeds.")
+
+        return self._withSender(payload, username, avatar_url)
+
+    def _withSender(
+        self,
+        payload: dict[str, Any],
+        username: Optional[str] = None,
+        avatar_url: Optional[str] = None,
+    ) -> dict[str, Any]:
+        username = self.username if username is None else username
+        avatar_url = self.avatar_url if avatar_url is None else avatar_url
+        if username is not None and 'username' not in payload:
+            payload['username'] = username
+        if avatar_url is not None and 'avatar_url' not in payload:
+            payload['avatar_url'] = avatar_url
+        return payload
+
+    def _wait(self) -> None:
+        now = time.monotonic()
+        waitUntil = self._globalResetAt
+        if self._remaining == 0:
+            waitUntil = max(waitUntil, self._resetAt)
+        if waitUntil > now:
+            time.sleep(waitUntil - now)
+
+    def _track(self, result: requests.Response) -> None:
+        headers = result.headers
+        now = time.monotonic()
+        remaining = headers.get('X-RateLimit-Remaining', None)
+        resetAfter = headers.get('X-RateLimit-Reset-After', None)
+        if remaining is not None:
+            self._remaining = int(remaining)
+        if resetAfter is not None:
+            self._resetAt = now + float(resetAfter)
+
+        if result.status_code == 429:
+            try:
+                body = result.json()
+            except ValueError:
+                body = {}
+            retryAfter = float(body.get(
+                'retry_after', headers.get('Retry-After', resetAfter or 1)))
+            if body.get('global', False) or headers.get('X-RateLimit-Global', '').lower() == 'true':
+                self._globalResetAt = now + retryAfter
+            else:
+                self._remaining = 0
+                self._resetAt = max(self._resetAt, now + retryAfter)
+
+    def send(
+        self,
+        payload: dict[str, Any],
+        wait: bool = False,
+        hide_print: bool = True,
+        header: dict[str, str] = {},
+        **kwargs,
+    ) -> requests.Response:
+        """Send a message, paced by the rate limit of Discord.
+
+        Args:
+            payload (dict[str, Any]): The payload from :meth:`message`.
+            wait (bool, optional): Whether Discord returns the created message. Defaults to False.
+            hide_print (bool, optional): Whether to mute the message of each sending. Defaults to True.
+            header (dict[str, str], optional): The header of webhook. Defaults to {}.
+            kwargs: The other arguments for :meth:`requests.Session.post`, like `timeout` or `proxies`.
+
+        Returns:
+            requests.Response: The last response.
+        """
+        payload = self._withSender({**payload})
+        params = {'wait': 'true'} if wait else None
+        requestArgs = {'timeout': self.timeout, **kwargs}
+
+        with self._lock:
+            for attempt in range(self.maxRetries+1):
+                self._wait()
+                result = self._session.post(
+                    self.config.url,
+                    json=payload,
+                    params=params,
+                    headers=header,
+                    **requestArgs,
+                )
+                self._track(result)
+                if result.status_code != 429:
+                    break
+
+        if 200 <= result.status_code < 300:
+            if not hide_print:
+                print(f"Webhook sent {result.status_code}")
+        else:
+            print(
+                f"Not sent with {result.status_code}, response:\n{result.text}")
+        return result
+
+    def send_many(
+        self,
+        payloads: Iterable[dict[str, Any]],
+        wait: bool = False,
+        hide_print: bool = True,
+    ) -> list[requests.Response]:
+        """Send messages in order over the pooled connection.
+
+        Args:
+            payloads (Iterable[dict[str, Any]]): The payloads.
+            wait (bool, optional): Whether Discord returns the created messages. Defaults to False.
+            hide_print (bool, optional): Whether to mute the message of each sending. Defaults to True.
+
+        Returns:
+            list[requests.Response]: The responses.
+        """
+        return [
+            self.send(payload, wait=wait, hide_print=hide_print)
+            for payload in payloads
+        ]
+
+    def render_hoshi(
+        self,
+        hoshi: Hoshi,
+        render: Literal['content', 'embeds'] = 'embeds',
+        **renderArgs,
+    ) -> list[dict[str, Any]]:
+        """Split a :cls:`Hoshi` report into payloads under the limits of Discord.
+
+        Args:
+            hoshi (Hoshi): The report.
+            render (Literal['content', 'embeds'], optional): As text or embeds. Defaults to 'embeds'.
+
+        Returns:
+            list[dict[str, Any]]: The payloads.
+        """
+        if render == 'content':
+            return renderContent(
+                hoshi,
+                **{'maxLength': DISCORD_LIMITS['content'], **renderArgs})
+        elif render == 'embeds':
+            return renderEmbeds(hoshi, **{
+                'maxFields': DISCORD_LIMITS['fields'],
+                'maxFieldNameLength': DISCORD_LIMITS['field_name'],
+                'maxFieldLength': DISCORD_LIMITS['field_value'],
+                'maxEmbedLength': DISCORD_LIMITS['embed_total'],
+                'maxEmbeds': DISCORD_LIMITS['embeds'],
+                'maxMessageLength': DISCORD_LIMITS['embed_total'],
+                **renderArgs,
+            })
+        else:
+            raise ValueError(
+                f"Instead of '{render}', only 'content' or 'embeds' can be used.")
+
+    def send_hoshi(
+        self,
+        hoshi: Hoshi,
+        render: Literal['content', 'embeds'] = 'embeds',
+        hide_print: bool = True,
+        **renderArgs,
+    ) -> list[requests.Response]:
+        """Send a :cls:`Hoshi` report, split into as many messages as needed.
+
+        Args:
+            hoshi (Hoshi): The report.
+            render (Literal['content', 'embeds'], optional): As text or embeds. Defaults to 'embeds'.
+            hide_print (bool, optional): Whether to mute the message of each sending. Defaults to True.
+
+        Returns:
+            list[requests.Response]: The responses.
+        """
+        return self.send_many(
+            self.render_hoshi(hoshi, render=render, **renderArgs),
+            hide_print=hide_print,
+        )
+
+    def post(
+        self,
+        content: dict[str, str],
+        header: dict[str, str] = {},
+        hide_print: bool = False,
+        **kwargs,
+    ) -> requests.Response:
+        return self.send(content, hide_print=hide_print, header=header, **kwargs)
+
+    def close(self) -> None:
+        self._session.close()
@@ -0,0 +1,405 @@
+import requests
+import threading
+import queue
+import random
+import time
+import json
+import os
+from typing import Optional, Callable, Iterable, NamedTuple, Any
+from pathlib import Path
+
+from .basic import BasicHook
+
+
+class DispatcherStats(NamedTuple):
+    enqueued: int = 0
+    sent: int = 0
+    coalesced: int = 0
+    retried: int = 0
+    spooled: int = 0
+    dropped: int = 0
+
+
+def coalesceContent(
+    contents: list[dict[str, Any]],
+    maxContentLength: int = 2000,
+    maxEmbeds: int = 10,
+) -> list[dict[str, Any]]:
+    """Merge several webhook payloads into as few payloads as possible.
+
+    The text of `content` is joined by newlines and `embeds` are concatenated,
+    every other key has to be equal for two payloads to be merged.
+
+    Args:
+        contents (list[dict[str, Any]]): Payloads in sending order.
+        maxContentLength (int, optional): Max length of merged `content`. Defaults to 2000.
+        maxEmbeds (int, optional): Max number of merged `embeds`. Defaults to 10.
+
+    Returns:
+        list[dict[str, Any]]: Merged payloads in sending order.
+    """
+
+    merged = []
+    current = None
+    currentOthers = None
+    for content in contents:
+        others = {k: v for k, v in content.items()
+                  if k not in ('content', 'embeds')}
+        text = content.get('content', None)
+        embeds = content.get('embeds', [])
+
+        if current is not None and others == currentOthers:
+            newText = current.get('content', None)
+            if text is not None:
+                newText = text if newText is None else newText+'\n'+text
+            newEmbeds = current.get('embeds', []) + list(embeds)
+            if (
+                (newText is None or len(newText) <= maxContentLength) and
+                len(newEmbeds) <= maxEmbeds
+            ):
+                if newText is not None:
+                    current['content'] = newText
+                if len(newEmbeds) > 0:
+                    current['embeds'] = newEmbeds
+                continue
+
+        current = {**content}
+        if 'embeds' in current:
+            current['embeds'] = list(current['embeds'])
+        currentOthers = others
+        merged.append(current)
+
+    return merged
+
+
+class BasicHookDispatcher(object):
+    """Send webhooks of :cls:`BasicHook` from a background thread.
+
+    Messages posted within `window` seconds are coalesced into one payload,
+    the rate limit responses `429` are retried after `Retry-After` with
+    exponential backoff and jitter. Messages which are still not delivered
+    are appended to `spoolLocation` and sent again by the next dispatcher,
+    they are removed from the spool only after they are handled.
+
+    >>> dispatcher = BasicHookDispatcher(BasicHook(url), spoolLocation='./hook.spool')
+    >>> dispatcher.post({'content': 'Job 1 done.'})
+    >>> dispatcher.close()
+
+    """
+
+    def __init__(
+        self,
+        hook: BasicHook,
+        window: float = 1.0,
+        maxRetries: int = 5,
+        backoffBase: float = 0.5,
+        backoffMax: float = 60.0,
+        spoolLocation: Optional[Path | str] = None,
+        coalesce: Callable[
+            [list[dict[str, Any]]], list[dict[str, Any]]
+        ] = coalesceContent,
+        timeout: float = 10.0,
+        hide_print: bool = True,
+    ):
+        """Start a dispatcher.
+
+        Args:
+            hook (BasicHook): The webhook to send.
+            window (float, optional): Seconds to collect messages for coalescing. Defaults to 1.0.
+            maxRetries (int, optional): Retries before a message is spooled. Defaults to 5.
+            backoffBase (float, optional): Base seconds of exponential backoff. Defaults to 0.5.
+            backoffMax (float, optional): Max seconds of exponential backoff. Defaults to 60.0.
+            spoolLocation (Optional[Path | str], optional):
+                The file keeping undelivered messages. Defaults to None as not spooling.
+            coalesce (Callable, optional): Merge payloads with same header. Defaults to :func:`coalesceContent`.
+            timeout (float, optional): Timeout of each request. Defaults to 10.0.
+            hide_print (bool, optional): Whether to mute the message of each sending. Defaults to True.
+        """
+
+        self.hook = hook
+        self.window = window
+        self.maxRetries = maxRetries
+        self.backoffBase = backoffBase
+        self.backoffMax = backoffMax
+        self.spoolLocation = (
+            None if spoolLocation is None else Path(spoolLocation))
+        self.coalesce = coalesce
+        self.timeout = timeout
+        self.hide_print = hide_print
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._session = requests.Session()
+        self._closed = threading.Event()
+        self._idle = threading.Condition()
+        self._pending = 0
+        self._stats = {k: 0 for k in DispatcherStats._fields}
+        self._statsLock = threading.Lock()
+        self._spoolLock = threading.Lock()
+        self._spoolHead: dict[int, str] = {}
+        self._spoolHeadLines = 0
+
+        for content, header, spoolId in self._spoolLoad():
+            self._enqueue(content, header, spoolId)
+
+        self._thread = threading.Thread(
+            target=self._run, name='BasicHookDispatcher', daemon=True)
+        self._thread.start()
+
+    @property
+    def stats(self) -> DispatcherStats:
+        with self._statsLock:
+            return DispatcherStats(**self._stats)
+
+    def _count(self, field: str, n: int = 1) -> None:
+        with self._statsLock:
+            self._stats[field] += n
+
+    def _enqueue(
+        self,
+        content: dict[str, Any],
+        header: dict[str, str],
+        spoolId: Optional[int] = None,
+    ) -> None:
+        with self._idle:
+            self._pending += 1
+        self._queue.put((content, header, spoolId))
+
+    def post(
+        self,
+        content: dict[str, Any],
+        header: dict[str, str] = {},
+    ) -> None:
+        """Enqueue a message, it will be sent by the background thread.
+
+        Args:
+            content (dict[str, Any]): The json content of webhook.
+            header (dict[str, str], optional): The header of webhook. Defaults to {}.
+        """
+        if self._closed.is_set():
+            raise RuntimeError("The dispatcher is already closed.")
+        self._enqueue(content, header)
+        self._count('enqueued')
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all enqueued messages are sent, spooled or dropped.
+
+        Args:
+            timeout (Optional[float], optional): Max seconds to wait. Defaults to None.
+
+        Returns:
+            bool: Whether all messages are handled.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Send the remaining messages and stop the background thread.
+
+        Args:
+            timeout (Optional[float], optional): Max seconds to wait. Defaults to None.
+        """
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.window
+            while True:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = (
+                        self._queue.get(timeout=remaining) if remaining > 0
+                        else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._dispatch(batch, retry=not stopping)
+
+        rest = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                rest.append(item)
+        if len(rest) > 0:
+            self._dispatch(rest, retry=False)
+
+    def _dispatch(
+        self,
+        batch: list[tuple[dict[str, Any], dict[str, str], Optional[int]]],
+        retry: bool = True,
+    ) -> None:
+        try:
+            groups: dict[str, tuple[dict[str, str], list[dict[str, Any]]]] = {}
+            for content, header, _ in batch:
+                key = json.dumps(header, sort_keys=True)
+                if key not in groups:
+                    groups[key] = (header, [])
+                groups[key][1].append(content)
+
+            for header, contents in groups.values():
+                payloads = self.coalesce(contents)
+                self._count('coalesced', len(contents) - len(payloads))
+                for i, payload in enumerate(payloads):
+                    if not self._deliver(payload, header, retry=retry):
+                        self._spool(payloads[i:], header)
+                        break
+            # the spooled messages of this batch are delivered, dropped or spooled again.
+            self._spoolResolve(
+                spoolId for _, _, spoolId in batch if spoolId is not None)
+        except Exception as e:
+            print(f"Dispatching {len(batch)} webhook messages failed with {type(e).__name__}: {e}")
+        finally:
+            with self._idle:
+                self._pending -= len(batch)
+                self._idle.notify_all()
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(
+            0, min(self.backoffMax, self.backoffBase * 2**attempt))
+
+    def _deliver(
+        self,
+        payload: dict[str, Any],
+        header: dict[str, str],
+        retry: bool = True,
+    ) -> bool:
+        maxRetries = self.maxRetries if retry else 0
+        for attempt in range(maxRetries+1):
+            wait = None
+            try:
+                result = self._session.post(
+                    self.hook.config.url,
+                    json=payload,
+                    headers=header,
+                    timeout=self.timeout,
+                )
+            except requests.RequestException as e:
+                print(f"Not sent with {type(e).__name__}: {e}")
+                wait = self._backoff(attempt)
+            else:
+                if 200 <= result.status_code < 300:
+                    if not self.hide_print:
+                        print(f"Webhook sent {result.status_code}")
+                    self._count('sent')
+                    return True
+                elif result.status_code == 429:
+                    wait = _retryAfter(result) + self._backoff(attempt)
+                elif result.status_code >= 500:
+                    wait = self._backoff(attempt)
+                else:
+                    print(
+                        f"Not sent with {result.status_code}, response:\n{result.text}")
+                    self._count('dropped')
+                    return True
+
+            if attempt < maxRetries:
+                self._count('retried')
+                if self._closed.wait(wait) and retry:
+                    # closing, leave the rest for the spool.
+                    return False
+        return False
+
+    def _spool(
+        self,
+        payloads: Iterable[dict[str, Any]],
+        header: dict[str, str],
+    ) -> None:
+        payloads = list(payloads)
+        if self.spoolLocation is None:
+            print(f"{len(payloads)} webhook messages are dropped.")
+            self._count('dropped', len(payloads))
+            return
+
+        with self._spoolLock:
+            with open(self.spoolLocation, 'a', encoding='utf-8') as File:
+                for payload in payloads:
+                    File.write(json.dumps(
+                        {'content': payload, 'header': header},
+                        ensure_ascii=False)+'\n')
+                File.flush()
+                os.fsync(File.fileno())
+        self._count('spooled', len(payloads))
+
+    def _spoolLoad(self) -> list[tuple[dict[str, Any], dict[str, str], int]]:
+        """Read the spool, which is kept until its messages are handled by :meth:`_spoolResolve`."""
+        if self.spoolLocation is None or not self.spoolLocation.exists():
+            return []
+
+        spooled = []
+        with self._spoolLock:
+            with open(self.spoolLocation, 'r', encoding='utf-8') as File:
+                lines = File.read().splitlines()
+            for spoolId, line in enumerate(lines):
+                if line.strip() == '':
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._spoolHead[spoolId] = line
+                spooled.append((record['content'], record['header'], spoolId))
+            self._spoolHeadLines = len(lines)
+        return spooled
+
+    def _spoolResolve(self, spoolIds: Iterable[int]) -> None:
+        """Remove the handled messages read by :meth:`_spoolLoad` from the spool,
+        the messages appended by :meth:`_spool` since then are kept."""
+        spoolIds = set(spoolIds)
+        if len(spoolIds) == 0:
+            return
+
+        with self._spoolLock:
+            with open(self.spoolLocation, 'r', encoding='utf-8') as File:
+                appended = File.read().splitlines()[self._spoolHeadLines:]
+            for spoolId in spoolIds:
+                self._spoolHead.pop(spoolId, None)
+            lines = list(self._spoolHead.values()) + appended
+
+            if len(lines) == 0:
+                os.remove(self.spoolLocation)
+            else:
+                tmpLocation = self.spoolLocation.with_name(
+                    f".{self.spoolLocation.name}.tmp")
+                with open(tmpLocation, 'w', encoding='utf-8') as File:
+                    File.write('\n'.join(lines)+'\n')
+                    File.flush()
+                    os.fsync(File.fileno())
+                os.replace(tmpLocation, self.spoolLocation)
+            # the messages not handled yet are the first lines now.
+            self._spoolHeadLines = len(self._spoolHead)
+
+
+def _retryAfter(result: requests.Response) -> float:
+    """Seconds to wait from a rate limited response."""
+    retryAfter = result.headers.get('Retry-After', None)
+    if retryAfter is not None:
+        try:
+            return float(retryAfter)
+        except ValueError:
+            ...
+    try:
+        return float(result.json().get('retry_after', 0))
+    except (ValueError, AttributeError):
+        return 0.0
@@ -1,6 +1,8 @@
 import json
 import os
-from typing import Hashable, Union, Iterable, Any
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Hashable, Optional, Union, Iterable, Any
 from collections import OrderedDict
 from pathlib import Path
 
@@ -44,16 +46,34 @@ def keyParse(k: Any) -> Union[str, int, float, bool, None]:
     return parsed
 
 
-def Parse(o: Any) -> Any:
+def Parse(
+    o: Any,
+    workers: Optional[int] = None,
+    minChunk: int = 50000,
+) -> Any:
     """Make a python object json-allowable.
 
     Args:
         o (any): Python object.
+        workers (Optional[int], optional):
+            The number of processes converting the chunks of a top-level list, tuple or dict,
+            which are merged in order, at most the number of CPUs available. The result is
+            the same as converting in this process, the values taken by their `__str__` are
+            converted in this process, so do the chunks which can not be pickled.
+            Defaults to None as converting in this process.
+        minChunk (int, optional):
+            The least number of top-level entries for each process, a smaller container
+            is converted in this process. Defaults to 50000.
 
     Returns:
         any: Json-allowable python object.
     """
 
+    if workers is not None and workers > 1 and isinstance(o, (list, tuple, dict)):
+        workers = min(workers, _availableCPUs())
+        if workers > 1 and len(o) >= 2 * minChunk:
+            return _parallelParse(o, workers, minChunk)
+
     if isinstance(o, list):
         parsed = [Parse(v) for v in o]
     elif isinstance(o, tuple):
@@ -66,6 +86,88 @@ def Parse(o: Any) -> Any:
     return parsed
 
 
+def _availableCPUs() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+class _NotPlain(Exception):
+    """A value needs its `__str__` to be json-allowable."""
+
+
+def _plainParse(o: Any) -> Any:
+    """The same as :func:`Parse`, but raises :cls:`_NotPlain` instead of taking `__str__`,
+    which may depend on the identity of object and differ in another process."""
+    if isinstance(o, (list, tuple)):
+        return [_plainParse(v) for v in o]
+    elif isinstance(o, dict):
+        parsed = {}
+        for k, v in o.items():
+            if not isinstance(k, (str, int, float, bool)) and k != None:
+                raise _NotPlain
+            parsed[k] = _plainParse(v)
+        return parsed
+    elif isinstance(o, (str, int, float, bool)) or o is None:
+        return o
+    raise _NotPlain
+
+
+def _parseChunk(payload: bytes) -> tuple[list, list[int]]:
+    """Convert a pickled chunk of values, the values which are not plain are left as None,
+    with their indices to be converted by the caller."""
+    parsed = []
+    notPlain = []
+    for i, v in enumerate(pickle.loads(payload)):
+        try:
+            parsed.append(_plainParse(v))
+        except _NotPlain:
+            parsed.append(None)
+            notPlain.append(i)
+    return parsed, notPlain
+
+
+def _parallelParse(
+    o: Union[list, tuple, dict],
+    workers: int,
+    minChunk: int,
+) -> Union[list, dict]:
+    """Convert the chunks of top-level values in a process pool, which is the same as :func:`Parse`.
+
+    The keys of top-level dict and the values which need `__str__` are converted
+    in this process, so do the chunks which can not be pickled.
+    """
+    values = list(o.values()) if isinstance(o, dict) else o
+    chunkNum = max(1, min(workers * 4, len(values) // max(minChunk, 1)))
+    step = -(-len(values) // chunkNum)
+    chunks = [values[i:i+step] for i in range(0, len(values), step)]
+
+    payloads: list[Optional[bytes]] = []
+    for chunk in chunks:
+        try:
+            payloads.append(pickle.dumps(chunk, protocol=pickle.HIGHEST_PROTOCOL))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            payloads.append(None)
+
+    toPool = [payload for payload in payloads if payload is not None]
+    with ProcessPoolExecutor(max_workers=max(1, min(workers, len(toPool)))) as executor:
+        pooled = iter(executor.map(_parseChunk, toPool))
+        parsed = []
+        for chunk, payload in zip(chunks, payloads):
+            if payload is None:
+                parsed.extend(Parse(v) for v in chunk)
+                continue
+            result, notPlain = next(pooled)
+            for i in notPlain:
+                result[i] = Parse(chunk[i])
+            parsed.extend(result)
+
+    if isinstance(o, dict):
+        return {keyParse(k): v for k, v in zip(o.keys(), parsed)}
+    return parsed
+
+
 def sortHashableAhead(o: dict) -> dict:
     """Make hashable values be the ahead in dictionary."
 
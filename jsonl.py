@@ -0,0 +1,302 @@
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from pathlib import Path
+from typing import Optional, Union, Iterable, Iterator, TextIO, Any
+import threading
+import atexit
+import time
+import json
+import os
+
+from .jsonablize import Parse
+
+_encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+
+class JSONLWriter:
+    """Append records as compact json lines to a file which is kept open.
+
+    The lines are written into a buffered handle, and flushed together
+    when `flushEvery` records are waiting, or by a daemon thread shared by
+    the writers when the records waited for `flushInterval` seconds. The
+    writers are flushed and closed at the exit of interpreter.
+
+    >>> writer = JSONLWriter.at('./results/events.jsonl')
+    >>> for event in events:
+    ...     writer.append(event)
+    >>> writer.flush()
+
+    """
+    __version__ = (0, 1, 0)
+
+    _writers: dict[str, "JSONLWriter"] = {}
+    _writersLock = threading.Lock()
+    # held by `at` across finding and opening a writer, so a file is opened once.
+    _openLock = threading.Lock()
+    _flusher: Optional[threading.Thread] = None
+
+    def __init__(
+        self,
+        target: Union[Path, str],
+        encoding: str = 'utf-8',
+        flushEvery: int = 1000,
+        flushInterval: Optional[float] = 1.0,
+        fsync: bool = False,
+        bufferSize: int = 1 << 16,
+    ) -> None:
+        """Open the file for appending.
+
+        Args:
+            target (Union[Path, str]): The file.
+            encoding (str, optional): Encoding method. Defaults to 'utf-8'.
+            flushEvery (int, optional): Flush after this number of records. Defaults to 1000.
+            flushInterval (Optional[float], optional):
+                Flush the records waiting for this number of seconds, even when nothing
+                is appended since. Defaults to 1.0, None for only by `flushEvery`.
+            fsync (bool, optional): Whether each flush also syncs the file to disk. Defaults to False.
+            bufferSize (int, optional): The buffer size of file. Defaults to 1 << 16.
+        """
+        if flushEvery < 1:
+            raise ValueError("'flushEvery' needs to be positive.")
+
+        self.target = Path(os.path.abspath(target))
+        if not os.path.exists(self.target.parent):
+            os.makedirs(self.target.parent, exist_ok=True)
+        self.encoding = encoding
+        self.flushEvery = flushEvery
+        self.flushInterval = flushInterval
+        self.fsync = fsync
+
+        self._File: Optional[TextIO] = open(
+            self.target, 'a', encoding=encoding, buffering=bufferSize)
+        self._pending = 0
+        self._lastFlush = time.monotonic()
+        self._lock = threading.Lock()
+
+        with self._writersLock:
+            self._writers[str(self.target)] = self
+            if flushInterval is not None and (
+                self._flusher is None or not self._flusher.is_alive()
+            ):
+                type(self)._flusher = threading.Thread(
+                    target=type(self)._flushLoop, name='JSONLWriterFlusher', daemon=True)
+                self._flusher.start()
+
+    @classmethod
+    def _flushLoop(cls) -> None:
+        """Flush the records waiting longer than `flushInterval`,
+        until no writer has `flushInterval`."""
+        while True:
+            with cls._writersLock:
+                writers = [
+                    w for w in cls._writers.values() if w.flushInterval is not None]
+                if len(writers) == 0:
+                    cls._flusher = None
+                    return
+
+            now = time.monotonic()
+            wait = min(w.flushInterval for w in writers)
+            for writer in writers:
+                with writer._lock:
+                    if writer._File is None or writer._pending == 0:
+                        continue
+                    due = writer._lastFlush + writer.flushInterval - now
+                    if due > 0:
+                        wait = min(wait, due)
+                        continue
+                    try:
+                        writer._flush()
+                    except OSError as e:
+                        print(f"Flushing '{writer.target}' failed with {type(e).__name__}: {e}")
+            time.sleep(max(wait, 0.001))
+
+    @classmethod
+    def at(
+        cls,
+        target: Union[Path, str],
+        **writerArgs,
+    ) -> "JSONLWriter":
+        """The writer of a file, opened once for each process,
+        the arguments are only used when it is opened.
+
+        Args:
+            target (Union[Path, str]): The file.
+
+        Returns:
+            JSONLWriter: The writer.
+        """
+        key = os.path.abspath(target)
+        with cls._openLock:
+            with cls._writersLock:
+                writer = cls._writers.get(key, None)
+            if writer is None or writer.closed:
+                writer = cls(key, **writerArgs)
+        return writer
+
+    @property
+    def closed(self) -> bool:
+        return self._File is None
+
+    def append(
+        self,
+        record: Any,
+        jsonablize: bool = False,
+    ) -> None:
+        """Append a record as a line.
+
+        Args:
+            record (Any): The record.
+            jsonablize (bool, optional): Whether to transpile all object to jsonable via :func:`mori.jsonablize`. Defaults to False.
+        """
+        line = _encoder.encode(Parse(record) if jsonablize else record)
+        with self._lock:
+            if self._File is None:
+                raise ValueError(f"The writer of '{self.target}' is already closed.")
+            self._File.write(line + '\n')
+            self._pending += 1
+            # the same as `_flushIfDue`, inlined since it is called for each record.
+            if self._pending >= self.flushEvery or (
+                self.flushInterval is not None and
+                time.monotonic() - self._lastFlush >= self.flushInterval
+            ):
+                self._flush()
+
+    def extend(
+        self,
+        records: Iterable[Any],
+        jsonablize: bool = False,
+    ) -> None:
+        """Append records as lines, which are encoded before written at once.
+
+        Args:
+            records (Iterable[Any]): The records.
+            jsonablize (bool, optional): Whether to transpile all object to jsonable via :func:`mori.jsonablize`. Defaults to False.
+        """
+        lines = [
+            _encoder.encode(Parse(record) if jsonablize else record) + '\n'
+            for record in records]
+        with self._lock:
+            if self._File is None:
+                raise ValueError(f"The writer of '{self.target}' is already closed.")
+            self._File.write(''.join(lines))
+            self._pending += len(lines)
+            self._flushIfDue()
+
+    def _flushIfDue(self) -> None:
+        if self._pending >= self.flushEvery or (
+            self.flushInterval is not None and
+            time.monotonic() - self._lastFlush >= self.flushInterval
+        ):
+            self._flush()
+
+    def _flush(self) -> None:
+        self._File.flush()
+        if self.fsync:
+            os.fsync(self._File.fileno())
+        self._pending = 0
+        self._lastFlush = time.monotonic()
+
+    def flush(self) -> None:
+        """Write the records waiting in buffer into the file."""
+        with self._lock:
+            if self._File is not None:
+                self._flush()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        with self._lock:
+            if self._File is None:
+                return
+            self._flush()
+            self._File.close()
+            self._File = None
+        with self._writersLock:
+            if self._writers.get(str(self.target), None) is self:
+                del self._writers[str(self.target)]
+
+    @classmethod
+    def closeAll(cls) -> None:
+        """Flush and close all writers in this process."""
+        with cls._writersLock:
+            writers = list(cls._writers.values())
+        for writer in writers:
+            writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+atexit.register(JSONLWriter.closeAll)
+
+
+def _decodeLines(chunk: bytes, encoding: str) -> list:
+    """Decode the lines of a chunk as one json array, which is much faster than
+    decoding each line. A chunk with blank lines, a broken record, or a record
+    across lines which makes the number of records differ from the number of lines,
+    is decoded line by line, so the error points to the record."""
+    text = chunk.decode(encoding).rstrip()
+    if text == '':
+        return []
+    try:
+        records = json.loads('[' + text.replace('\n', ',') + ']')
+    except json.JSONDecodeError:
+        records = None
+    if records is not None and len(records) == text.count('\n') + 1:
+        return records
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def _chunks(File, chunkSize: int) -> Iterator[bytes]:
+    """Read a binary file by chunks which end at line boundaries."""
+    rest = b''
+    while True:
+        data = File.read(chunkSize)
+        if data == b'':
+            break
+        data = rest + data
+        cut = data.rfind(b'\n') + 1
+        if cut == 0:
+            rest = data
+            continue
+        rest = data[cut:]
+        yield data[:cut]
+    if rest.strip() != b'':
+        yield rest
+
+
+def iterJSONL(
+    target: Union[Path, str],
+    encoding: str = 'utf-8',
+    workers: Optional[int] = None,
+    chunkSize: int = 1 << 22,
+) -> Iterator[Any]:
+    """Iterate the records of a json lines file, the blank lines are skipped.
+
+    Args:
+        target (Union[Path, str]): The file.
+        encoding (str, optional): Encoding method. Defaults to 'utf-8'.
+        workers (Optional[int], optional):
+            The number of processes decoding the chunks, the records are still in order.
+            Defaults to None as decoding in this process.
+        chunkSize (int, optional): The number of bytes read at once. Defaults to 1 << 22.
+
+    Yields:
+        Any: The records.
+    """
+    with open(target, 'rb') as File:
+        if workers is None or workers < 2:
+            for chunk in _chunks(File, chunkSize):
+                yield from _decodeLines(chunk, encoding)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            inFlight = deque()
+            for chunk in _chunks(File, chunkSize):
+                inFlight.append(executor.submit(_decodeLines, chunk, encoding))
+                if len(inFlight) >= workers * 2:
+                    yield from inFlight.popleft().result()
+            while len(inFlight) > 0:
+                yield from inFlight.popleft().result()
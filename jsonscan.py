@@ -0,0 +1,356 @@
+import re
+import json
+from typing import Optional, Iterable, Iterator, Union, TextIO, Any
+
+_whitespace = re.compile(r'[ \t\n\r]*')
+_structural = re.compile(r'["\[\]{}]')
+_stringStop = re.compile(r'["\\]')
+_scalarEnd = re.compile(r'[,\]}\s]')
+_escaped = re.compile(r'\\.', re.S)
+_keepBrackets = {i: None for i in range(128) if chr(i) not in '[]{}"'}
+_bracketPair = re.compile(r'\[\]|\{\}')
+_decoder = json.JSONDecoder()
+_bulkAfter = 64
+
+PathLike = Union[str, Iterable[Union[str, int]]]
+
+
+class _Found(Exception):
+    """All selected paths are found."""
+
+
+class JSONScanner:
+    """Scan a json document from a text file by chunks.
+
+    The values which are not needed are skipped by matching their brackets
+    and strings without being built, only the values needed are decoded by
+    :meth:`json.JSONDecoder.raw_decode`.
+    """
+
+    def __init__(
+        self,
+        File: TextIO,
+        chunkSize: int = 1 << 20,
+    ) -> None:
+        self.File = File
+        self.chunkSize = chunkSize
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.scanned = 0
+        self.fills = 0
+
+    def _fill(self, size: Optional[int] = None) -> bool:
+        """Read more text, the text before :attr:`pos` is dropped."""
+        if self.eof:
+            return False
+        chunk = self.File.read(self.chunkSize if size is None else size)
+        if chunk == '':
+            self.eof = True
+            return False
+        self.scanned += len(chunk)
+        self.fills += 1
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buf, self.pos)
+
+    def peek(self) -> str:
+        """The next character which is not whitespace, or '' at the end."""
+        while True:
+            self.pos = _whitespace.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, chars: str) -> str:
+        c = self.peek()
+        if c == '' or c not in chars:
+            raise self._error(f"Expecting one of '{chars}'")
+        self.pos += 1
+        return c
+
+    def decode(self) -> Any:
+        """Decode the next value."""
+        c = self.peek()
+        if c not in ('"', '[', '{'):
+            # a prefix of number is also a number, so it needs to be ended in buffer.
+            while _scalarEnd.search(self.buf, self.pos) is None and self._fill():
+                ...
+        size = self.chunkSize
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            self.pos = end
+            return value
+
+    def skip(self) -> None:
+        """Skip the next value without building it."""
+        c = self.peek()
+        if c == '"':
+            self.pos += 1
+            self._skipString()
+        elif c in ('[', '{'):
+            self._skipContainer()
+        elif c == '':
+            raise self._error("Expecting value")
+        else:
+            self._skipScalar()
+
+    def _skipString(self) -> None:
+        while True:
+            m = _stringStop.search(self.buf, self.pos)
+            if m is None:
+                self.pos = len(self.buf)
+            elif m.group() == '"':
+                self.pos = m.end()
+                return
+            elif m.end() < len(self.buf):
+                self.pos = m.end() + 1
+                continue
+            else:
+                self.pos = m.start()
+            if not self._fill():
+                raise self._error("Unterminated string")
+
+    def _skipBulk(self, depth: int) -> int:
+        """Skip the buffer until its last line when the container does not end in it.
+
+        A string in json can not contain a raw newline, so the lines are cut outside
+        strings. The escaped characters, the other values and then the strings are
+        removed, and the pairs of brackets are cancelled, what remains is the closing
+        brackets followed by the opening ones.
+        """
+        cut = self.buf.rfind('\n', self.pos)
+        if cut == -1:
+            return depth
+        region = self.buf[self.pos:cut]
+        if '\\' in region:
+            region = _escaped.sub('', region)
+        # the characters out of ascii can only be in strings.
+        brackets = ''.join(region.translate(_keepBrackets).split('"')[::2])
+        while True:
+            reduced = _bracketPair.sub('', brackets)
+            if len(reduced) == len(brackets):
+                break
+            brackets = reduced
+        openings = len(brackets.lstrip(']}'))
+        closings = len(brackets) - openings
+        if closings >= depth:
+            return depth
+        self.pos = cut
+        return depth - closings + openings
+
+    def _skipContainer(self, depth: int = 0) -> None:
+        bulkAt = -1
+        tokens = 0
+        while True:
+            tokens += 1
+            if tokens > _bulkAfter and bulkAt != self.fills:
+                # a large container, try once for each chunk.
+                depth = self._skipBulk(depth)
+                bulkAt = self.fills
+            m = _structural.search(self.buf, self.pos)
+            if m is None:
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise self._error("Unterminated container")
+                continue
+            self.pos = m.end()
+            c = m.group()
+            if c == '"':
+                self._skipString()
+            elif c in '[{':
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def _skipScalar(self) -> None:
+        while True:
+            m = _scalarEnd.search(self.buf, self.pos)
+            if m is not None:
+                self.pos = m.start()
+                return
+            self.pos = len(self.buf)
+            if not self._fill():
+                return
+
+    def skipRest(self) -> None:
+        """Skip the rest of the container which the scanner is in."""
+        self._skipContainer(depth=1)
+
+    def members(self) -> Iterable[str]:
+        """Iterate the keys of the object starting at the next character,
+        the value of each key needs to be decoded or skipped before the next."""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error("Expecting property name enclosed in double quotes")
+            key = self.decode()
+            self.expect(':')
+            yield key
+            if self.expect(',}') == '}':
+                return
+
+    def elements(self) -> Iterable[int]:
+        """Iterate the indices of the array starting at the next character,
+        each value needs to be decoded or skipped before the next."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self.expect(',]') == ']':
+                return
+
+
+def _splitPath(path: PathLike) -> tuple[str, ...]:
+    if isinstance(path, str):
+        return tuple(path.split('.'))
+    return tuple(str(k) for k in path)
+
+
+def _walk(value: Any, keys: tuple[str, ...]) -> Any:
+    for k in keys:
+        if isinstance(value, list):
+            value = value[int(k)]
+        else:
+            value = value[k]
+    return value
+
+
+def select(
+    File: TextIO,
+    paths: Iterable[PathLike],
+    chunkSize: int = 1 << 20,
+) -> dict[PathLike, Any]:
+    """Take the values of some paths from a json document, the other values are skipped
+    and the reading stops once all paths are found.
+
+    >>> with open('results.json', encoding='utf-8') as File:
+    ...     select(File, ['summary.fidelity', ('records', 0)])
+
+    Args:
+        File (TextIO): The file.
+        paths (Iterable[PathLike]):
+            The paths as keys joined by '.', or the sequence of keys,
+            the indices of arrays are also keys as numbers.
+        chunkSize (int, optional): The number of characters read at once. Defaults to 1 << 20.
+
+    Raises:
+        KeyError: When some paths are not found.
+
+    Returns:
+        dict[PathLike, Any]: The values of paths, the sequences of keys are turned into tuples.
+    """
+    paths = list(paths)
+    trie: dict = {}
+    for path in paths:
+        node = trie
+        for k in _splitPath(path):
+            node = node.setdefault(k, {})
+        node[None] = True
+
+    found: dict[tuple[str, ...], Any] = {}
+    scanner = JSONScanner(File, chunkSize=chunkSize)
+    total = len({_splitPath(path) for path in paths})
+
+    def take(node: dict, prefix: tuple[str, ...], value: Any) -> None:
+        if None in node:
+            found[prefix] = value
+        for k, child in node.items():
+            if k is None:
+                continue
+            try:
+                take(child, prefix+(k, ), _walk(value, (k, )))
+            except (KeyError, IndexError, ValueError, TypeError):
+                ...
+
+    def visit(node: dict, prefix: tuple[str, ...]) -> None:
+        if None in node:
+            take(node, prefix, scanner.decode())
+        else:
+            c = scanner.peek()
+            if c == '{':
+                keys = scanner.members()
+            elif c == '[':
+                keys = map(str, scanner.elements())
+            else:
+                scanner.skip()
+                return
+            remaining = sum(1 for k in node if k is not None)
+            for k in keys:
+                if k in node:
+                    remaining -= 1
+                    visit(node[k], prefix+(k, ))
+                    if len(found) == total:
+                        raise _Found
+                    if remaining == 0:
+                        scanner.skipRest()
+                        break
+                else:
+                    scanner.skip()
+        if len(found) == total:
+            raise _Found
+
+    try:
+        visit(trie, ())
+    except _Found:
+        ...
+
+    missing = [path for path in paths if _splitPath(path) not in found]
+    if len(missing) > 0:
+        raise KeyError(f"The paths {missing} are not found.")
+    return {
+        (path if isinstance(path, str) else tuple(path)): found[_splitPath(path)]
+        for path in paths
+    }
+
+
+def iterItems(
+    File: TextIO,
+    chunkSize: int = 1 << 20,
+) -> Iterator[Union[Any, tuple[str, Any]]]:
+    """Iterate the elements of a top-level array, or the key-value pairs of a
+    top-level object, only one item is held in memory at once.
+
+    >>> with open('records.json', encoding='utf-8') as File:
+    ...     for record in iterItems(File):
+    ...         ...
+
+    Args:
+        File (TextIO): The file.
+        chunkSize (int, optional): The number of characters read at once. Defaults to 1 << 20.
+
+    Raises:
+        ValueError: When the top-level value is not an array or an object.
+
+    Yields:
+        Union[Any, tuple[str, Any]]: The elements, or the key-value pairs.
+    """
+    scanner = JSONScanner(File, chunkSize=chunkSize)
+    c = scanner.peek()
+    if c == '[':
+        for _ in scanner.elements():
+            yield scanner.decode()
+    elif c == '{':
+        for key in scanner.members():
+            yield key, scanner.decode()
+    else:
+        raise ValueError("The top-level value is not an array or an object.")
@@ -1,4 +1,7 @@
 from .taglist import TagList, keyTupleLoads, tupleStrParse
-from .csvlist import singleColCSV
+from .csvlist import singleColCSV, typedSingleColCSV, matrixCSV
 from .gitsync import syncControl
-from .config import DefaultConfig
\ No newline at end of file
+from .config import DefaultConfig
+from .configcache import ConfigCache, configFingerprint
+from .session import ExportSession
+from .readcache import ReadCache, enableReadCache, disableReadCache
@@ -1,10 +1,64 @@
-from typing import NamedTuple, Optional, Callable, Iterable, Any
-from collections import namedtuple
-from ..jsonablize import Parse as jsonablize
+from typing import NamedTuple, Optional, Callable, Iterable, Iterator, Literal, Union, Any
+from collections import namedtuple, Counter
+from collections.abc import KeysView, Mapping
+from types import MappingProxyType
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import itertools
+import math
+import time
+import json
+import os
+from ..jsonablize import Parse as jsonablize, keyParse
+from .configcache import configFingerprint
+
+
+_plainTypes = (str, int, float, bool, type(None))
+
+
+def _copyJsonable(obj: Any) -> Any:
+    """Copy the containers of a jsonable object, the plain values are shared
+    since they are immutable."""
+    if type(obj) is dict:
+        return {k: _copyJsonable(v) for k, v in obj.items()}
+    if type(obj) is list:
+        return [_copyJsonable(v) for v in obj]
+    return obj
+
+
+class _WatchedDict(dict):
+    """A dictionary calling `onChange` when its keys or values are reassigned,
+    the changes inside the values are not watched."""
+
+    def __init__(self, *args, onChange: Callable[[], None], **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._onChange = onChange
+
+    def _changed(method):
+        def wrapped(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            # unset while unpickling, where the items are set before the attributes.
+            onChange = getattr(self, '_onChange', None)
+            if onChange is not None:
+                onChange()
+            return result
+        wrapped.__name__ = method.__name__
+        wrapped.__doc__ = method.__doc__
+        return wrapped
+
+    __setitem__ = _changed(dict.__setitem__)
+    __delitem__ = _changed(dict.__delitem__)
+    __ior__ = _changed(dict.__ior__)
+    update = _changed(dict.update)
+    pop = _changed(dict.pop)
+    popitem = _changed(dict.popitem)
+    setdefault = _changed(dict.setdefault)
+    clear = _changed(dict.clear)
+    del _changed
 
 
 class DefaultConfig():
-    __version__ = (0, 2, 0)
+    __version__ = (0, 3, 0)
 
     def __init__(
         self,
@@ -35,6 +89,23 @@ class DefaultConfig():
             defaults=self.default.values(),
         )
         self.default_names = self.namedtupleType._fields
+        self._fieldPositions = {
+            k: i for i, k in enumerate(self.namedtupleType._fields)}
+        self._fieldSet = frozenset(self.namedtupleType._fields)
+
+    @property
+    def default(self) -> dict[str, Any]:
+        """The default parameters, reassigning it or its keys drops the caches of :meth:`make`."""
+        return self._default
+
+    @default.setter
+    def default(self, value: dict[str, Any]) -> None:
+        self._default = _WatchedDict(value, onChange=self._dropCaches)
+        self._dropCaches()
+
+    def _dropCaches(self) -> None:
+        self._jsonableCache: Optional[dict[str, Any]] = None
+        self._partialCache: dict[tuple[bool, frozenset], tuple[frozenset, tuple]] = {}
 
     def __call__(
         self,
@@ -73,6 +144,31 @@ class DefaultConfig():
         else:
             raise TypeError("Input must be a dict.")
 
+    def _partialProjection(
+        self,
+        partial: Iterable[str],
+        jsonable: bool,
+    ) -> tuple[frozenset, tuple]:
+        """The key set of `partial` and the default keys in it, the jsonable keys
+        when `jsonable`, cached by the key set until `self.default` is changed."""
+        keys = frozenset(partial)
+        cacheKey = (jsonable, keys)
+        cached = self._partialCache.get(cacheKey, None)
+        if cached is None:
+            defaultKeys = self._jsonableDefault().keys() if jsonable else self.default
+            cached = (keys, tuple(k for k in defaultKeys if k in keys))
+            self._partialCache[cacheKey] = cached
+        return cached
+
+    def _jsonableDefault(self) -> dict[str, Any]:
+        """The jsonable form of defaults, made once until `self.default` is changed,
+        which should be copied by :func:`_copyJsonable` before handed out."""
+        if self._jsonableCache is None:
+            self._jsonableCache = {
+                keyParse(k): v if type(v) in _plainTypes else jsonablize(v)
+                for k, v in self.default.items()}
+        return self._jsonableCache
+
     def make(
         self,
         __values: dict[str, Any] = {},
@@ -82,6 +178,10 @@ class DefaultConfig():
     ) -> dict[str, Any]:
         """Export a dictionary of configuration.
 
+        In the jsonable form, the defaults are jsonablized once until
+        `self.default` is changed, and only their containers are copied
+        on each call, so the result is still safe to change.
+
         Args:
             __values (dict[str, Any], optional): Additonal object. Defaults to `{}`.
             args (list[str], optional): Positional arguments handler.
@@ -95,21 +195,43 @@ class DefaultConfig():
             raise ValueError(
                 "Only allow one positional argument to be passed, which is dictionary for configuration.")
 
-        config = {
-            **self.default,
-            **__values,
-        }
-
-        if jsonable:
-            config = jsonablize(config)
-
         if len(partial) == 0:
-            return config
+            if jsonable:
+                return {
+                    **_copyJsonable(self._jsonableDefault()),
+                    **{keyParse(k): jsonablize(v) for k, v in __values.items()},
+                }
+            return {**self.default, **__values}
+
+        keys, baseKeys = self._partialProjection(partial, jsonable)
+        if jsonable:
+            jsonableDefault = self._jsonableDefault()
+            config = {k: _copyJsonable(jsonableDefault[k]) for k in baseKeys}
         else:
-            return {
-                k: v for k, v in config.items()
-                if k in partial
-            }
+            config = {k: self.default[k] for k in baseKeys}
+        for k, v in __values.items():
+            if jsonable:
+                k = keyParse(k)
+                if k in keys:
+                    config[k] = jsonablize(v)
+            elif k in keys:
+                config[k] = v
+        return config
+
+    def fingerprint(
+        self,
+        __values: dict[str, Any] = {},
+    ) -> str:
+        """A stable hash of the configuration made from the given values, 
+        see :func:`configFingerprint`.
+
+        Args:
+            __values (dict[str, Any], optional): Additonal object. Defaults to `{}`.
+
+        Returns:
+            str: The hex digest of sha256.
+        """
+        return configFingerprint(self.make(__values))
 
     def as_dict(self, *args, **kwargs) -> dict[str, Any]:
         """Export configuration as a dictionary, the alternative name of :method:`make`.
@@ -140,6 +262,134 @@ class DefaultConfig():
 
         return self.namedtupleType(**__values)
 
+    def _sweepAxes(
+        self,
+        axes: dict[str, Iterable[Any]],
+        mode: Literal['product', 'zip'],
+    ) -> tuple[list[int], list[tuple], int]:
+        """Check the axes of sweep, return their positions, values and the number of points."""
+        unknown = [k for k in axes if k not in self._fieldPositions]
+        if len(unknown) > 0:
+            raise ValueError(f"The keys {unknown} are not in configuration.")
+
+        positions = [self._fieldPositions[k] for k in axes]
+        axisValues = [tuple(v) for v in axes.values()]
+        if mode == 'product':
+            total = math.prod(len(v) for v in axisValues)
+        elif mode == 'zip':
+            lengths = {len(v) for v in axisValues}
+            if len(lengths) > 1:
+                raise ValueError(
+                    f"All axes need the same length for 'zip', but got {lengths}.")
+            total = lengths.pop() if len(lengths) > 0 else 1
+        else:
+            raise ValueError(
+                f"Instead of '{mode}', only 'product' or 'zip' can be used.")
+
+        return positions, axisValues, total
+
+    def sweep_size(
+        self,
+        __axes: dict[str, Iterable[Any]] = {},
+        mode: Literal['product', 'zip'] = 'product',
+        **axes: Iterable[Any],
+    ) -> int:
+        """The number of points of a sweep.
+
+        Args:
+            __axes (dict[str, Iterable[Any]], optional): The axes as dictionary. Defaults to {}.
+            mode (Literal['product', 'zip'], optional): Cartesian product or zipped axes. Defaults to 'product'.
+            axes (Iterable[Any]): The values of each swept field.
+
+        Returns:
+            int: The number of points.
+        """
+        return self._sweepAxes({**__axes, **axes}, mode)[2]
+
+    def sweep(
+        self,
+        __axes: dict[str, Iterable[Any]] = {},
+        *,
+        values: dict[str, Any] = {},
+        mode: Literal['product', 'zip'] = 'product',
+        start: int = 0,
+        stop: Optional[int] = None,
+        shard: Optional[tuple[int, int]] = None,
+        batch: Optional[int] = None,
+        **axes: Iterable[Any],
+    ) -> Iterator[NamedTuple]:
+        """Lazily generate the configurations of a parameter sweep as :attr:`namedtupleType`.
+
+        >>> config = DefaultConfig({'shots': 1024, 'depth': 1, 'seed': 0})
+        >>> for point in config.sweep(depth=range(1, 10), seed=range(5), shard=(0, 4)):
+        ...     run(point)
+
+        The product is streamed in the order of :func:`itertools.product` 
+        without materializing it, and a range of it starts directly at `start`.
+
+        Args:
+            __axes (dict[str, Iterable[Any]], optional): 
+                The axes as dictionary, for the fields named like the arguments. Defaults to {}.
+            values (dict[str, Any], optional): The fixed values other than defaults. Defaults to {}.
+            mode (Literal['product', 'zip'], optional): Cartesian product or zipped axes. Defaults to 'product'.
+            start (int, optional): The index of first point. Defaults to 0.
+            stop (Optional[int], optional): The index after the last point. Defaults to None as the end.
+            shard (Optional[tuple[int, int]], optional): 
+                `(i, n)` for the i-th of n even parts of the points, overrides `start` and `stop`. 
+                Defaults to None.
+            batch (Optional[int], optional): 
+                Yield columnar batches of this size, each field of the batch is a tuple of values. 
+                Defaults to None as yielding points.
+            axes (Iterable[Any]): The values of each swept field.
+
+        Yields:
+            NamedTuple: The configurations, or the columnar batches.
+        """
+        positions, axisValues, total = self._sweepAxes({**__axes, **axes}, mode)
+        base = list(self.namedtupleType(**values))
+
+        if shard is not None:
+            i, n = shard
+            if not 0 <= i < n:
+                raise ValueError(f"Invalid shard {shard}.")
+            start, stop = total*i//n, total*(i+1)//n
+        stop = total if stop is None else min(stop, total)
+        start = max(start, 0)
+        if start >= stop:
+            return
+
+        if mode == 'zip':
+            combos = zip(*(v[start:stop] for v in axisValues))
+        elif start == 0:
+            combos = itertools.islice(itertools.product(*axisValues), stop)
+        else:
+            combos = _productRange(axisValues, start, stop)
+
+        def rows():
+            for combo in combos:
+                row = base.copy()
+                for p, v in zip(positions, combo):
+                    row[p] = v
+                yield row
+
+        make = self.namedtupleType._make
+        if batch is None:
+            if len(positions) == 0:
+                yield make(base)
+                return
+            for row in rows():
+                yield make(row)
+        else:
+            if len(positions) == 0:
+                yield make((v, ) for v in base)
+                return
+            rowIter = rows()
+            while True:
+                chunk = list(itertools.islice(rowIter, batch))
+                if len(chunk) == 0:
+                    return
+                yield make(zip(*chunk))
+
     def is_ready(
         self,
         target: dict[str, Any] = {},
@@ -155,6 +405,7 @@ class DefaultConfig():
             bool: Whether the configuration is completed
         """
         self._handle_input(target)
+        ignores = set(ignores)
         return all(k in target or k in ignores for k in self.namedtupleType._fields)
 
     def conclude_keys(
@@ -172,6 +423,7 @@ class DefaultConfig():
             dict[str, list[str]]: The contained and uncontained keys of the configuration.
         """
         self._handle_input(target)
+        excepts = set(excepts)
         includes = []
         excludes = []
         for k in self.namedtupleType._fields:
@@ -229,12 +481,313 @@ class DefaultConfig():
             list: The contained keys of the configuration.
         """
         self._handle_input(target)
+        ignores = set(ignores)
         uselesskeylist = []
         for k in target:
-            if not (k in self.namedtupleType._fields or k in ignores):
+            if not (k in self._fieldSet or k in ignores):
                 uselesskeylist.append(k)
 
         return uselesskeylist
 
+    def validate_many(
+        self,
+        targets: Iterable[dict[str, Any]],
+        ignores: Iterable[str] = [],
+        workers: Optional[int] = None,
+        chunkSize: int = 10000,
+    ) -> "ValidationResult":
+        """Check many configurations at once, 
+        giving the missing and the unrecognized keys of each configuration.
+
+        Args:
+            targets (Iterable[dict[str, Any]]): The configurations want to check.
+            ignores (Iterable[str], optional): The keys to be ignored. Defaults to [].
+            workers (Optional[int], optional): 
+                The number of processes, only the keys of configurations are sent to them. 
+                Defaults to None as checking in this process.
+            chunkSize (int, optional): The number of configurations sent to a process at once. Defaults to 10000.
+
+        Returns:
+            ValidationResult: The columnar results.
+        """
+        ignores = frozenset(ignores)
+        keyChunks = _keyChunks(
+            targets, chunkSize, self._handle_input, toTuple=workers is not None)
+
+        missing: list[tuple[str, ...]] = []
+        unknown: list[tuple[str, ...]] = []
+        if workers is None:
+            for keys in keyChunks:
+                chunkMissing, chunkUnknown = _validateKeys(
+                    self.namedtupleType._fields, ignores, keys)
+                missing += chunkMissing
+                unknown += chunkUnknown
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for chunkMissing, chunkUnknown in executor.map(
+                    _validateKeys,
+                    itertools.repeat(self.namedtupleType._fields),
+                    itertools.repeat(ignores),
+                    keyChunks,
+                ):
+                    missing += chunkMissing
+                    unknown += chunkUnknown
+
+        ready = [len(m) == 0 for m in missing]
+        return ValidationResult(
+            missing=missing,
+            unknown=unknown,
+            ready=ready,
+            total=len(ready),
+            readyCount=sum(ready),
+            missingCount=dict(Counter(itertools.chain.from_iterable(missing))),
+            unknownCount=dict(Counter(itertools.chain.from_iterable(unknown))),
+        )
+
+    def layered(
+        self,
+        filename: Optional[Union[str, Path]] = None,
+        saveLocation: Union[Path, str] = Path('./'),
+        envPrefix: Optional[str] = None,
+        overrides: dict[str, Any] = {},
+        checkInterval: float = 1.0,
+    ) -> "LayeredConfig":
+        """Attach the layered sources to this configuration, see :cls:`LayeredConfig`.
+
+        Args:
+            filename (Optional[Union[str, Path]], optional): The json file of configuration. Defaults to None.
+            saveLocation (Union[Path, str], optional): Location of the file. Defaults to Path('./').
+            envPrefix (Optional[str], optional): The prefix of environment variables. Defaults to None.
+            overrides (dict[str, Any], optional): The runtime overrides. Defaults to {}.
+            checkInterval (float, optional): Seconds between checking the sources for changes,
+                use :meth:`LayeredConfig.invalidate` to check at once. Defaults to 1.0.
+
+        Returns:
+            LayeredConfig: The layered configuration.
+        """
+        return LayeredConfig(
+            self,
+            filename=filename,
+            saveLocation=saveLocation,
+            envPrefix=envPrefix,
+            overrides=overrides,
+            checkInterval=checkInterval,
+        )
+
     def __repr__(self):
         return f"{self.namedtupleType()}"
+
+
+class LayeredConfig:
+    """Configuration resolved from defaults, a json file, environment variables and runtime overrides,
+    the later layer overrides the former.
+
+    The resolved configuration is cached and only resolved again when the
+    mtime or the size of the file, one of the environment variables or
+    the overrides are changed, the file and the environment variables are
+    checked at most once in `checkInterval` seconds.
+
+    The environment variable of a field is the prefix with the field name 
+    in upper case, like `EXP_SHOTS` for the field `shots` with prefix `EXP_`,
+    its value is read as json if possible, otherwise as a string.
+
+    >>> layered = DefaultConfig({'shots': 1024}).layered('config.json', envPrefix='EXP_')
+    >>> layered.resolve()
+    ... {'shots': 4096}
+
+    """
+    __version__ = (0, 1, 0)
+
+    def __init__(
+        self,
+        base: DefaultConfig,
+        filename: Optional[Union[str, Path]] = None,
+        saveLocation: Union[Path, str] = Path('./'),
+        envPrefix: Optional[str] = None,
+        overrides: dict[str, Any] = {},
+        checkInterval: float = 1.0,
+    ) -> None:
+        self.base = base
+        self.filename = filename
+        self.saveLocation = Path(saveLocation)
+        self.envPrefix = envPrefix
+        self.checkInterval = checkInterval
+
+        self._envNames = {} if envPrefix is None else {
+            f"{envPrefix}{k.upper()}": k for k in base.default_names}
+        self._overrides = dict(overrides)
+        self._overridesVersion = 0
+        self._token = None
+        self._lastCheck = -math.inf
+        self._values: dict[str, Any] = {}
+        self._resolved: dict[tuple[bool, frozenset], MappingProxyType] = {}
+
+    def set_overrides(
+        self,
+        overrides: dict[str, Any],
+        replace: bool = False,
+    ) -> None:
+        """Set the runtime overrides.
+
+        Args:
+            overrides (dict[str, Any]): The overrides.
+            replace (bool, optional): Replace all overrides instead of updating them. Defaults to False.
+        """
+        if replace:
+            self._overrides = dict(overrides)
+        else:
+            self._overrides.update(overrides)
+        self._overridesVersion += 1
+        self._lastCheck = -math.inf
+
+    def invalidate(self) -> None:
+        """Resolve the configuration again in next :meth:`resolve`."""
+        self._token = None
+        self._lastCheck = -math.inf
+
+    def _currentToken(self) -> tuple:
+        fileState = None
+        if self.filename is not None:
+            try:
+                stat = os.stat(self.saveLocation / self.filename)
+                fileState = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                ...
+        environ = os.environ
+        return (
+            fileState,
+            tuple(environ.get(name) for name in self._envNames),
+            self._overridesVersion,
+        )
+
+    def _load(self, token: tuple) -> None:
+        from ..quick import quickRead
+
+        values = {}
+        if token[0] is not None:
+            values.update(quickRead(self.filename, saveLocation=self.saveLocation))
+        for (name, k), raw in zip(self._envNames.items(), token[1]):
+            if raw is None:
+                continue
+            try:
+                values[k] = json.loads(raw)
+            except json.JSONDecodeError:
+                values[k] = raw
+        values.update(self._overrides)
+
+        self._values = values
+        self._resolved = {}
+        self._token = token
+
+    def resolve(
+        self,
+        partial: Iterable[str] = [],
+        jsonable: bool = False,
+    ) -> Mapping[str, Any]:
+        """Export the resolved configuration as a read-only view of the cached result,
+        copy it by `dict(...)` to modify.
+
+        Args:
+            partial (Iterable[str], optional): Export parts of configuration. Defaults to `[]` as exporting all.
+            jsonable (bool, optional): Whether to make the configuration jsonable. Defaults to `False`.
+
+        Returns:
+            Mapping[str, Any]: The resolved configuration.
+        """
+        partial = tuple(partial)
+        now = time.monotonic()
+        if self._token is None or now - self._lastCheck >= self.checkInterval:
+            self._lastCheck = now
+            token = self._currentToken()
+            if token != self._token:
+                self._load(token)
+
+        key = (jsonable, frozenset(partial))
+        if key not in self._resolved:
+            self._resolved[key] = MappingProxyType(self.base.make(
+                self._values, partial=partial, jsonable=jsonable))
+        return self._resolved[key]
+
+    def as_namedtuple(self) -> NamedTuple:
+        """Export the resolved configuration as a namedtuple of the base configuration."""
+        return self.base.namedtupleType._make(
+            self.resolve()[k] for k in self.base.default_names)
+
+
+class ValidationResult(NamedTuple):
+    """The result of :meth:`DefaultConfig.validate_many`, 
+    the i-th item of `missing`, `unknown` and `ready` is for the i-th configuration."""
+    missing: list[tuple[str, ...]]
+    unknown: list[tuple[str, ...]]
+    ready: list[bool]
+    total: int
+    readyCount: int
+    missingCount: dict[str, int]
+    unknownCount: dict[str, int]
+
+
+def _keyChunks(
+    targets: Iterable[dict[str, Any]],
+    chunkSize: int,
+    check: Callable[[dict[str, Any]], None],
+    toTuple: bool = False,
+) -> Iterator[list[Iterable[str]]]:
+    chunk = []
+    for target in targets:
+        check(target)
+        chunk.append(tuple(target) if toTuple else target.keys())
+        if len(chunk) >= chunkSize:
+            yield chunk
+            chunk = []
+    if len(chunk) > 0:
+        yield chunk
+
+
+def _validateKeys(
+    fields: tuple[str, ...],
+    ignores: frozenset,
+    keysChunk: list[Iterable[str]],
+) -> tuple[list[tuple[str, ...]], list[tuple[str, ...]]]:
+    """The missing and the unrecognized keys of each key set."""
+    required = tuple(k for k in fields if k not in ignores)
+    requiredSet = frozenset(required)
+    allowed = frozenset(fields) | ignores
+    missing = []
+    unknown = []
+    for keys in keysChunk:
+        keySet = keys if isinstance(keys, KeysView) else set(keys)
+        missing.append(
+            () if keySet >= requiredSet else
+            tuple(k for k in required if k not in keySet))
+        unknown.append(
+            () if keySet <= allowed else
+            tuple(k for k in keys if k not in allowed))
+    return missing, unknown
+
+
+def _productRange(
+    axisValues: list[tuple],
+    start: int,
+    stop: int,
+) -> Iterator[tuple]:
+    """Points of :func:`itertools.product` from index `start` to `stop`, without skipping the points before."""
+    radices = [len(v) for v in axisValues]
+    digits = []
+    rest = start
+    for n in reversed(radices):
+        digits.append(rest % n)
+        rest //= n
+    digits.reverse()
+    current = [v[d] for v, d in zip(axisValues, digits)]
+
+    for _ in range(stop-start):
+        yield tuple(current)
+        i = len(radices) - 1
+        while i >= 0:
+            digits[i] += 1
+            if digits[i] < radices[i]:
+                current[i] = axisValues[i][digits[i]]
+                break
+            digits[i] = 0
+            current[i] = axisValues[i][0]
+            i -= 1
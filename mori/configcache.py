@@ -0,0 +1,267 @@
+from typing import Optional, Callable, NamedTuple, Union, Any
+from collections import OrderedDict
+from pathlib import Path
+import functools
+import threading
+import tempfile
+import hashlib
+import pickle
+import json
+import sys
+import os
+
+from ..jsonablize import Parse as jsonablize
+
+_tags = {
+    bool: 'b', int: 'i', float: 'f', str: 's', bytes: 'y',
+    list: 'l', tuple: 't', dict: 'd', set: 'S', frozenset: 'F',
+}
+
+
+def _canonical(o: Any) -> str:
+    """Encode a value with the tag of its type, the keys of dict and the members of
+    set are sorted by their encodings, so the encoding does not depend on the order
+    of insertion or the hash of process. The other values are encoded by their
+    jsonable form from :func:`jsonablize` with the tag of their type.
+    """
+    if o is None:
+        return 'N'
+    if isinstance(o, os.PathLike):
+        return 'p' + json.dumps(os.fspath(o), ensure_ascii=False)
+
+    for base in type(o).__mro__:
+        if base in _tags:
+            break
+    else:
+        return (
+            f"o<{type(o).__module__}.{type(o).__qualname__}>" + _canonical(jsonablize(o)))
+    tag = _tags[base]
+    if type(o) is not base:
+        # the subclasses like namedtuple or IntEnum are not equal to their bases.
+        tag += f"<{type(o).__module__}.{type(o).__qualname__}>"
+
+    if base is bool:
+        return tag + ('1' if o else '0')
+    elif base is int:
+        return tag + int.__repr__(o)
+    elif base is float:
+        return tag + float.hex(o)
+    elif base is str:
+        return tag + json.dumps(str.__str__(o), ensure_ascii=False)
+    elif base is bytes:
+        return tag + bytes.hex(o)
+    elif base in (list, tuple):
+        return tag + '[' + ','.join(_canonical(v) for v in o) + ']'
+    elif base is dict:
+        return tag + '{' + ','.join(sorted(
+            _canonical(k) + ':' + _canonical(v) for k, v in o.items())) + '}'
+    return tag + '{' + ','.join(sorted(_canonical(v) for v in o)) + '}'
+
+
+def configFingerprint(config: Any) -> str:
+    """A stable hash of configuration, independent of the order of keys.
+
+    Each value is encoded with its type, so `1` and `'1'`, or `(1, 2)` and `[1, 2]`
+    are different, and the sets are sorted, so the hash is the same in every process.
+    The objects which are not builtin values, containers of them or paths are hashed
+    by their jsonable form, which is stable only when their `__repr__` is.
+
+    Args:
+        config (Any): The configuration, usually from :meth:`DefaultConfig.make`.
+
+    Returns:
+        str: The hex digest of sha256.
+    """
+    return hashlib.sha256(_canonical(config).encode('utf-8')).hexdigest()
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    nbytes: int
+
+
+class ConfigCache:
+    """A LRU cache of results by the fingerprint of configuration.
+
+    >>> cache = ConfigCache(maxsize=1024, saveLocation='./cache')
+    >>> @cache.memoize
+    ... def experiment(config):
+    ...     ...
+    >>> experiment(defaultConfig.make({'shots': 4096}))
+
+    """
+    __version__ = (0, 1, 0)
+    _missing = object()
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 128,
+        maxbytes: Optional[int] = None,
+        saveLocation: Optional[Union[Path, str]] = None,
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+    ) -> None:
+        """Set the cache.
+
+        Args:
+            maxsize (Optional[int], optional): Max number of results in memory. Defaults to 128.
+            maxbytes (Optional[int], optional): Max total size of results in memory. Defaults to None.
+            saveLocation (Optional[Union[Path, str]], optional):
+                The directory keeping the results on disk, which is not evicted.
+                Defaults to None as memory only.
+            sizeof (Callable[[Any], int], optional): The size of a result. Defaults to :func:`sys.getsizeof`.
+        """
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.saveLocation = None if saveLocation is None else Path(saveLocation)
+        if self.saveLocation is not None:
+            os.makedirs(self.saveLocation, exist_ok=True)
+        self.sizeof = sizeof
+
+        self._data: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.RLock()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, len(self._data), self._nbytes)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _diskPath(self, key: str) -> Path:
+        return self.saveLocation / key[:2] / f"{key}.pickle"
+
+    def _evict(self) -> None:
+        while len(self._data) > 0 and (
+            (self.maxsize is not None and len(self._data) > self.maxsize) or
+            (self.maxbytes is not None and self._nbytes > self.maxbytes)
+        ):
+            _, (_, nbytes) = self._data.popitem(last=False)
+            self._nbytes -= nbytes
+            self._evictions += 1
+
+    def _remember(self, key: str, value: Any) -> None:
+        nbytes = self.sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self._nbytes -= self._data.pop(key)[1]
+            self._data[key] = (value, nbytes)
+            self._nbytes += nbytes
+            self._evict()
+
+    def get(
+        self,
+        key: str,
+        default: Any = None,
+    ) -> Any:
+        """Get a result by fingerprint, from memory or then from disk.
+
+        Args:
+            key (str): The fingerprint.
+            default (Any, optional): The value when not found. Defaults to None.
+
+        Returns:
+            Any: The result.
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self._hits += 1
+                return self._data[key][0]
+
+        if self.saveLocation is not None:
+            try:
+                with open(self._diskPath(key), 'rb') as File:
+                    value = pickle.load(File)
+            except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+                ...
+            else:
+                self._remember(key, value)
+                with self._lock:
+                    self._hits += 1
+                return value
+
+        with self._lock:
+            self._misses += 1
+        return default
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data or (
+            self.saveLocation is not None and self._diskPath(key).exists())
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+    ) -> None:
+        """Keep a result by fingerprint.
+
+        Args:
+            key (str): The fingerprint.
+            value (Any): The result.
+        """
+        self._remember(key, value)
+        if self.saveLocation is not None:
+            target = self._diskPath(key)
+            os.makedirs(target.parent, exist_ok=True)
+            fd, tmpName = tempfile.mkstemp(
+                dir=target.parent, prefix=f".{key}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as File:
+                    pickle.dump(value, File, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmpName, target)
+            except BaseException:
+                if os.path.exists(tmpName):
+                    os.remove(tmpName)
+                raise
+
+    def clear(
+        self,
+        disk: bool = False,
+    ) -> None:
+        """Clear the results in memory.
+
+        Args:
+            disk (bool, optional): Whether to remove the results on disk. Defaults to False.
+        """
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+        if disk and self.saveLocation is not None:
+            for shard in self.saveLocation.iterdir():
+                if shard.is_dir():
+                    for f in shard.glob('*.pickle'):
+                        f.unlink()
+
+    def memoize(self, func: Callable) -> Callable:
+        """Decorate a function which is pure in its arguments,
+        the first of which is the configuration.
+
+        The key is the fingerprint of the name of function with all arguments.
+        """
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(config, *args, **kwargs):
+            key = configFingerprint({
+                'func': name,
+                'config': config,
+                'args': args,
+                'kwargs': kwargs,
+            })
+            result = self.get(key, self._missing)
+            if result is self._missing:
+                result = func(config, *args, **kwargs)
+                self.put(key, result)
+            return result
+
+        wrapper.cache = self
+        return wrapper
@@ -1,8 +1,15 @@
-from typing import Optional, TypeVar, Union, NamedTuple
+from typing import Optional, TypeVar, Union, NamedTuple, Iterator, Iterable, Callable, Any
+from collections.abc import MutableSequence
 from pathlib import Path
 import os
+import re
 import csv
 import glob
+import array
+import operator
+import itertools
+
+from .session import ExportSession
 
 T = TypeVar('T')
 
@@ -103,6 +110,7 @@ class singleColCSV(list[T]):
 
         openArgs: dict = defaultOpenArgs,
         printArgs: dict = defaultPrintArgs,
+        session: Optional[ExportSession] = None,
     ) -> Path:
         """Export `tagList`.
 
@@ -125,6 +133,9 @@ class singleColCSV(list[T]):
                 The other arguments for :func:`print` function.
                 Defaults to :attr:`self.defaultPrintArgs`, which is:
                 >>> {}
+            session (Optional[ExportSession], optional):
+                The session of validated arguments used instead of
+                `saveLocation`, `openArgs` and `printArgs`. Defaults to None.
 
         Raises:
             ValueError: When filetype is not supported.
@@ -137,7 +148,7 @@ class singleColCSV(list[T]):
             openArgs=openArgs,
             printArgs=printArgs,
             saveLocation=saveLocation,
-        )
+        ) if session is None else session.params(type(self))
         printArgs = args.printArgs
         openArgs = args.openArgs
         saveLocation = args.saveLocation
@@ -145,17 +156,153 @@ class singleColCSV(list[T]):
         if name is None:
             name = self.name
 
-        filename = name + (
+        filename = name + "." + (
             self.__name__ if secondFilenameExt is None else f"{secondFilenameExt}"
         ) + ".csv"
 
-        with open(saveLocation / filename, **openArgs, newline='') as ExportCsv:
+        opener = None if session is None else session.opener
+        with open(saveLocation / filename, **openArgs, newline='', opener=opener) as ExportCsv:
             taglistWriter = csv.writer(ExportCsv, quotechar='|')
-            for v in self:
-                taglistWriter.writerow((v, ))
+            taglistWriter.writerows(zip(self))
 
         return saveLocation / filename
 
+    def astype(
+        self,
+        dtype: str,
+    ) -> "typedSingleColCSV":
+        """Convert to a typed array, the strings are parsed as numbers for numeric types.
+
+        Args:
+            dtype (str): The type of values, see :cls:`typedSingleColCSV`.
+
+        Returns:
+            typedSingleColCSV: The values in typed array.
+        """
+        values = self
+        if dtype in _arrayTypecodes:
+            parse = float if dtype.startswith('float') else int
+            values = (v if isinstance(v, (int, float)) else parse(v) for v in self)
+        return typedSingleColCSV(values, dtype=dtype, name=self.name)
+
+    @classmethod
+    def _locate(
+        cls,
+        name: str,
+        saveLocation: Path,
+        secondFilenameExt: str,
+        whichNum: int = 0,
+        notFoundRaise: bool = True,
+    ) -> Optional[Path]:
+        """Find the exported file, return None when not found and `notFoundRaise` is False."""
+
+        lsLoc1 = glob.glob(str(saveLocation / f"*.{secondFilenameExt}.*"))
+        if len(lsLoc1) == 0:
+            if notFoundRaise:
+                raise FileNotFoundError(
+                    f"The file '*.{secondFilenameExt}.*' not found at '{saveLocation}'.")
+            else:
+                return None
+
+        lsLoc2 = [f for f in lsLoc1] if name is None else [
+            f for f in lsLoc1 if name in f]
+
+        if len(lsLoc2) < 1:
+            if notFoundRaise:
+                raise FileNotFoundError(
+                    f"The file '{name}.'" + f"{secondFilenameExt}.csv"+f" not found at '{saveLocation}'.")
+            else:
+                return None
+        elif len(lsLoc2) > 1:
+            lsLoc2 = [lsLoc2[whichNum]]
+            print(
+                f"The following files '{lsLoc2}' are fitting giving 'name' and 'additionName', choosing the '{lsLoc2[0]}'.")
+
+        filename = lsLoc2[0]
+        filename = Path(filename).name
+        return saveLocation / filename
+
+    @classmethod
+    def iter_read(
+        cls,
+        name: str,
+        saveLocation: Union[Path, str] = Path('./'),
+        secondFilenameExt: Optional[str] = None,
+
+        openArgs: dict = defaultOpenArgs,
+        printArgs: dict = defaultPrintArgs,
+        whichNum: int = 0,
+        notFoundRaise: bool = True,
+        chunkSize: int = 100000,
+        dtype: Optional[str] = None,
+        session: Optional[ExportSession] = None,
+    ) -> Iterator[list[str]]:
+        """Read `singleColCSV` by chunks without holding the whole file.
+
+        Args:
+            name (str, optional): 
+                Name for this `singleColCSV`.
+            saveLocation (Path): The location of file.
+            secondFilenameExt (Optional[str], optional):
+            openArgs (dict, optional): 
+                The other arguments for :func:`open` function.
+                Defaults to :attr:`self.defaultOpenArgs`.
+            printArgs (dict, optional): 
+                The other arguments for :func:`print` function.
+                Defaults to :attr:`self.defaultPrintArgs`.
+            chunkSize (int, optional): The number of values in each chunk. Defaults to 100000.
+            dtype (Optional[str], optional): 
+                Parse the values into typed arrays, see :cls:`typedSingleColCSV`. 
+                Defaults to None as strings.
+            session (Optional[ExportSession], optional):
+                The session of validated arguments used instead of
+                `saveLocation`, `openArgs` and `printArgs`. Defaults to None.
+
+        Raises:
+            FileNotFoundError: When the file is not found and `notFoundRaise` is True.
+
+        Yields:
+            list[str]: The values in chunk.
+        """
+        if dtype is not None:
+            yield from typedSingleColCSV.iter_read(
+                name=name,
+                saveLocation=saveLocation,
+                secondFilenameExt=secondFilenameExt,
+                dtype=dtype,
+                openArgs=openArgs,
+                printArgs=printArgs,
+                whichNum=whichNum,
+                notFoundRaise=notFoundRaise,
+                chunkSize=chunkSize,
+                session=session,
+            )
+            return
+
+        args = cls.paramsControl(
+            openArgs=openArgs,
+            printArgs=printArgs,
+            saveLocation=saveLocation,
+            isReadOnly=True,
+        ) if session is None else session.params(cls, isReadOnly=True)
+        openArgs = args.openArgs
+        saveLocation = args.saveLocation
+
+        secondFilenameExt = cls.__dict__['__name__'] if secondFilenameExt is None else f"{secondFilenameExt}"
+        target = cls._locate(
+            name, saveLocation, secondFilenameExt, whichNum, notFoundRaise)
+        if target is None:
+            return
+
+        opener = None if session is None else session.opener
+        with open(target, **openArgs, newline='', opener=opener) as ReadCsv:
+            taglistReaper = csv.reader(ReadCsv, quotechar='|')
+            while True:
+                chunk = [v[0] for v in itertools.islice(taglistReaper, chunkSize)]
+                if len(chunk) == 0:
+                    return
+                yield chunk
+
     @classmethod
     def read(
         cls,
@@ -167,16 +314,15 @@ class singleColCSV(list[T]):
         printArgs: dict = defaultPrintArgs,
         whichNum: int = 0,
         notFoundRaise: bool = True,
+        dtype: Optional[str] = None,
+        session: Optional[ExportSession] = None,
     ):
-        """Export `tagList`.
+        """Read `singleColCSV`.
 
         Args:
             name (str, optional): 
-                Name for this `tagList`.
-                Defaults to 'untitled'.
+                Name for this `singleColCSV`.
             saveLocation (Path): The location of file.
-            additionName (Optional[str], optional): 
-                Name for this `tagList`, 
             secondFilenameExt (Optional[str], optional):
             openArgs (dict, optional): 
                 The other arguments for :func:`open` function.
@@ -189,68 +335,836 @@ class singleColCSV(list[T]):
                 The other arguments for :func:`print` function.
                 Defaults to :attr:`self.defaultPrintArgs`, which is:
                 >>> {}
+            dtype (Optional[str], optional): 
+                Read the values into a typed array as :cls:`typedSingleColCSV`. 
+                Defaults to None as strings.
+            session (Optional[ExportSession], optional):
+                The session of validated arguments used instead of
+                `saveLocation`, `openArgs` and `printArgs`. Defaults to None.
 
         Raises:
-            ValueError: When filetype is not supported.
-            FileNotFoundError: _description_
-            FileNotFoundError: _description_
+            FileNotFoundError: When the file is not found and `notFoundRaise` is True.
 
         Return:
-            Path: The path of exported file.
+            singleColCSV: The values read.
         """
+        if dtype is not None:
+            return typedSingleColCSV.read(
+                name=name,
+                saveLocation=saveLocation,
+                secondFilenameExt=secondFilenameExt,
+                dtype=dtype,
+                openArgs=openArgs,
+                printArgs=printArgs,
+                whichNum=whichNum,
+                notFoundRaise=notFoundRaise,
+                session=session,
+            )
 
         args = cls.paramsControl(
             openArgs=openArgs,
             printArgs=printArgs,
             saveLocation=saveLocation,
             isReadOnly=True,
-        )
-        printArgs = args.printArgs
+        ) if session is None else session.params(cls, isReadOnly=True)
         openArgs = args.openArgs
         saveLocation = args.saveLocation
 
-        secondFilenameExt = cls.__name__ if secondFilenameExt is None else f"{secondFilenameExt}"
+        secondFilenameExt = cls.__dict__['__name__'] if secondFilenameExt is None else f"{secondFilenameExt}"
+        target = cls._locate(
+            name, saveLocation, secondFilenameExt, whichNum, notFoundRaise)
+        obj = cls(name=secondFilenameExt)
+        if target is None:
+            return obj
 
-        lsLoc1 = glob.glob(str(saveLocation / f"*.{secondFilenameExt}.*"))
-        if len(lsLoc1) == 0:
-            if notFoundRaise:
-                raise FileNotFoundError(
-                    f"The file '*.{secondFilenameExt}.*' not found at '{saveLocation}'.")
-            else:
-                return cls(name=name)
+        opener = None if session is None else session.opener
+        with open(target, **openArgs, newline='', opener=opener) as ReadCsv:
+            taglistReaper = csv.reader(ReadCsv, quotechar='|')
+            obj.extend(v[0] for v in taglistReaper)
 
-        lsLoc2 = [f for f in lsLoc1] if name is None else [
-            f for f in lsLoc1 if name in f]
+        return obj
 
-        if len(lsLoc2) < 1:
-            if notFoundRaise:
-                raise FileNotFoundError(
-                    f"The file '{name}.'" + f"{secondFilenameExt}.csv"+f" not found at '{saveLocation}'.")
+
+_arrayTypecodes = {
+    'int8': 'b',
+    'uint8': 'B',
+    'int16': 'h',
+    'uint16': 'H',
+    'int32': 'i',
+    'uint32': 'I',
+    'int64': 'q',
+    'uint64': 'Q',
+    'float32': 'f',
+    'float64': 'd',
+}
+_bytesDtype = re.compile(r'^(?:S|bytes)(\d+)$')
+
+
+class _fixedBytes:
+    """Fixed-width bytes packed in one :cls:`bytearray`, 
+    the values are padded with NUL and stripped when taken out like numpy."""
+
+    def __init__(
+        self,
+        width: int,
+        values: Iterable[bytes] = (),
+    ) -> None:
+        if width < 1:
+            raise ValueError("The width of bytes needs to be positive.")
+        self.width = width
+        self.buffer = bytearray()
+        self.extend(values)
+
+    def _pack(self, value: Union[bytes, str]) -> bytes:
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        if len(value) > self.width:
+            raise ValueError(
+                f"The value '{value}' is longer than {self.width} bytes.")
+        return value.ljust(self.width, b'\0')
+
+    def __len__(self) -> int:
+        return len(self.buffer) // self.width
+
+    def _index(self, i: int) -> int:
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("index out of range")
+        return i * self.width
+
+    def __getitem__(self, i: int) -> bytes:
+        start = self._index(i)
+        return bytes(self.buffer[start:start+self.width]).rstrip(b'\0')
+
+    def __setitem__(self, i: int, value: bytes) -> None:
+        start = self._index(i)
+        self.buffer[start:start+self.width] = self._pack(value)
+
+    def __delitem__(self, i: int) -> None:
+        start = self._index(i)
+        del self.buffer[start:start+self.width]
+
+    def insert(self, i: int, value: bytes) -> None:
+        i = max(0, min(len(self), i if i >= 0 else len(self)+i))
+        start = i * self.width
+        self.buffer[start:start] = self._pack(value)
+
+    def append(self, value: bytes) -> None:
+        self.buffer += self._pack(value)
+
+    def extend(self, values: Iterable[bytes]) -> None:
+        self.buffer += b''.join(map(self._pack, values))
+
+    def __iter__(self) -> Iterator[bytes]:
+        width = self.width
+        view = bytes(self.buffer)
+        for start in range(0, len(view), width):
+            yield view[start:start+width].rstrip(b'\0')
+
+    @property
+    def itemsize(self) -> int:
+        return self.width
+
+
+def _makeStorage(
+    dtype: str,
+    values: Iterable[Any] = (),
+) -> Union[array.array, _fixedBytes]:
+    if dtype in _arrayTypecodes:
+        return array.array(_arrayTypecodes[dtype], values)
+    matched = _bytesDtype.match(dtype)
+    if matched:
+        return _fixedBytes(int(matched.group(1)), values)
+    raise ValueError(
+        f"Instead of '{dtype}', only {list(_arrayTypecodes)} or 'S<width>' can be used.")
+
+
+class typedSingleColCSV(MutableSequence):
+    __version__ = (0, 1, 0)
+    __name__ = 'singleCol'
+
+    """A single column of numbers or fixed-width bytes kept in a typed array,
+    with the list-like API and the exportation of :cls:`singleColCSV`.
+
+    >>> ids = typedSingleColCSV(range(10**7), dtype='int64')
+    >>> ids.export(name='jobIds', saveLocation='./')
+    >>> ids = singleColCSV.read('jobIds', secondFilenameExt='singleCol', dtype='int64')
+
+    Args:
+        dtype (str): 
+            One of 'int8', 'uint8', 'int16', 'uint16', 'int32', 'uint32', 
+            'int64', 'uint64', 'float32', 'float64', or 'S<width>' for bytes.
+    """
+
+    def __init__(
+        self,
+        values: Iterable[Any] = (),
+        dtype: str = 'int64',
+        name: str = 'untitled',
+    ) -> None:
+        self.dtype = dtype
+        self.name = name
+        self.data = _makeStorage(dtype, values)
+
+    @property
+    def isNumeric(self) -> bool:
+        return self.dtype in _arrayTypecodes
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data) * self.data.itemsize
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return type(self)(
+                (self.data[j] for j in range(*i.indices(len(self)))),
+                dtype=self.dtype, name=self.name)
+        return self.data[i]
+
+    def __setitem__(self, i, value) -> None:
+        if isinstance(i, slice):
+            values = list(self)
+            values[i] = value
+            self.data = _makeStorage(self.dtype, values)
+        else:
+            self.data[i] = value
+
+    def __delitem__(self, i) -> None:
+        if isinstance(i, slice):
+            values = list(self)
+            del values[i]
+            self.data = _makeStorage(self.dtype, values)
+        else:
+            del self.data[i]
+
+    def insert(self, i: int, value: Any) -> None:
+        self.data.insert(i, value)
+
+    def append(self, value: Any) -> None:
+        self.data.append(value)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        self.data.extend(values)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.data)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, typedSingleColCSV):
+            return self.dtype == other.dtype and self.data == other.data
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)}, dtype='{self.dtype}')"
+
+    def tolist(self) -> list[Any]:
+        return list(self.data)
+
+    def export(
+        self,
+        name: Optional[str] = 'untitled',
+        saveLocation: Union[Path, str] = Path('./'),
+        secondFilenameExt: Optional[str] = None,
+
+        openArgs: dict = singleColCSV.defaultOpenArgs,
+        printArgs: dict = singleColCSV.defaultPrintArgs,
+        chunkSize: int = 100000,
+        session: Optional[ExportSession] = None,
+    ) -> Path:
+        """Export as the same file of :meth:`singleColCSV.export`.
+
+        Args:
+            name (str, optional): Name for this `singleColCSV`. Defaults to 'untitled'.
+            saveLocation (Path): The location of file.
+            secondFilenameExt (Optional[str], optional):
+            openArgs (dict, optional): 
+                The other arguments for :func:`open` function.
+                Defaults to :attr:`singleColCSV.defaultOpenArgs`.
+            printArgs (dict, optional): 
+                The other arguments for :func:`print` function.
+                Defaults to :attr:`singleColCSV.defaultPrintArgs`.
+            chunkSize (int, optional): The number of values written at once. Defaults to 100000.
+            session (Optional[ExportSession], optional):
+                The session of validated arguments used instead of
+                `saveLocation`, `openArgs` and `printArgs`. Defaults to None.
+
+        Return:
+            Path: The path of exported file.
+        """
+
+        args = singleColCSV.paramsControl(
+            openArgs=openArgs,
+            printArgs=printArgs,
+            saveLocation=saveLocation,
+        ) if session is None else session.params(singleColCSV)
+        openArgs = args.openArgs
+        saveLocation = args.saveLocation
+
+        if name is None:
+            name = self.name
+
+        filename = name + "." + (
+            self.__name__ if secondFilenameExt is None else f"{secondFilenameExt}"
+        ) + ".csv"
+
+        opener = None if session is None else session.opener
+        with open(saveLocation / filename, **openArgs, newline='', opener=opener) as ExportCsv:
+            if self.isNumeric:
+                for start in range(0, len(self.data), chunkSize):
+                    ExportCsv.write(''.join(
+                        f"{v}\r\n" for v in self.data[start:start+chunkSize]))
             else:
-                return cls(name=secondFilenameExt)
-        elif len(lsLoc2) > 1:
-            lsLoc2 = [lsLoc2[whichNum]]
-            print(
-                f"The following files '{lsLoc2}' are fitting giving 'name' and 'additionName', choosing the '{lsLoc2[0]}'.")
+                encoding = openArgs.get('encoding', 'utf-8')
+                taglistWriter = csv.writer(ExportCsv, quotechar='|')
+                taglistWriter.writerows(
+                    (v.decode(encoding), ) for v in self.data)
 
-        filename = lsLoc2[0]
-        filename = Path(filename).name
-        obj = None
+        return saveLocation / filename
 
-        with open(saveLocation / filename, **openArgs, newline='') as ReadCsv:
+    @classmethod
+    def _parseChunks(
+        cls,
+        ReadCsv,
+        dtype: str,
+        encoding: str,
+        chunkSize: int,
+    ) -> Iterator[Union[array.array, _fixedBytes]]:
+        if dtype in _arrayTypecodes:
+            parse = float if dtype.startswith('float') else int
+            while True:
+                lines = list(itertools.islice(ReadCsv, chunkSize))
+                if len(lines) == 0:
+                    return
+                yield _makeStorage(dtype, map(parse, lines))
+        else:
             taglistReaper = csv.reader(ReadCsv, quotechar='|')
-            obj = cls(
-                taglistReaper,
-                name=secondFilenameExt,
-            )
-            obj = [v[0] for v in obj]
+            while True:
+                chunk = [
+                    v[0].encode(encoding)
+                    for v in itertools.islice(taglistReaper, chunkSize)]
+                if len(chunk) == 0:
+                    return
+                yield _makeStorage(dtype, chunk)
+
+    @classmethod
+    def iter_read(
+        cls,
+        name: str,
+        saveLocation: Union[Path, str] = Path('./'),
+        secondFilenameExt: Optional[str] = None,
+        dtype: str = 'int64',
+
+        openArgs: dict = singleColCSV.defaultOpenArgs,
+        printArgs: dict = singleColCSV.defaultPrintArgs,
+        whichNum: int = 0,
+        notFoundRaise: bool = True,
+        chunkSize: int = 100000,
+        session: Optional[ExportSession] = None,
+    ) -> Iterator[Union[array.array, _fixedBytes]]:
+        """Read the file of `singleColCSV` by chunks of typed arrays.
+
+        Args:
+            name (str, optional): Name for this `singleColCSV`.
+            saveLocation (Path): The location of file.
+            secondFilenameExt (Optional[str], optional):
+            dtype (str, optional): The type of values. Defaults to 'int64'.
+            openArgs (dict, optional): 
+                The other arguments for :func:`open` function.
+                Defaults to :attr:`singleColCSV.defaultOpenArgs`.
+            printArgs (dict, optional): 
+                The other arguments for :func:`print` function.
+                Defaults to :attr:`singleColCSV.defaultPrintArgs`.
+            chunkSize (int, optional): The number of values in each chunk. Defaults to 100000.
+            session (Optional[ExportSession], optional):
+                The session of validated arguments used instead of
+                `saveLocation`, `openArgs` and `printArgs`. Defaults to None.
 
+        Yields:
+            Union[array.array, _fixedBytes]: The values in chunk.
+        """
+
+        args = singleColCSV.paramsControl(
+            openArgs=openArgs,
+            printArgs=printArgs,
+            saveLocation=saveLocation,
+            isReadOnly=True,
+        ) if session is None else session.params(singleColCSV, isReadOnly=True)
+        openArgs = args.openArgs
+        saveLocation = args.saveLocation
+
+        secondFilenameExt = cls.__dict__['__name__'] if secondFilenameExt is None else f"{secondFilenameExt}"
+        target = singleColCSV._locate(
+            name, saveLocation, secondFilenameExt, whichNum, notFoundRaise)
+        if target is None:
+            return
+
+        opener = None if session is None else session.opener
+        with open(target, **openArgs, newline='', opener=opener) as ReadCsv:
+            yield from cls._parseChunks(
+                ReadCsv, dtype, openArgs.get('encoding', 'utf-8'), chunkSize)
+
+    @classmethod
+    def read(
+        cls,
+        name: str,
+        saveLocation: Union[Path, str] = Path('./'),
+        secondFilenameExt: Optional[str] = None,
+        dtype: str = 'int64',
+
+        openArgs: dict = singleColCSV.defaultOpenArgs,
+        printArgs: dict = singleColCSV.defaultPrintArgs,
+        whichNum: int = 0,
+        notFoundRaise: bool = True,
+        chunkSize: int = 100000,
+        session: Optional[ExportSession] = None,
+    ):
+        """Read the file of `singleColCSV` into a typed array.
+
+        Args:
+            name (str, optional): Name for this `singleColCSV`.
+            saveLocation (Path): The location of file.
+            secondFilenameExt (Optional[str], optional):
+            dtype (str, optional): The type of values. Defaults to 'int64'.
+            openArgs (dict, optional): 
+                The other arguments for :func:`open` function.
+                Defaults to :attr:`singleColCSV.defaultOpenArgs`.
+            printArgs (dict, optional): 
+                The other arguments for :func:`print` function.
+                Defaults to :attr:`singleColCSV.defaultPrintArgs`.
+            chunkSize (int, optional): The number of values parsed at once. Defaults to 100000.
+            session (Optional[ExportSession], optional):
+                The session of validated arguments used instead of
+                `saveLocation`, `openArgs` and `printArgs`. Defaults to None.
+
+        Return:
+            typedSingleColCSV: The values read.
+        """
+        secondFilenameExt = cls.__dict__['__name__'] if secondFilenameExt is None else f"{secondFilenameExt}"
+        obj = cls(dtype=dtype, name=secondFilenameExt)
+        for chunk in cls.iter_read(
+            name=name,
+            saveLocation=saveLocation,
+            secondFilenameExt=secondFilenameExt,
+            dtype=dtype,
+            openArgs=openArgs,
+            printArgs=printArgs,
+            whichNum=whichNum,
+            notFoundRaise=notFoundRaise,
+            chunkSize=chunkSize,
+            session=session,
+        ):
+            if isinstance(chunk, array.array):
+                obj.data.extend(chunk)
+            else:
+                obj.data.buffer += chunk.buffer
         return obj
 
 
-# class matrixCSV(list):
-#     """_summary_
+_columnParsers = {
+    'str': str,
+    'int': int,
+    'float': float,
+    'bool': lambda v: v in ('True', 'true', '1'),
+    **{k: (float if k.startswith('float') else int) for k in _arrayTypecodes},
+}
+
+
+def _columnParser(dtype: Union[str, Callable[[str], Any], None]) -> Callable[[str], Any]:
+    if dtype is None:
+        return str
+    if callable(dtype):
+        return dtype
+    if dtype in _columnParsers:
+        return _columnParsers[dtype]
+    raise ValueError(
+        f"Instead of '{dtype}', only {list(_columnParsers)} or a callable can be used.")
+
+
+class matrixCSVWriter:
+    """Append rows to the file of :cls:`matrixCSV`, written by buffered `writerows`.
+
+    >>> with matrixCSV.writer('results.', columns=['shot', 'fidelity']) as writer:
+    ...     for shot in range(10**8):
+    ...         writer.append((shot, run(shot)))
+
+    """
+
+    def __init__(
+        self,
+        target: Path,
+        columns: tuple[str, ...],
+        openArgs: dict,
+        bufferSize: int = 10000,
+        opener: Optional[Callable[[str, int], int]] = None,
+    ) -> None:
+        self.target = target
+        self.columns = columns
+        self.bufferSize = bufferSize
+        self.count = 0
+
+        writeHeader = not (
+            'a' in openArgs['mode'] and
+            target.exists() and target.stat().st_size > 0)
+        self._file = open(target, **openArgs, newline='', opener=opener)
+        self._writer = csv.writer(self._file, quotechar='|')
+        self._buffer: list[tuple] = []
+        if writeHeader:
+            self._writer.writerow(columns)
+
+    def append(self, row: Iterable[Any]) -> None:
+        row = tuple(row)
+        if len(row) != len(self.columns):
+            raise ValueError(
+                f"The row has {len(row)} values, but there are {len(self.columns)} columns.")
+        self._buffer.append(row)
+        if len(self._buffer) >= self.bufferSize:
+            self.flush()
+
+    def extend(self, rows: Iterable[Iterable[Any]]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def flush(self) -> None:
+        if len(self._buffer) > 0:
+            self._writer.writerows(self._buffer)
+            self.count += len(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
 
-#     Args:
-#         list (_type_): _description_
-#     """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class matrixCSV(list[tuple]):
+    __version__ = (0, 1, 0)
+    __name__ = 'matrix'
+
+    """Rows of named columns, exported as csv with a header row.
+
+    >>> table = matrixCSV(columns=['shot', 'fidelity'], dtypes={'shot': 'int', 'fidelity': 'float'})
+    >>> table.append((0, 0.98))
+    >>> table.export(name='results')
+    >>> fidelity = matrixCSV.read('results', columns=['fidelity'], dtypes={'fidelity': 'float'})
+
+    Args:
+        list ([type]): The rows.
+    """
+
+    def __init__(
+        self,
+        *args,
+        columns: Iterable[str] = (),
+        dtypes: dict[str, Union[str, Callable[[str], Any]]] = {},
+        name: str = 'untitled',
+        **kwargs,
+    ) -> None:
+
+        super().__init__(*args, **kwargs)
+        self.columns = tuple(columns)
+        self.dtypes = {k: v for k, v in dtypes.items() if k in self.columns}
+        self.name = name
+
+    defaultOpenArgs = singleColCSV.defaultOpenArgs
+    defaultPrintArgs = singleColCSV.defaultPrintArgs
+    params = singleColCSV.params
+    paramsControl = classmethod(singleColCSV.paramsControl.__func__)
+
+    def column(self, key: str) -> list[Any]:
+        """Values of a column."""
+        i = self.columns.index(key)
+        return [row[i] for row in self]
+
+    @classmethod
+    def _filename(
+        cls,
+        name: str,
+        secondFilenameExt: Optional[str] = None,
+    ) -> str:
+        return name + "." + (
+            cls.__dict__['__name__'] if secondFilenameExt is None else f"{secondFilenameExt}"
+        ) + ".csv"
+
+    def export(
+        self,
+        name: Optional[str] = 'untitled',
+        saveLocation: Union[Path, str] = Path('./'),
+        secondFilenameExt: Optional[str] = None,
+
+        openArgs: dict = defaultOpenArgs,
+        printArgs: dict = defaultPrintArgs,
+        session: Optional[ExportSession] = None,
+    ) -> Path:
+        """Export `matrixCSV` with a header row of columns.
+
+        Args:
+            name (str, optional): 
+                Name for this `matrixCSV`.
+                Defaults to 'untitled'.
+            saveLocation (Path): The location of file.
+            secondFilenameExt (Optional[str], optional):
+            openArgs (dict, optional): 
+                The other arguments for :func:`open` function.
+                Defaults to :attr:`self.defaultOpenArgs`.
+            printArgs (dict, optional): 
+                The other arguments for :func:`print` function.
+                Defaults to :attr:`self.defaultPrintArgs`.
+            session (Optional[ExportSession], optional):
+                The session of validated arguments used instead of
+                `saveLocation`, `openArgs` and `printArgs`. Defaults to None.
+
+        Return:
+            Path: The path of exported file.
+        """
+
+        args = self.paramsControl(
+            openArgs=openArgs,
+            printArgs=printArgs,
+            saveLocation=saveLocation,
+        ) if session is None else session.params(type(self))
+        openArgs = args.openArgs
+        saveLocation = args.saveLocation
+
+        if name is None:
+            name = self.name
+        filename = self._filename(name, secondFilenameExt)
+
+        opener = None if session is None else session.opener
+        with open(saveLocation / filename, **openArgs, newline='', opener=opener) as ExportCsv:
+            matrixWriter = csv.writer(ExportCsv, quotechar='|')
+            matrixWriter.writerow(self.columns)
+            matrixWriter.writerows(self)
+
+        return saveLocation / filename
+
+    @classmethod
+    def writer(
+        cls,
+        name: str = 'untitled',
+        columns: Iterable[str] = (),
+        saveLocation: Union[Path, str] = Path('./'),
+        secondFilenameExt: Optional[str] = None,
+
+        openArgs: dict = defaultOpenArgs,
+        printArgs: dict = defaultPrintArgs,
+        bufferSize: int = 10000,
+        session: Optional[ExportSession] = None,
+    ) -> matrixCSVWriter:
+        """Open a writer to append rows without holding them, 
+        the header is skipped when appending to a non-empty file by mode 'a'.
+
+        Args:
+            name (str, optional): Name for this `matrixCSV`. Defaults to 'untitled'.
+            columns (Iterable[str]): The columns.
+            saveLocation (Path): The location of file.
+            secondFilenameExt (Optional[str], optional):
+            openArgs (dict, optional): 
+                The other arguments for :func:`open` function.
+                Defaults to :attr:`self.defaultOpenArgs`.
+            printArgs (dict, optional): 
+                The other arguments for :func:`print` function.
+                Defaults to :attr:`self.defaultPrintArgs`.
+            bufferSize (int, optional): The number of rows written at once. Defaults to 10000.
+            session (Optional[ExportSession], optional):
+                The session of validated arguments used instead of
+                `saveLocation`, `openArgs` and `printArgs`. Defaults to None.
+
+        Returns:
+            matrixCSVWriter: The writer.
+        """
+        args = cls.paramsControl(
+            openArgs=openArgs,
+            printArgs=printArgs,
+            saveLocation=saveLocation,
+        ) if session is None else session.params(cls)
+        return matrixCSVWriter(
+            target=args.saveLocation / cls._filename(name, secondFilenameExt),
+            columns=tuple(columns),
+            openArgs=args.openArgs,
+            bufferSize=bufferSize,
+            opener=None if session is None else session.opener,
+        )
+
+    @classmethod
+    def iter_read(
+        cls,
+        name: str,
+        saveLocation: Union[Path, str] = Path('./'),
+        secondFilenameExt: Optional[str] = None,
+        columns: Optional[Iterable[str]] = None,
+        dtypes: dict[str, Union[str, Callable[[str], Any]]] = {},
+
+        openArgs: dict = defaultOpenArgs,
+        printArgs: dict = defaultPrintArgs,
+        whichNum: int = 0,
+        notFoundRaise: bool = True,
+        chunkSize: int = 100000,
+        columnar: bool = False,
+        session: Optional[ExportSession] = None,
+    ) -> Iterator[Union[list[tuple], dict[str, list[Any]]]]:
+        """Read `matrixCSV` by chunks, only the requested columns are taken and parsed.
+
+        Args:
+            name (str, optional): Name for this `matrixCSV`.
+            saveLocation (Path): The location of file.
+            secondFilenameExt (Optional[str], optional):
+            columns (Optional[Iterable[str]], optional): The columns to read. Defaults to None as all.
+            dtypes (dict[str, Union[str, Callable]], optional): 
+                The types of columns, like 'int', 'float', 'bool', 'int64' or a callable for parsing. 
+                Defaults to {} as strings.
+            openArgs (dict, optional): 
+                The other arguments for :func:`open` function.
+                Defaults to :attr:`self.defaultOpenArgs`.
+            printArgs (dict, optional): 
+                The other arguments for :func:`print` function.
+                Defaults to :attr:`self.defaultPrintArgs`.
+            chunkSize (int, optional): The number of rows in each chunk. Defaults to 100000.
+            columnar (bool, optional): Yield dictionaries of columns instead of rows. Defaults to False.
+            session (Optional[ExportSession], optional):
+                The session of validated arguments used instead of
+                `saveLocation`, `openArgs` and `printArgs`. Defaults to None.
+
+        Raises:
+            FileNotFoundError: When the file is not found and `notFoundRaise` is True.
+            KeyError: When a requested column is not in the file.
+
+        Yields:
+            Union[list[tuple], dict[str, list[Any]]]: The rows, or the columns in chunk.
+        """
+        args = cls.paramsControl(
+            openArgs=openArgs,
+            printArgs=printArgs,
+            saveLocation=saveLocation,
+            isReadOnly=True,
+        ) if session is None else session.params(cls, isReadOnly=True)
+        openArgs = args.openArgs
+        saveLocation = args.saveLocation
+
+        secondFilenameExt = cls.__dict__['__name__'] if secondFilenameExt is None else f"{secondFilenameExt}"
+        target = singleColCSV._locate(
+            name, saveLocation, secondFilenameExt, whichNum, notFoundRaise)
+        if target is None:
+            return
+
+        opener = None if session is None else session.opener
+        with open(target, **openArgs, newline='', opener=opener) as ReadCsv:
+            matrixReaper = csv.reader(ReadCsv, quotechar='|')
+            header = next(matrixReaper, None)
+            if header is None:
+                return
+            columns = header if columns is None else list(columns)
+            missing = [k for k in columns if k not in header]
+            if len(missing) > 0:
+                raise KeyError(f"The columns {missing} are not in '{target}'.")
+
+            indices = [header.index(k) for k in columns]
+            parsers = [_columnParser(dtypes.get(k, None)) for k in columns]
+            while True:
+                rows = list(itertools.islice(matrixReaper, chunkSize))
+                if len(rows) == 0:
+                    return
+                if len(indices) == 1:
+                    i = indices[0]
+                    values = [[row[i] for row in rows]]
+                else:
+                    values = list(zip(*map(operator.itemgetter(*indices), rows)))
+                values = [
+                    v if parse is str else list(map(parse, v))
+                    for parse, v in zip(parsers, values)
+                ]
+                if columnar:
+                    yield dict(zip(columns, values))
+                else:
+                    yield list(zip(*values))
+
+    @classmethod
+    def read(
+        cls,
+        name: str,
+        saveLocation: Union[Path, str] = Path('./'),
+        secondFilenameExt: Optional[str] = None,
+        columns: Optional[Iterable[str]] = None,
+        dtypes: dict[str, Union[str, Callable[[str], Any]]] = {},
+
+        openArgs: dict = defaultOpenArgs,
+        printArgs: dict = defaultPrintArgs,
+        whichNum: int = 0,
+        notFoundRaise: bool = True,
+        chunkSize: int = 100000,
+        session: Optional[ExportSession] = None,
+    ):
+        """Read `matrixCSV`, only the requested columns are taken and parsed.
+
+        Args:
+            name (str, optional): Name for this `matrixCSV`.
+            saveLocation (Path): The location of file.
+            secondFilenameExt (Optional[str], optional):
+            columns (Optional[Iterable[str]], optional): The columns to read. Defaults to None as all.
+            dtypes (dict[str, Union[str, Callable]], optional): 
+                The types of columns, like 'int', 'float', 'bool', 'int64' or a callable for parsing. 
+                Defaults to {} as strings.
+            openArgs (dict, optional): 
+                The other arguments for :func:`open` function.
+                Defaults to :attr:`self.defaultOpenArgs`.
+            printArgs (dict, optional): 
+                The other arguments for :func:`print` function.
+                Defaults to :attr:`self.defaultPrintArgs`.
+            chunkSize (int, optional): The number of rows parsed at once. Defaults to 100000.
+            session (Optional[ExportSession], optional):
+                The session of validated arguments used instead of
+                `saveLocation`, `openArgs` and `printArgs`. Defaults to None.
+
+        Return:
+            matrixCSV: The rows read.
+        """
+        secondFilenameExt = cls.__dict__['__name__'] if secondFilenameExt is None else f"{secondFilenameExt}"
+        args = cls.paramsControl(
+            openArgs=openArgs,
+            printArgs=printArgs,
+            saveLocation=saveLocation,
+            isReadOnly=True,
+        ) if session is None else session.params(cls, isReadOnly=True)
+        target = singleColCSV._locate(
+            name, args.saveLocation, secondFilenameExt, whichNum, notFoundRaise)
+        if columns is None and target is not None:
+            opener = None if session is None else session.opener
+            with open(target, **args.openArgs, newline='', opener=opener) as ReadCsv:
+                columns = next(csv.reader(ReadCsv, quotechar='|'), [])
+
+        obj = cls(
+            columns=[] if columns is None else columns,
+            dtypes=dtypes,
+            name=secondFilenameExt,
+        )
+        if target is None:
+            return obj
+        for chunk in cls.iter_read(
+            name=name,
+            saveLocation=saveLocation,
+            secondFilenameExt=secondFilenameExt,
+            columns=obj.columns,
+            dtypes=dtypes,
+            openArgs=openArgs,
+            printArgs=printArgs,
+            whichNum=whichNum,
+            notFoundRaise=notFoundRaise,
+            chunkSize=chunkSize,
+            session=session,
+        ):
+            obj.extend(chunk)
+        return obj
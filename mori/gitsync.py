@@ -1,16 +1,373 @@
 import os
+import re
+import hashlib
+import fnmatch
 from pathlib import Path
-from typing import Union
+from typing import Union, Iterable, Optional, NamedTuple, SupportsIndex
+from collections import Counter
+
+from ..atomicwrite import atomicWrite
+
+
+def _translateSegment(segment: str) -> str:
+    """Translate a segment of .gitignore pattern between slashes to regular expression."""
+    result = ''
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == '*':
+            result += '[^/]*'
+        elif c == '?':
+            result += '[^/]'
+        elif c == '\\' and i < n:
+            result += re.escape(segment[i])
+            i += 1
+        elif c == '[':
+            j = i
+            if j < n and segment[j] in '!^':
+                j += 1
+            if j < n and segment[j] == ']':
+                j += 1
+            while j < n and segment[j] != ']':
+                j += 1
+            if j >= n:
+                result += '\\['
+            else:
+                stuff = segment[i:j].replace('\\', '\\\\')
+                i = j+1
+                if stuff[0] in '!^':
+                    stuff = '^'+stuff[1:]
+                result += f'(?!/)[{stuff}]'
+        else:
+            result += re.escape(c)
+    return result
+
+
+class _gitignoreRule(NamedTuple):
+    pattern: str
+    negate: bool
+    dirOnly: bool
+    anchored: bool
+    literal: bool
+
+
+def _parseRule(line: str) -> Optional[_gitignoreRule]:
+    """Parse a line of .gitignore, return None for blank lines and comments."""
+    line = line.rstrip('\n\r')
+    stripped = line.rstrip(' ')
+    if stripped.endswith('\\') and len(stripped) < len(line):
+        stripped += ' '
+    line = stripped
+    if line == '' or line.startswith('#'):
+        return None
+
+    negate = line.startswith('!')
+    if negate:
+        line = line[1:]
+    elif line.startswith('\\!') or line.startswith('\\#'):
+        line = line[1:]
+
+    dirOnly = line.endswith('/')
+    line = line.rstrip('/')
+    if line == '':
+        return None
+    anchored = '/' in line
+    line = line.lstrip('/')
+    literal = re.search(r'[*?\[\\]', line) is None
+
+    return _gitignoreRule(line, negate, dirOnly, anchored, literal)
+
+
+def _ruleRegex(rule: _gitignoreRule) -> str:
+    parts = rule.pattern.split('/')
+    last = len(parts) - 1
+    result = ''
+    for i, part in enumerate(parts):
+        if part == '**':
+            result += '.*' if i == last else '(?:.*/)?'
+        else:
+            result += _translateSegment(part) + ('' if i == last else '/')
+    return result if rule.anchored else '(?:.*/)?' + result
+
+
+class _gitignoreMatcher:
+    """Rules of .gitignore compiled for querying many paths.
+
+    Rules without wildcards are looked up in dictionaries, the others are
+    joined into one regular expression in reversed order, so the first
+    alternative matched is the last rule which matches, as the last matched
+    rule decides in .gitignore.
+    """
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        self.negates: list[bool] = []
+        # [anchored][dirOnly] -> {pattern: last rule index}
+        self.literals = {
+            (anchored, dirOnly): {}
+            for anchored in (True, False) for dirOnly in (True, False)
+        }
+        regexes: dict[bool, list[str]] = {True: [], False: []}
+
+        for line in lines:
+            rule = _parseRule(line)
+            if rule is None:
+                continue
+            idx = len(self.negates)
+            self.negates.append(rule.negate)
+            if rule.literal:
+                self.literals[(rule.anchored, rule.dirOnly)][rule.pattern] = idx
+            else:
+                regexes[rule.dirOnly].append(
+                    f'(?P<r{idx}>{_ruleRegex(rule)})')
+
+        self.regexes = {
+            dirOnly: re.compile('|'.join(reversed(rs)), re.DOTALL)
+            if len(rs) > 0 else None
+            for dirOnly, rs in regexes.items()
+        }
+        self._dirCache: dict[str, bool] = {}
+
+    def _lastRule(self, path: str, isDir: bool) -> int:
+        basename = path.rsplit('/', 1)[-1]
+        found = -1
+        for dirOnly in ((False, True) if isDir else (False, )):
+            found = max(
+                found,
+                self.literals[(True, dirOnly)].get(path, -1),
+                self.literals[(False, dirOnly)].get(basename, -1),
+            )
+            regex = self.regexes[dirOnly]
+            if regex is not None:
+                matched = regex.fullmatch(path)
+                if matched:
+                    found = max(found, int(matched.lastgroup[1:]))
+        return found
+
+    def _matchOne(self, path: str, isDir: bool) -> bool:
+        idx = self._lastRule(path, isDir)
+        return idx >= 0 and not self.negates[idx]
+
+    def ignored(self, path: str, isDir: bool = False) -> bool:
+        """Whether the path is ignored, a path under an ignored directory is ignored."""
+        end = path.find('/')
+        while end != -1:
+            parent = path[:end]
+            parentIgnored = self._dirCache.get(parent, None)
+            if parentIgnored is None:
+                parentIgnored = self._matchOne(parent, True)
+                self._dirCache[parent] = parentIgnored
+            if parentIgnored:
+                return True
+            end = path.find('/', end+1)
+        return self._matchOne(path, isDir)
+
+
+def _escapeName(name: str) -> str:
+    """Escape a file name to be a literal in .gitignore."""
+    name = re.sub(r'([*?\[\\])', r'\\\1', name)
+    if name.endswith(' '):
+        name = name[:-1] + '\\ '
+    return name
+
+
+def _walkTree(
+    path: str,
+    rel: str,
+    pattern: str,
+    collapse: bool,
+    top: bool = False,
+) -> tuple[bool, list[tuple[str, str]]]:
+    """Walk a directory, return whether every file under it matches the pattern and the rules.
+
+    A rule is `('file', path)`, `('glob', path)` or `('dir', path)` relative to the walking root.
+    """
+    files = []
+    subdirs = []
+    allSelected = True
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry)
+            elif fnmatch.fnmatchcase(entry.name, pattern):
+                files.append(entry.name)
+            else:
+                allSelected = False
+
+    subResults = []
+    for entry in sorted(subdirs, key=lambda e: e.name):
+        subFull, subRules = _walkTree(
+            entry.path, rel+_escapeName(entry.name)+'/', pattern, collapse)
+        subResults.append((entry.name, subFull, subRules))
+        allSelected = allSelected and subFull
+
+    if (
+        collapse and not top and allSelected and
+        (len(files) > 0 or len(subResults) > 0)
+    ):
+        return True, []
+
+    rules = []
+    for name, subFull, subRules in subResults:
+        if subFull:
+            rules.append(('dir', rel+_escapeName(name)))
+        else:
+            rules += subRules
+    if (
+        collapse and len(files) > 1 and '/' not in pattern and
+        not any(fnmatch.fnmatchcase(e.name, pattern) for e in subdirs)
+    ):
+        rules.append(('glob', rel+pattern))
+    else:
+        rules += [('file', rel+_escapeName(name)) for name in sorted(files)]
+
+    return False, rules
+
+
+def _normalizePath(path: Union[Path, str]) -> tuple[str, bool]:
+    if isinstance(path, Path):
+        path = path.as_posix()
+    elif os.sep != '/':
+        path = path.replace(os.sep, '/')
+    isDir = path.endswith('/')
+    while path.startswith('./'):
+        path = path[2:]
+    return path.strip('/'), isDir
+
+
+def _textBytes(text: str, openArgs: dict) -> bytes:
+    """The bytes written by :func:`open` in text mode with `openArgs`."""
+    newline = openArgs.get('newline', None)
+    newline = os.linesep if newline is None else newline
+    if newline not in ('', '\n'):
+        text = text.replace('\n', newline)
+    return text.encode(
+        openArgs.get('encoding', None) or 'utf-8', openArgs.get('errors', None) or 'strict')
 
 
 class syncControl(list[str]):
-    __version__ = (0, 3, 1)
+    __version__ = (0, 4, 0)
     """A quick way to create .gitignore
 
+    A counter of lines is kept beside the list, so checking whether a line
+    is already added costs O(1).
+
     Args:
         list ([type]): The list of ignored items.
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._index = Counter(self)
+        self._matcher = None
+
+    def _changed(self) -> None:
+        self._matcher = None
+
+    def _indexed(self) -> Counter:
+        if '_index' not in self.__dict__:
+            self._index = Counter(list.__iter__(self))
+        return self._index
+
+    def _reindex(self) -> None:
+        self._index = Counter(list.__iter__(self))
+        self._changed()
+
+    def _discard(self, item: str) -> None:
+        index = self._indexed()
+        index[item] -= 1
+        if index[item] <= 0:
+            del index[item]
+        self._changed()
+
+    def __getstate__(self) -> dict:
+        return {
+            k: v for k, v in self.__dict__.items()
+            if k not in ('_index', '_matcher', '_exportCache')
+        }
+
+    def __contains__(self, item: object) -> bool:
+        try:
+            return self._indexed()[item] > 0
+        except TypeError:
+            return super().__contains__(item)
+
+    def count(self, item: object) -> int:
+        try:
+            return self._indexed()[item]
+        except TypeError:
+            return super().count(item)
+
+    def append(self, item: str) -> None:
+        index = self._indexed()
+        super().append(item)
+        index[item] += 1
+        self._changed()
+
+    def extend(self, items: Iterable[str]) -> None:
+        index = self._indexed()
+        items = list(items)
+        super().extend(items)
+        index.update(items)
+        self._changed()
+
+    def __iadd__(self, items: Iterable[str]):
+        self.extend(items)
+        return self
+
+    def __imul__(self, n: int):
+        super().__imul__(n)
+        self._reindex()
+        return self
+
+    def insert(self, i: SupportsIndex, item: str) -> None:
+        index = self._indexed()
+        super().insert(i, item)
+        index[item] += 1
+        self._changed()
+
+    def remove(self, item: str) -> None:
+        super().remove(item)
+        self._discard(item)
+
+    def pop(self, i: SupportsIndex = -1) -> str:
+        item = super().pop(i)
+        self._discard(item)
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._indexed().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+    def __setitem__(self, i, item) -> None:
+        if isinstance(i, slice):
+            super().__setitem__(i, item)
+            self._reindex()
+        else:
+            old = super().__getitem__(i)
+            super().__setitem__(i, item)
+            self._discard(old)
+            self._indexed()[item] += 1
+            self._changed()
+
+    def __delitem__(self, i) -> None:
+        if isinstance(i, slice):
+            super().__delitem__(i)
+            self._reindex()
+        else:
+            old = super().__getitem__(i)
+            super().__delitem__(i)
+            self._discard(old)
+
     def sync(
         self,
         filename: str,
@@ -57,6 +414,151 @@ class syncControl(list[str]):
             self.append(line)
             return True
 
+    def _addMany(
+        self,
+        lines: Iterable[str],
+        force: bool = False,
+    ) -> int:
+        index = self._indexed()
+        added = []
+        seen = set()
+        for line in lines:
+            if force or not (line in index or line in seen):
+                added.append(line)
+                seen.add(line)
+        self.extend(added)
+        return len(added)
+
+    def sync_many(
+        self,
+        filenames: Iterable[str],
+        force: bool = False,
+    ) -> int:
+        """Add files to sync in one pass.
+
+        Args:
+            filenames (Iterable[str]): Filenames.
+            force (bool, optional): Add the files even they are already added. Defaults to False.
+
+        Returns:
+            int: The number of added lines.
+        """
+        return self._addMany((f"!{filename}" for filename in filenames), force)
+
+    def ignore_many(
+        self,
+        filenames: Iterable[str],
+        force: bool = False,
+    ) -> int:
+        """Add files to ignore from sync in one pass.
+
+        Args:
+            filenames (Iterable[str]): Filenames.
+            force (bool, optional): Add the files even they are already added. Defaults to False.
+
+        Returns:
+            int: The number of added lines.
+        """
+        return self._addMany((f"{filename}" for filename in filenames), force)
+
+    def _treeRules(
+        self,
+        root: Union[Path, str],
+        pattern: str,
+        base: Optional[Union[Path, str]],
+        collapse: bool,
+    ) -> list[tuple[str, str]]:
+        root = Path(root)
+        if not root.is_dir():
+            raise FileNotFoundError(f"Such directory not found: {root}")
+        if base is None:
+            rel = ''
+        else:
+            rel = Path(os.path.relpath(root, base)).as_posix()
+            if rel.startswith('..'):
+                raise ValueError(f"'{root}' is not under '{base}'.")
+            rel = '' if rel == '.' else '/'.join(
+                _escapeName(part) for part in rel.split('/')) + '/'
+
+        _, rules = _walkTree(str(root), rel, pattern, collapse, top=True)
+        return rules
+
+    def sync_tree(
+        self,
+        root: Union[Path, str],
+        pattern: str = '*',
+        base: Optional[Union[Path, str]] = None,
+        collapse: bool = True,
+        force: bool = False,
+    ) -> int:
+        """Add the files matching the pattern under a directory to sync.
+
+        The directories containing the files are also added to sync,
+        so the files are synchronized even all files are ignored by `*`.
+        When `collapse` is on, a directory whose files all match the pattern
+        becomes one directory rule, and the matching files in a directory
+        become one glob rule.
+
+        Args:
+            root (Union[Path, str]): The directory to walk.
+            pattern (str, optional): The pattern of filenames. Defaults to '*'.
+            base (Optional[Union[Path, str]], optional): 
+                The location of .gitignore. Defaults to None as `root`.
+            collapse (bool, optional): Collapse the rules into directory or glob rules. Defaults to True.
+            force (bool, optional): Add the lines even they are already added. Defaults to False.
+
+        Returns:
+            int: The number of added lines.
+        """
+        lines = []
+        parents = set()
+        for kind, path in self._treeRules(root, pattern, base, collapse):
+            end = path.find('/')
+            while end != -1:
+                parent = path[:end]
+                if parent not in parents:
+                    parents.add(parent)
+                    lines.append(f"!/{parent}/")
+                end = path.find('/', end+1)
+            if kind == 'dir':
+                parents.add(path)
+                lines.append(f"!/{path}/")
+                lines.append(f"!/{path}/**")
+            else:
+                lines.append(f"!/{path}")
+
+        return self._addMany(lines, force)
+
+    def ignore_tree(
+        self,
+        root: Union[Path, str],
+        pattern: str = '*',
+        base: Optional[Union[Path, str]] = None,
+        collapse: bool = True,
+        force: bool = False,
+    ) -> int:
+        """Add the files matching the pattern under a directory to ignore from sync.
+
+        When `collapse` is on, a directory whose files all match the pattern
+        becomes one directory rule, and the matching files in a directory
+        become one glob rule.
+
+        Args:
+            root (Union[Path, str]): The directory to walk.
+            pattern (str, optional): The pattern of filenames. Defaults to '*'.
+            base (Optional[Union[Path, str]], optional): 
+                The location of .gitignore. Defaults to None as `root`.
+            collapse (bool, optional): Collapse the rules into directory or glob rules. Defaults to True.
+            force (bool, optional): Add the lines even they are already added. Defaults to False.
+
+        Returns:
+            int: The number of added lines.
+        """
+        return self._addMany((
+            f"/{path}/" if kind == 'dir' else f"/{path}"
+            for kind, path in self._treeRules(root, pattern, base, collapse)
+        ), force)
+
     defaultOpenArgs = {
         'encoding': 'utf-8',
         'mode': 'w+',
@@ -71,14 +573,21 @@ class syncControl(list[str]):
             'mode': 'w+',
         },
         printArgs: dict = {},
-    ) -> None:
+    ) -> bool:
         """Export .gitignore
 
+        The content is built in one buffer and compared with the file on disk,
+        whose hash is cached until its mtime or size changes. The file is only
+        written when the content changed, by appending when the only change
+        is new lines at the end, otherwise by replacing it atomically.
+
         Args:
             saveLocation (Path): The location of .gitignore.
             openArgs (dict): The other arguments for :func:`open` function.
             printArgs (dict): The other arguments for :func:`print` function.
 
+        Returns:
+            bool: Whether .gitignore is written.
         """
         printArgs = {k: v for k, v in printArgs.items() if k != 'file'}
         printArgs = {**self.defaultPrintArgs, **printArgs}
@@ -96,10 +605,68 @@ class syncControl(list[str]):
         if not os.path.exists(saveLocation):
             raise FileNotFoundError("The saveLocation is not found.")
 
-        with open(
-            saveLocation / f".gitignore", **openArgs
-        ) as ignoreList:
-            [print(item, file=ignoreList, **printArgs) for item in self]
+        end = printArgs.get('end', '\n')
+        end = '\n' if end is None else end
+        lines = [f"{item}{end}" for item in list.__iter__(self)]
+        content = ''.join(lines)
+        target = saveLocation / f".gitignore"
+
+        if 'w' not in openArgs['mode']:
+            with open(target, **openArgs) as ignoreList:
+                ignoreList.write(content)
+            return True
+
+        # a symlink is written through, not replaced by a regular file.
+        target = Path(os.path.realpath(target))
+        encoded = _textBytes(content, openArgs)
+        size, digest = self._exportState(target)
+        if size == len(encoded) and digest == hashlib.sha256(encoded).digest():
+            return False
+
+        appendFrom = None
+        if 0 < size < len(encoded) and digest == hashlib.sha256(encoded[:size]).digest():
+            written = 0
+            for i, line in enumerate(lines):
+                if written == size:
+                    appendFrom = i
+                    break
+                written += len(_textBytes(line, openArgs))
+
+        writeArgs = {k: v for k, v in openArgs.items() if k != 'mode'}
+        if appendFrom is not None:
+            with open(target, 'a', **writeArgs) as ignoreList:
+                ignoreList.write(''.join(lines[appendFrom:]))
+        else:
+            atomicWrite(target, content, **writeArgs)
+
+        stat = os.stat(target)
+        self._exportCacheOf()[target] = (
+            (stat.st_mtime_ns, stat.st_size),
+            hashlib.sha256(encoded).digest(),
+        )
+        return True
+
+    def _exportCacheOf(self) -> dict[Path, tuple[tuple[int, int], bytes]]:
+        if '_exportCache' not in self.__dict__:
+            self._exportCache = {}
+        return self._exportCache
+
+    def _exportState(self, target: Path) -> tuple[int, Optional[bytes]]:
+        """The size and the hash of exported file, the hash is cached by its mtime and size."""
+        try:
+            stat = os.stat(target)
+        except FileNotFoundError:
+            return -1, None
+
+        cache = self._exportCacheOf()
+        key = (stat.st_mtime_ns, stat.st_size)
+        if target in cache and cache[target][0] == key:
+            return stat.st_size, cache[target][1]
+
+        with open(target, 'rb') as ignoreList:
+            digest = hashlib.sha256(ignoreList.read()).digest()
+        cache[target] = (key, digest)
+        return stat.st_size, digest
 
     def read(
         self,
@@ -148,3 +715,58 @@ class syncControl(list[str]):
             if not ignoreForNotfound:
                 raise FileNotFoundError("The .gitignore is not found.")
             return False
+
+    def _compiled(self) -> _gitignoreMatcher:
+        if self.__dict__.get('_matcher', None) is None:
+            self._matcher = _gitignoreMatcher(list.__iter__(self))
+        return self._matcher
+
+    def match(
+        self,
+        path: Union[Path, str],
+        isDir: Optional[bool] = None,
+    ) -> bool:
+        """Check whether a path is ignored by the rules, as `git check-ignore` does.
+
+        The rules are compiled once and cached until the list is changed.
+        Negation, directory-only rules, anchoring and `**` are followed,
+        and a path under an ignored directory is ignored.
+
+        Args:
+            path (Union[Path, str]): The path relative to the location of .gitignore.
+            isDir (Optional[bool], optional): 
+                Whether the path is a directory. 
+                Defaults to None as a path ending with '/' is a directory.
+
+        Returns:
+            bool: The path is ignored, otherwise it's synchronized.
+        """
+        path, endsWithSlash = _normalizePath(path)
+        return self._compiled().ignored(
+            path, endsWithSlash if isDir is None else isDir)
+
+    def filter(
+        self,
+        paths: Iterable[Union[Path, str]],
+        ignored: bool = False,
+    ) -> list[Union[Path, str]]:
+        """Filter the paths by the rules in one pass.
+
+        Args:
+            paths (Iterable[Union[Path, str]]): 
+                The paths relative to the location of .gitignore, 
+                a path ending with '/' is a directory.
+            ignored (bool, optional): 
+                Return the ignored paths instead of the synchronized paths. 
+                Defaults to False.
+
+        Returns:
+            list[Union[Path, str]]: The synchronized paths, or the ignored paths.
+        """
+        matcher = self._compiled()
+        result = []
+        for path in paths:
+            normalized, isDir = _normalizePath(path)
+            if matcher.ignored(normalized, isDir) == ignored:
+                result.append(path)
+        return result
@@ -0,0 +1,156 @@
+from typing import Optional, Callable, Hashable, Union, Any
+from collections import OrderedDict
+from pathlib import Path
+import threading
+import pickle
+import os
+
+from .configcache import CacheStats
+
+
+class ReadCache:
+    """A LRU cache of contents read from files, which is valid
+    while the `(mtime_ns, size, inode)` of file are unchanged, the inode catches
+    a file replaced by another one of the same size within the mtime resolution.
+
+    The contents are kept pickled and each reading unpickles a new copy,
+    which is faster than parsing the file again and keeps the cache from
+    being changed by the callers.
+
+    >>> cache = enableReadCache(maxsize=256)
+    >>> quickRead('config.json')  # parsed
+    >>> quickRead('config.json')  # copied from the cache
+    >>> cache.stats
+
+    """
+    __version__ = (0, 1, 0)
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 256,
+        maxbytes: Optional[int] = None,
+        copyOnRead: bool = True,
+    ) -> None:
+        """Set the cache.
+
+        Args:
+            maxsize (Optional[int], optional): Max number of contents. Defaults to 256.
+            maxbytes (Optional[int], optional): Max total size of the contents cached. Defaults to None.
+            copyOnRead (bool, optional):
+                Whether each reading gets a new copy. Otherwise the same object is
+                returned, which is the fastest but must not be changed. Defaults to True.
+        """
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.copyOnRead = copyOnRead
+
+        self._data: OrderedDict[tuple[str, Hashable], tuple[tuple[int, int], Any, int]] = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, len(self._data), self._nbytes)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self) -> None:
+        while len(self._data) > 0 and (
+            (self.maxsize is not None and len(self._data) > self.maxsize) or
+            (self.maxbytes is not None and self._nbytes > self.maxbytes)
+        ):
+            _, (_, _, nbytes) = self._data.popitem(last=False)
+            self._nbytes -= nbytes
+            self._evictions += 1
+
+    def read(
+        self,
+        path: Union[Path, str],
+        loader: Callable[[str], Any],
+        key: Hashable = (),
+    ) -> Any:
+        """Read a file by `loader`, or copy the content cached when the file is unchanged.
+
+        Args:
+            path (Union[Path, str]): The file.
+            loader (Callable[[str], Any]): Read the file by its path.
+            key (Hashable, optional): The arguments of reading which change the content. Defaults to ().
+
+        Raises:
+            FileNotFoundError: When the file does not exist.
+
+        Returns:
+            Any: The content.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cacheKey = (path, key)
+
+        with self._lock:
+            entry = self._data.get(cacheKey, None)
+            if entry is not None and entry[0] == signature:
+                self._data.move_to_end(cacheKey)
+                self._hits += 1
+                return pickle.loads(entry[1]) if self.copyOnRead else entry[1]
+            self._misses += 1
+
+        content = loader(path)
+        if self.copyOnRead:
+            kept = pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL)
+            nbytes = len(kept)
+        else:
+            kept = content
+            nbytes = stat.st_size
+        with self._lock:
+            if cacheKey in self._data:
+                self._nbytes -= self._data.pop(cacheKey)[2]
+            self._data[cacheKey] = (signature, kept, nbytes)
+            self._nbytes += nbytes
+            self._evict()
+        return content
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+
+
+_readCache: Optional[ReadCache] = None
+
+
+def enableReadCache(
+    maxsize: Optional[int] = 256,
+    maxbytes: Optional[int] = None,
+    copyOnRead: bool = True,
+) -> ReadCache:
+    """Cache the readings of :func:`quickRead` and :meth:`TagList.read` in this process.
+
+    Args:
+        maxsize (Optional[int], optional): Max number of contents. Defaults to 256.
+        maxbytes (Optional[int], optional): Max total size of the contents cached. Defaults to None.
+        copyOnRead (bool, optional): Whether each reading gets a new copy. Defaults to True.
+
+    Returns:
+        ReadCache: The cache.
+    """
+    global _readCache
+    _readCache = ReadCache(maxsize=maxsize, maxbytes=maxbytes, copyOnRead=copyOnRead)
+    return _readCache
+
+
+def disableReadCache() -> None:
+    """Stop caching the readings and drop the cache."""
+    global _readCache
+    _readCache = None
+
+
+def activeReadCache() -> Optional[ReadCache]:
+    """The cache of readings in this process, None when it is not enabled."""
+    return _readCache
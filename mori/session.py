@@ -0,0 +1,139 @@
+from typing import Optional, Union, Any
+from pathlib import Path
+import inspect
+import threading
+import os
+
+
+class ExportSession:
+    """Arguments of exportation validated once and reused by many `export` and `read`.
+
+    :meth:`TagList.paramsControl` and :meth:`singleColCSV.paramsControl` rebuild
+    the arguments and check the location on every call, a session keeps their
+    results for each class and mode, and optionally opens files relative to
+    a directory descriptor.
+
+    >>> with ExportSession('./results', openArgs={'encoding': 'utf-8'}, useDirFd=True) as session:
+    ...     for i, tagList in enumerate(tagLists):
+    ...         tagList.export(name=f"{i}", session=session)
+
+    """
+    __version__ = (0, 1, 0)
+
+    def __init__(
+        self,
+        saveLocation: Union[Path, str] = Path('./'),
+        openArgs: dict = {},
+        printArgs: dict = {},
+        jsonDumpArgs: dict = {},
+        useDirFd: bool = False,
+    ) -> None:
+        """Set the session.
+
+        Args:
+            saveLocation (Union[Path, str], optional): The location of files. Defaults to Path('./').
+            openArgs (dict, optional):
+                The other arguments for :func:`open` function,
+                merged with the defaults of each class. Defaults to {}.
+            printArgs (dict, optional): The other arguments for :func:`print` function. Defaults to {}.
+            jsonDumpArgs (dict, optional): The other arguments for :func:`json.dump` function. Defaults to {}.
+            useDirFd (bool, optional):
+                Whether to open files relative to a descriptor of `saveLocation`,
+                which is kept until :meth:`close`. Defaults to False.
+
+        Raises:
+            ValueError: When `saveLocation` is not `str` or `Path`.
+            FileNotFoundError: When `saveLocation` does not exist.
+        """
+        if isinstance(saveLocation, (Path, str)):
+            saveLocation = Path(saveLocation)
+        else:
+            raise ValueError(
+                "'saveLocation' needs to be the type of 'str' or 'Path'.")
+        if not os.path.isdir(saveLocation):
+            raise FileNotFoundError(f"Such location not found: {saveLocation}")
+
+        self.saveLocation = saveLocation
+        self.openArgs = {**openArgs}
+        self.printArgs = {**printArgs}
+        self.jsonDumpArgs = {**jsonDumpArgs}
+
+        self._params: dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+        self.dirfd: Optional[int] = os.open(
+            saveLocation, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
+        ) if useDirFd and os.open in os.supports_dir_fd else None
+
+    def params(
+        self,
+        owner: type,
+        isReadOnly: bool = False,
+        filetype: Optional[str] = None,
+    ) -> Any:
+        """The result of `owner.paramsControl` with the arguments of session,
+        computed once for each class and mode.
+
+        Args:
+            owner (type): The class with `paramsControl`, like :cls:`TagList`.
+            isReadOnly (bool, optional): Is reading files. Defaults to False.
+            filetype (Optional[str], optional): The file type for :cls:`TagList`. Defaults to None.
+
+        Returns:
+            Any: The arguments from `owner.paramsControl`.
+        """
+        key = (owner, isReadOnly, filetype)
+        try:
+            return self._params[key]
+        except KeyError:
+            ...
+
+        accepted = inspect.signature(owner.paramsControl).parameters
+        kwargs = {
+            'openArgs': self.openArgs,
+            'printArgs': self.printArgs,
+            'saveLocation': self.saveLocation,
+            'isReadOnly': isReadOnly,
+        }
+        if 'jsonDumpArgs' in accepted:
+            kwargs['jsonDumpArgs'] = self.jsonDumpArgs
+        if filetype is not None:
+            kwargs['filetype'] = filetype
+
+        result = owner.paramsControl(**kwargs)
+        with self._lock:
+            return self._params.setdefault(key, result)
+
+    def opener(
+        self,
+        path: Union[Path, str],
+        flags: int,
+    ) -> int:
+        """The `opener` of :func:`open` resolving the name of file by :attr:`dirfd`."""
+        if self.dirfd is None:
+            return os.open(path, flags, 0o666)
+        return os.open(os.path.basename(path), flags, 0o666, dir_fd=self.dirfd)
+
+    def open(
+        self,
+        path: Union[Path, str],
+        **openArgs,
+    ):
+        """Open a file in :attr:`saveLocation`, relative to :attr:`dirfd` if kept."""
+        return open(
+            path, **openArgs,
+            opener=None if self.dirfd is None else self.opener)
+
+    def close(self) -> None:
+        if self.dirfd is not None:
+            os.close(self.dirfd)
+            self.dirfd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        if getattr(self, 'dirfd', None) is not None:
+            self.close()
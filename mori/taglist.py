@@ -1,13 +1,18 @@
-from typing import Optional, Iterable, Literal, Union, TypeVar, Hashable
+from typing import Optional, Callable, Iterable, Literal, Union, TypeVar, Hashable
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import Executor
+import io
 import os
+import asyncio
 import json
 import csv
 import glob
 import warnings
 
 from ..jsonablize import Parse
+from .session import ExportSession
+from ..aio import loopLimiter, runInExecutor, writeText
 
 K = TypeVar('K')
 T = TypeVar('T')
@@ -116,6 +121,9 @@ class TagList(defaultdict[Hashable, list[T]]):
             warnings.warn(
                 f"The following keys '{not_list_v}' with the values are not list won't be added.")
 
+    def __reduce__(self):
+        return (type(self), (dict(self), self.__name__, False))
+
     def all(self) -> list:
         d = []
         for k, v in self.items():
@@ -252,6 +260,7 @@ class TagList(defaultdict[Hashable, list[T]]):
         openArgs: dict = defaultOpenArgs,
         printArgs: dict = defaultPrintArgs,
         jsonDumpArgs: dict = defaultJsonDumpArgs,
+        session: Optional[ExportSession] = None,
     ) -> Path:
         """Export `tagList`.
 
@@ -286,6 +295,10 @@ class TagList(defaultdict[Hashable, list[T]]):
                 >>> {
                     'indent': 2,
                 } 
+            session (Optional[ExportSession], optional):
+                The session of validated arguments used instead of
+                `saveLocation`, `openArgs`, `printArgs` and `jsonDumpArgs`.
+                Defaults to None.
 
         Raises:
             ValueError: When filetype is not supported.
@@ -300,7 +313,7 @@ class TagList(defaultdict[Hashable, list[T]]):
             jsonDumpArgs=jsonDumpArgs,
             saveLocation=saveLocation,
             filetype=filetype,
-        )
+        ) if session is None else session.params(type(self), filetype=filetype)
         printArgs = args['printArgs']
         openArgs = args['openArgs']
         jsonDumpArgs = args['jsonDumpArgs']
@@ -308,13 +321,14 @@ class TagList(defaultdict[Hashable, list[T]]):
 
         filename = (
             f"" if name is None else f"{name}.") + f"{tagListName}.{filetype}"
+        opener = None if session is None else session.opener
 
         if filetype == 'json':
-            with open(saveLocation / filename, **openArgs) as ExportJson:
+            with open(saveLocation / filename, **openArgs, opener=opener) as ExportJson:
                 json.dump(Parse(self), ExportJson, **jsonDumpArgs)
 
         elif filetype == 'csv':
-            with open(saveLocation / filename, **openArgs, newline='') as ExportCsv:
+            with open(saveLocation / filename, **openArgs, newline='', opener=opener) as ExportCsv:
                 tagListWriter = csv.writer(ExportCsv, quotechar='|')
                 for k, vs in self.items():
                     for v in vs:
@@ -325,6 +339,111 @@ class TagList(defaultdict[Hashable, list[T]]):
 
         return saveLocation / filename
 
+    def dumps(
+        self,
+        filetype: _availableFileType = 'json',
+        jsonDumpArgs: dict = defaultJsonDumpArgs,
+    ) -> str:
+        """The content of exported file as text.
+
+        Args:
+            filetype (Literal[&#39;json&#39;, &#39;csv&#39;], optional): 
+                Export type of `tagList`. Defaults to 'json'.
+            jsonDumpArgs (dict, optional): 
+                The other arguments for :func:`json.dumps` function.
+                Defaults to :attr:`self.defaultJsonDumpArgs`.
+
+        Raises:
+            ValueError: When filetype is not supported.
+
+        Returns:
+            str: The content.
+        """
+        if filetype == 'json':
+            return json.dumps(Parse(self), **jsonDumpArgs)
+
+        elif filetype == 'csv':
+            ExportCsv = io.StringIO(newline='')
+            tagListWriter = csv.writer(ExportCsv, quotechar='|')
+            for k, vs in self.items():
+                tagListWriter.writerows((k, v) for v in vs)
+            return ExportCsv.getvalue()
+
+        raise ValueError(
+            f"Instead of '{filetype}', Only {self.availableFileType} can be exported.")
+
+    async def export_async(
+        self,
+        saveLocation: Union[Path, str] = Path('./'),
+        tagListName: str = __name__,
+        name: Optional[str] = None,
+        filetype: _availableFileType = 'json',
+
+        openArgs: dict = defaultOpenArgs,
+        printArgs: dict = defaultPrintArgs,
+        jsonDumpArgs: dict = defaultJsonDumpArgs,
+        session: Optional[ExportSession] = None,
+        executor: Optional[Executor] = None,
+        limiter: Optional[asyncio.Semaphore] = None,
+    ) -> Path:
+        """The async :meth:`export`, the encoding runs in `executor` and the writing in a thread,
+        this `tagList` should not be changed until it is done.
+
+        Args:
+            saveLocation (Path): The location of file.
+            tagListName (str, optional): 
+                Name for this `tagList`.
+                Defaults to :attr:`self.__name__`.
+            name (Optional[str], optional): Addition name for this `tagList`. Defaults to None.
+            filetype (Literal[&#39;json&#39;, &#39;csv&#39;], optional): 
+                Export type of `tagList`. Defaults to 'json'.
+            openArgs (dict, optional): 
+                The other arguments for :func:`open` function.
+                Defaults to :attr:`self.defaultOpenArgs`.
+            printArgs (dict, optional): 
+                The other arguments for :func:`print` function.
+                Defaults to :attr:`self.defaultPrintArgs`.
+            jsonDumpArgs (dict, optional): 
+                The other arguments for :func:`json.dump` function.
+                Defaults to :attr:`self.defaultJsonDumpArgs`.
+            session (Optional[ExportSession], optional):
+                The session of validated arguments. Defaults to None.
+            executor (Optional[Executor], optional): 
+                The executor to encode, like a process pool for large `tagList`. 
+                Defaults to None as the default one of event loop.
+            limiter (Optional[asyncio.Semaphore], optional): 
+                Bounds the exportations in flight. Defaults to None as :func:`loopLimiter`.
+
+        Raises:
+            ValueError: When filetype is not supported.
+
+        Return:
+            Path: The path of exported file.
+        """
+
+        args = self.paramsControl(
+            openArgs=openArgs,
+            printArgs=printArgs,
+            jsonDumpArgs=jsonDumpArgs,
+            saveLocation=saveLocation,
+            filetype=filetype,
+        ) if session is None else session.params(type(self), filetype=filetype)
+        openArgs = args['openArgs']
+        if filetype == 'csv':
+            openArgs = {**openArgs, 'newline': ''}
+        if session is not None:
+            openArgs = {**openArgs, 'opener': session.opener}
+
+        filename = (
+            f"" if name is None else f"{name}.") + f"{tagListName}.{filetype}"
+        limiter = loopLimiter() if limiter is None else limiter
+
+        async with limiter:
+            text = await runInExecutor(
+                self.dumps, filetype, args['jsonDumpArgs'], executor=executor)
+            return await runInExecutor(
+                writeText, args['saveLocation'] / filename, text, openArgs)
+
     @classmethod
     def read(
         cls,
@@ -340,6 +459,8 @@ class TagList(defaultdict[Hashable, list[T]]):
 
         whichNum: int = 0,
         notFoundRaise: bool = True,
+        session: Optional[ExportSession] = None,
+        useCache: bool = True,
     ):
         """Export `tagList`.
 
@@ -374,6 +495,13 @@ class TagList(defaultdict[Hashable, list[T]]):
                 >>> {
                     'indent': 2,
                 } 
+            session (Optional[ExportSession], optional):
+                The session of validated arguments used instead of
+                `saveLocation`, `openArgs`, `printArgs` and `jsonDumpArgs`.
+                Defaults to None.
+            useCache (bool, optional):
+                Whether to use the cache of readings from :func:`enableReadCache` when it is enabled.
+                Defaults to True.
 
         Raises:
             ValueError: When filetype is not supported.
@@ -390,7 +518,7 @@ class TagList(defaultdict[Hashable, list[T]]):
             saveLocation=saveLocation,
             filetype=filetype,
             isReadOnly=True,
-        )
+        ) if session is None else session.params(cls, isReadOnly=True, filetype=filetype)
         printArgs = args['printArgs']
         openArgs = args['openArgs']
         jsonDumpArgs = args['jsonDumpArgs']
@@ -430,10 +558,33 @@ class TagList(defaultdict[Hashable, list[T]]):
 
         filename = lsLoc2[0]
         filename = Path(filename).name
-        obj = None
+        opener = None if session is None else session.opener
+
+        from .readcache import activeReadCache
+        cache = activeReadCache() if useCache else None
+        if cache is None:
+            return cls._load(
+                saveLocation / filename, tagListName, filetype, tupleStrTransplie, openArgs, opener)
+        return cache.read(
+            saveLocation / filename,
+            lambda target: cls._load(
+                target, tagListName, filetype, tupleStrTransplie, openArgs, opener),
+            key=(cls, tagListName, filetype, tupleStrTransplie, openArgs.get('encoding', None)),
+        )
 
+    @classmethod
+    def _load(
+        cls,
+        target: Union[Path, str],
+        tagListName: str,
+        filetype: _availableFileType,
+        tupleStrTransplie: bool,
+        openArgs: dict,
+        opener: Optional[Callable[[str, int], int]] = None,
+    ):
+        obj = None
         if filetype == 'json':
-            with open(saveLocation / filename, **openArgs) as ReadJson:
+            with open(target, **openArgs, opener=opener) as ReadJson:
                 rawData = json.load(ReadJson)
                 obj = cls(
                     o=rawData,
@@ -442,7 +593,7 @@ class TagList(defaultdict[Hashable, list[T]]):
                 )
 
         elif filetype == 'csv':
-            with open(saveLocation / filename, **openArgs, newline='') as ReadCsv:
+            with open(target, **openArgs, newline='', opener=opener) as ReadCsv:
                 tagListReaper = csv.reader(ReadCsv, quotechar='|')
                 obj = cls(
                     name=tagListName,
@@ -455,3 +606,27 @@ class TagList(defaultdict[Hashable, list[T]]):
             warnings.warn("Reading cancelled for no specified filetype.")
 
         return obj
+
+    @classmethod
+    async def read_async(
+        cls,
+        *args,
+        executor: Optional[Executor] = None,
+        limiter: Optional[asyncio.Semaphore] = None,
+        **kwargs,
+    ):
+        """The async :meth:`read`, which runs in `executor` with the same arguments.
+
+        Args:
+            executor (Optional[Executor], optional): 
+                The executor to read and decode. 
+                Defaults to None as the default one of event loop.
+            limiter (Optional[asyncio.Semaphore], optional): 
+                Bounds the readings in flight. Defaults to None as :func:`loopLimiter`.
+
+        Return:
+            TagList: The `tagList` read.
+        """
+        limiter = loopLimiter() if limiter is None else limiter
+        async with limiter:
+            return await runInExecutor(cls.read, *args, executor=executor, **kwargs)
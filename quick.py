@@ -1,8 +1,16 @@
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Union, Iterable, Literal, Optional
+from typing import Union, Iterable, Iterator, Literal, Optional, Any
+import asyncio
 import json
+import os
 
 from .jsonablize import quickJSONExport, Parse
+from .aio import loopLimiter, runInExecutor, writeText, readText
+from .resultstore import ResultStore, isPointer, pointerBlobKey, pointerStoreKey
+from .jsonscan import select as jsonSelect, iterItems, PathLike
+from .jsonl import JSONLWriter, iterJSONL
+from .mori.readcache import activeReadCache
 from .mori.csvlist import singleColCSV
 
 
@@ -16,6 +24,7 @@ def quickJSON(
 
     saveLocation: Union[Path, str] = Path('./'),
     mute: bool = False,
+    store: Optional[ResultStore] = None,
 ) -> None:
     """Configurable quick JSON export.
 
@@ -27,7 +36,19 @@ def quickJSON(
         encoding (str, optional): Encoding method. Defaults to 'utf-8'.
         jsonablize (bool, optional): Whether to transpile all object to jsonable via :func:`mori.jsonablize`. Defaults to False.
         saveLocation (Union[Path, str], optional): Location of files. Defaults to Path('./').
+        store (Optional[ResultStore], optional): 
+            Keep the content in a :cls:`ResultStore` and write a pointer as `filename`,
+            which is resolved by :func:`quickRead`. Defaults to None.
     """
+    if store is not None:
+        if 'a' in mode:
+            raise ValueError("A pointer of 'ResultStore' can not be appended.")
+        saveLocWName = store.export(
+            content, filename, saveLocation=saveLocation, jsonablize=jsonablize)
+        if not mute:
+            print(f"'{saveLocWName}' exported successfully.")
+        return
+
     return quickJSONExport(
         content=content,
         filename=filename,
@@ -40,6 +61,74 @@ def quickJSON(
     )
 
 
+def quickJSONL(
+    content: Any,
+    filename: Union[str, Path],
+    encoding: str = 'utf-8',
+    jsonablize: bool = False,
+
+    saveLocation: Union[Path, str] = Path('./'),
+    many: bool = False,
+    flushEvery: int = 1000,
+    flushInterval: Optional[float] = 1.0,
+) -> JSONLWriter:
+    """Quick append records as json lines, the file is kept open by a :cls:`JSONLWriter`
+    and the lines are flushed by groups, call :meth:`JSONLWriter.flush` before reading it.
+
+    Args:
+        content (any): The record, or the records when `many` is True.
+        filename (Union[str, Path]): Filename of the file.
+        encoding (str, optional): Encoding method. Defaults to 'utf-8'.
+        jsonablize (bool, optional): Whether to transpile all object to jsonable via :func:`mori.jsonablize`. Defaults to False.
+        saveLocation (Union[Path, str], optional): Location of files. Defaults to Path('./').
+        many (bool, optional): Whether `content` is an iterable of records. Defaults to False.
+        flushEvery (int, optional): Flush after this number of records, only used when the file is opened. Defaults to 1000.
+        flushInterval (Optional[float], optional): 
+            Flush when the last flush is older than this number of seconds, 
+            only used when the file is opened. Defaults to 1.0.
+
+    Returns:
+        JSONLWriter: The writer of the file.
+    """
+    writer = JSONLWriter.at(
+        os.path.join(saveLocation, filename),
+        encoding=encoding,
+        flushEvery=flushEvery,
+        flushInterval=flushInterval,
+    )
+    if many:
+        writer.extend(content, jsonablize)
+    else:
+        writer.append(content, jsonablize)
+    return writer
+
+
+def quickReadJSONL(
+    filename: Union[str, Path],
+    saveLocation: Union[Path, str] = Path('./'),
+    encoding: str = 'utf-8',
+    workers: Optional[int] = None,
+) -> Iterator:
+    """Quick read the records of a json lines file by a generator,
+    the records still waiting in an opened :cls:`JSONLWriter` of the file are flushed first.
+
+    Args:
+        filename (Union[str, Path]): Filename.
+        encoding (str, optional): Encoding method. Defaults to 'utf-8'.
+        workers (Optional[int], optional): 
+            The number of processes decoding the chunks of file, see :func:`jsonl.iterJSONL`.
+            Defaults to None as decoding in this process.
+
+    Returns:
+        Iterator: The records.
+    """
+    target = Path(saveLocation) / filename
+    writer = JSONLWriter._writers.get(os.path.abspath(target), None)
+    if writer is not None:
+        writer.flush()
+    return iterJSONL(target, encoding=encoding, workers=workers)
+
+
 def quickListCSV(
     content: Iterable,
     filename: str,
@@ -78,13 +167,31 @@ def quickRead(
     saveLocation: Union[Path, str] = Path('./'),
     filetype: Literal['json', 'txt'] = 'json',
 
-    encoding: str = 'utf-8'
-) -> Union[str, dict]:
+    encoding: str = 'utf-8',
+    resolvePointer: bool = True,
+    useCache: bool = True,
+    select: Optional[Iterable[PathLike]] = None,
+    stream: bool = False,
+) -> Union[str, dict, Iterator]:
     """Quick read file.
 
     Args:
         filename (Union[str, Path]): Filename.
         encoding (str, optional): Encoding method. Defaults to 'utf-8'.
+        resolvePointer (bool, optional): 
+            Whether to return the content of a pointer of :cls:`ResultStore`. 
+            Defaults to True.
+        useCache (bool, optional): 
+            Whether to use the cache of readings from :func:`enableReadCache` when it is enabled.
+            Defaults to True.
+        select (Optional[Iterable[PathLike]], optional):
+            Only take the values of these paths like 'summary.fidelity' from a json file,
+            the other values are skipped without being built, see :func:`jsonscan.select`. 
+            Defaults to None as the whole content.
+        stream (bool, optional):
+            Return a generator of the elements of a top-level array, or the key-value pairs
+            of a top-level object, which reads the json file by chunks, see :func:`jsonscan.iterItems`. 
+            Defaults to False.
 
     Returns:
         str: Content of the file.
@@ -92,10 +199,180 @@ def quickRead(
     if not isinstance(saveLocation, Path):
         saveLocation = Path(saveLocation)
 
+    if stream:
+        if filetype != 'json' or select is not None:
+            raise ValueError("Only a json file can be streamed, without 'select'.")
+        return _quickStream(saveLocation / filename, encoding, resolvePointer)
+
+    if select is not None:
+        if filetype != 'json':
+            raise ValueError("Only a json file can be read with 'select'.")
+        return _quickSelect(saveLocation / filename, select, encoding, resolvePointer)
+
+    cache = activeReadCache() if useCache else None
+    if cache is None:
+        return _quickLoad(saveLocation / filename, filetype, encoding, resolvePointer)
+    return cache.read(
+        saveLocation / filename,
+        lambda target: _quickLoad(target, filetype, encoding, resolvePointer),
+        key=('quickRead', filetype, encoding, resolvePointer),
+    )
+
+
+def _quickSelect(
+    target: Union[str, Path],
+    select: Iterable[PathLike],
+    encoding: str = 'utf-8',
+    resolvePointer: bool = True,
+) -> dict[PathLike, Any]:
+    select = list(select)
+    with open(target, 'r', encoding=encoding) as File:
+        try:
+            return jsonSelect(File, select)
+        except KeyError:
+            # only a small file can be a pointer, the others are not scanned again.
+            if not resolvePointer or os.path.getsize(target) >= _pointerMaxSize:
+                raise
+            File.seek(0)
+            try:
+                pointer = json.load(File)
+            except json.JSONDecodeError:
+                pointer = None
+            if not isPointer(pointer):
+                raise
+
+    blob = ResultStore.resolvePath(pointer, Path(target).parent)
+    return _quickSelect(blob, select, encoding, resolvePointer=False)
+
+
+def _quickStream(
+    target: Union[str, Path],
+    encoding: str = 'utf-8',
+    resolvePointer: bool = True,
+) -> Iterator:
+    if resolvePointer and os.path.getsize(target) < _pointerMaxSize:
+        with open(target, 'r', encoding=encoding) as File:
+            pointer = json.load(File)
+        if isPointer(pointer):
+            target = ResultStore.resolvePath(pointer, Path(target).parent)
+
+    with open(target, 'r', encoding=encoding) as File:
+        yield from iterItems(File)
+
+
+_pointerMaxSize = 512
+
+
+def _quickLoad(
+    target: Union[str, Path],
+    filetype: Literal['json', 'txt'] = 'json',
+    encoding: str = 'utf-8',
+    resolvePointer: bool = True,
+) -> Union[str, dict]:
     if filetype == 'json':
-        with open(saveLocation / filename, 'r', encoding=encoding) as File:
-            return json.load(File)
+        with open(target, 'r', encoding=encoding) as File:
+            content = json.load(File)
+        if resolvePointer and isPointer(content):
+            return ResultStore.resolve(content, Path(target).parent)
+        return content
 
     else:
-        with open(saveLocation / filename, 'r', encoding=encoding) as File:
+        with open(target, 'r', encoding=encoding) as File:
             return File.read()
+
+
+def _jsonDumps(
+    content: Iterable,
+    indent: int = 2,
+    jsonablize: bool = False,
+) -> str:
+    return json.dumps(
+        Parse(content) if jsonablize else content, indent=indent, ensure_ascii=False)
+
+
+async def quickJSONAsync(
+    content: Iterable,
+    filename: Union[str, Path],
+    mode: str,
+    indent: int = 2,
+    encoding: str = 'utf-8',
+    jsonablize: bool = False,
+
+    saveLocation: Union[Path, str] = Path('./'),
+    mute: bool = False,
+    executor: Optional[Executor] = None,
+    limiter: Optional[asyncio.Semaphore] = None,
+) -> Path:
+    """The async :func:`quickJSON`, the encoding runs in `executor` and the writing in a thread,
+    the content should not be changed until it is done.
+
+    Args:
+        content (any): Content wants to be written.
+        filename (str): Filename of the file.
+        mode (str): Mode for :func:`open` function.
+        indent (int, optional): Indent length for json. Defaults to 2.
+        encoding (str, optional): Encoding method. Defaults to 'utf-8'.
+        jsonablize (bool, optional): Whether to transpile all object to jsonable via :func:`mori.jsonablize`. Defaults to False.
+        saveLocation (Union[Path, str], optional): Location of files. Defaults to Path('./').
+        executor (Optional[Executor], optional): 
+            The executor to encode, like a process pool for large content. 
+            Defaults to None as the default one of event loop.
+        limiter (Optional[asyncio.Semaphore], optional): 
+            Bounds the exportations in flight. Defaults to None as :func:`loopLimiter`.
+
+    Returns:
+        Path: The path of exported file.
+    """
+    if not isinstance(saveLocation, Path):
+        saveLocation = Path(saveLocation)
+    limiter = loopLimiter() if limiter is None else limiter
+
+    async with limiter:
+        text = await runInExecutor(
+            _jsonDumps, content, indent, jsonablize, executor=executor)
+        if not os.path.exists(saveLocation):
+            os.makedirs(saveLocation, exist_ok=True)
+        saveLocWName = await runInExecutor(
+            writeText, saveLocation / filename, text, {'mode': mode, 'encoding': encoding})
+
+    if not mute:
+        print(f"'{saveLocWName}' exported successfully.")
+    return saveLocWName
+
+
+async def quickReadAsync(
+    filename: Union[str, Path],
+    saveLocation: Union[Path, str] = Path('./'),
+    filetype: Literal['json', 'txt'] = 'json',
+
+    encoding: str = 'utf-8',
+    executor: Optional[Executor] = None,
+    limiter: Optional[asyncio.Semaphore] = None,
+) -> Union[str, dict]:
+    """The async :func:`quickRead`, the reading runs in a thread and the decoding in `executor`.
+
+    Args:
+        filename (Union[str, Path]): Filename.
+        encoding (str, optional): Encoding method. Defaults to 'utf-8'.
+        executor (Optional[Executor], optional): 
+            The executor to decode. Defaults to None as the default one of event loop.
+        limiter (Optional[asyncio.Semaphore], optional): 
+            Bounds the readings in flight. Defaults to None as :func:`loopLimiter`.
+
+    Returns:
+        str: Content of the file.
+    """
+    if not isinstance(saveLocation, Path):
+        saveLocation = Path(saveLocation)
+    limiter = loopLimiter() if limiter is None else limiter
+
+    async with limiter:
+        text = await runInExecutor(
+            readText, saveLocation / filename, {'mode': 'r', 'encoding': encoding})
+        if filetype == 'json':
+            content = await runInExecutor(json.loads, text, executor=executor)
+            if isPointer(content):
+                return await runInExecutor(
+                    ResultStore.resolve, content, (saveLocation / filename).parent)
+            return content
+        return text
@@ -0,0 +1,253 @@
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union, Any
+import threading
+import hashlib
+import json
+import os
+
+from .jsonablize import Parse
+from .atomicwrite import atomicWrite
+
+pointerBlobKey = '__blob__'
+pointerStoreKey = '__resultStore__'
+
+
+def isPointer(o: Any) -> bool:
+    """Whether a content read from json is a pointer of :cls:`ResultStore`."""
+    return (
+        isinstance(o, dict) and len(o) == 2 and
+        pointerBlobKey in o and pointerStoreKey in o)
+
+
+class ResultStore:
+    """Keep each distinct json content once, under its sha256 in sharded directories.
+
+    The file named by :meth:`export` is a small pointer to the blob, which is
+    resolved by :func:`quickRead`. Exporting a content already kept costs
+    one hash without writing. The sha256 is of the canonical json whose keys
+    are sorted, but the blob keeps the order of keys of the content first kept.
+
+    >>> store = ResultStore('./results/.store')
+    >>> quickJSON(config, 'config.json', 'w', saveLocation='./results', store=store)
+    >>> quickRead('config.json', saveLocation='./results')
+
+    """
+    __version__ = (0, 1, 0)
+
+    _stores: dict[str, "ResultStore"] = {}
+    _storesLock = threading.Lock()
+
+    def __init__(
+        self,
+        storeLocation: Union[Path, str],
+        maxBlobs: int = 128,
+        encoding: str = 'utf-8',
+    ) -> None:
+        """Set the store, whose directory is only made when a blob is kept.
+
+        Args:
+            storeLocation (Union[Path, str]): The directory of blobs.
+            maxBlobs (int, optional): Max number of blob texts kept in memory. Defaults to 128.
+            encoding (str, optional): Encoding method. Defaults to 'utf-8'.
+        """
+        self.storeLocation = Path(os.path.abspath(storeLocation))
+        self.maxBlobs = maxBlobs
+        self.encoding = encoding
+
+        self._known: set[str] = set()
+        self._blobs: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+        with self._storesLock:
+            self._stores[str(self.storeLocation)] = self
+
+    @classmethod
+    def at(
+        cls,
+        storeLocation: Union[Path, str],
+    ) -> "ResultStore":
+        """The store of a location, created once for each process.
+
+        Args:
+            storeLocation (Union[Path, str]): The directory of blobs.
+
+        Returns:
+            ResultStore: The store.
+        """
+        key = os.path.abspath(storeLocation)
+        store = cls._stores.get(key, None)
+        return cls(key) if store is None else store
+
+    @staticmethod
+    def compact(
+        content: Any,
+        jsonablize: bool = False,
+    ) -> str:
+        """The compact json of content in the order of its keys, which is kept as the blob."""
+        return json.dumps(
+            Parse(content) if jsonablize else content,
+            separators=(',', ':'),
+            ensure_ascii=False,
+        )
+
+    @staticmethod
+    def canonical(text: str) -> str:
+        """The canonical form of a json text, which does not depend on the order of keys.
+        It is sorted after decoding, so the keys are all strings like in the file."""
+        return json.dumps(
+            json.loads(text),
+            sort_keys=True,
+            separators=(',', ':'),
+            ensure_ascii=False,
+        )
+
+    @staticmethod
+    def _blobPath(storeLocation: Union[Path, str], digest: str) -> Path:
+        return Path(storeLocation) / digest[:2] / f"{digest}.json"
+
+    def blobPath(self, digest: str) -> Path:
+        return self._blobPath(self.storeLocation, digest)
+
+    def put(
+        self,
+        content: Any,
+        jsonablize: bool = False,
+    ) -> str:
+        """Keep a content, written only when it is not kept yet.
+
+        Args:
+            content (Any): Content wants to be kept.
+            jsonablize (bool, optional): Whether to transpile all object to jsonable via :func:`mori.jsonablize`. Defaults to False.
+
+        Returns:
+            str: The sha256 of content.
+        """
+        text = self.compact(content, jsonablize)
+        digest = hashlib.sha256(
+            self.canonical(text).encode(self.encoding)).hexdigest()
+        if digest in self._known:
+            return digest
+
+        target = self.blobPath(digest)
+        if not target.exists():
+            os.makedirs(target.parent, exist_ok=True)
+            atomicWrite(target, text, encoding=self.encoding)
+        with self._lock:
+            self._known.add(digest)
+            self._remember(digest, text)
+        return digest
+
+    def _remember(self, digest: str, text: str) -> None:
+        self._blobs[digest] = text
+        self._blobs.move_to_end(digest)
+        while len(self._blobs) > self.maxBlobs:
+            self._blobs.popitem(last=False)
+
+    def text(self, digest: str) -> str:
+        """The json of a blob, from memory or then from disk.
+
+        Raises:
+            FileNotFoundError: When the blob is not in the store.
+        """
+        with self._lock:
+            text = self._blobs.get(digest, None)
+            if text is not None:
+                self._blobs.move_to_end(digest)
+                return text
+
+        with open(self.blobPath(digest), 'r', encoding=self.encoding) as File:
+            text = File.read()
+        with self._lock:
+            self._known.add(digest)
+            self._remember(digest, text)
+        return text
+
+    def get(self, digest: str) -> Any:
+        """The content of a blob, a new object for each call.
+
+        Raises:
+            FileNotFoundError: When the blob is not in the store.
+        """
+        return json.loads(self.text(digest))
+
+    def export(
+        self,
+        content: Any,
+        filename: Union[str, Path],
+        saveLocation: Union[Path, str] = Path('./'),
+        jsonablize: bool = False,
+    ) -> Path:
+        """Keep a content and write a pointer to it as `filename`,
+        the pointer is not rewritten when the file already points to the same content.
+
+        Args:
+            content (Any): Content wants to be written.
+            filename (Union[str, Path]): Filename of the pointer.
+            saveLocation (Union[Path, str], optional): Location of the pointer. Defaults to Path('./').
+            jsonablize (bool, optional): Whether to transpile all object to jsonable via :func:`mori.jsonablize`. Defaults to False.
+
+        Returns:
+            Path: The path of pointer.
+        """
+        target = Path(saveLocation) / filename
+        if not os.path.exists(target.parent):
+            os.makedirs(target.parent)
+        digest = self.put(content, jsonablize)
+
+        pointer = json.dumps({
+            pointerStoreKey: os.path.relpath(
+                self.storeLocation, os.path.dirname(os.path.abspath(target))),
+            pointerBlobKey: digest,
+        })
+        # the file may be written by others since, so it is read to check.
+        try:
+            if os.path.getsize(target) == len(pointer.encode(self.encoding)):
+                with open(target, 'r', encoding=self.encoding) as File:
+                    if File.read() == pointer:
+                        return target
+        except FileNotFoundError:
+            ...
+
+        atomicWrite(target, pointer, encoding=self.encoding)
+        return target
+
+    @classmethod
+    def resolvePath(
+        cls,
+        pointer: dict[str, str],
+        pointerLocation: Union[Path, str],
+    ) -> Path:
+        """The path of blob of a pointer read from the directory `pointerLocation`.
+
+        Args:
+            pointer (dict[str, str]): The pointer.
+            pointerLocation (Union[Path, str]): The directory of pointer file.
+
+        Returns:
+            Path: The path of blob.
+        """
+        storeLocation = os.path.join(
+            os.path.abspath(pointerLocation), pointer[pointerStoreKey])
+        return cls._blobPath(os.path.normpath(storeLocation), pointer[pointerBlobKey])
+
+    @classmethod
+    def resolve(
+        cls,
+        pointer: dict[str, str],
+        pointerLocation: Union[Path, str],
+    ) -> Any:
+        """The content of a pointer read from the directory `pointerLocation`,
+        through the store of the process which keeps the blobs read in memory.
+        Nothing is written or made on disk.
+
+        Args:
+            pointer (dict[str, str]): The pointer.
+            pointerLocation (Union[Path, str]): The directory of pointer file.
+
+        Returns:
+            Any: The content.
+        """
+        storeLocation = os.path.join(
+            os.path.abspath(pointerLocation), pointer[pointerStoreKey])
+        return cls.at(os.path.normpath(storeLocation)).get(pointer[pointerBlobKey])
@@ -0,0 +1,78 @@
+import importlib
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+_repo = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_repo.parent))
+csvlist = importlib.import_module(f"{_repo.name}.mori.csvlist")
+singleColCSV = csvlist.singleColCSV
+typedSingleColCSV = csvlist.typedSingleColCSV
+matrixCSV = csvlist.matrixCSV
+
+
+class TestCSVRoundTrip(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.saveLocation = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_single_col_export_then_read(self):
+        items = singleColCSV(['a', 'b', 'c'])
+        target = items.export(name='ids', saveLocation=self.saveLocation)
+
+        self.assertEqual(target.name, 'ids.singleCol.csv')
+        self.assertEqual(
+            list(singleColCSV.read('ids', saveLocation=self.saveLocation)),
+            ['a', 'b', 'c'])
+        self.assertEqual(
+            [v for chunk in singleColCSV.iter_read(
+                'ids', saveLocation=self.saveLocation, chunkSize=2) for v in chunk],
+            ['a', 'b', 'c'])
+
+    def test_typed_single_col_export_then_read(self):
+        ids = typedSingleColCSV(range(5), dtype='int32')
+        target = ids.export(name='jobIds', saveLocation=self.saveLocation)
+
+        self.assertEqual(target.name, 'jobIds.singleCol.csv')
+        readBack = typedSingleColCSV.read(
+            'jobIds', saveLocation=self.saveLocation, dtype='int32')
+        self.assertEqual(list(readBack), [0, 1, 2, 3, 4])
+        self.assertEqual(
+            [v for chunk in typedSingleColCSV.iter_read(
+                'jobIds', saveLocation=self.saveLocation, dtype='int32', chunkSize=2)
+             for v in chunk],
+            [0, 1, 2, 3, 4])
+        self.assertEqual(
+            list(singleColCSV.read('jobIds', saveLocation=self.saveLocation)),
+            ['0', '1', '2', '3', '4'])
+
+    def test_matrix_export_then_read(self):
+        table = matrixCSV(columns=['shot', 'fidelity'])
+        table.extend([(0, 0.5), (1, 0.25)])
+        target = table.export(name='results', saveLocation=self.saveLocation)
+
+        self.assertEqual(target.name, 'results.matrix.csv')
+        readBack = matrixCSV.read(
+            'results', saveLocation=self.saveLocation,
+            columns=['fidelity'], dtypes={'fidelity': 'float'})
+        self.assertEqual(list(readBack), [(0.5,), (0.25,)])
+
+    def test_matrix_writer_then_read(self):
+        with matrixCSV.writer(
+            'streamed', columns=['shot'], saveLocation=self.saveLocation,
+        ) as writer:
+            writer.append((7,))
+
+        self.assertEqual(
+            list(matrixCSV.read(
+                'streamed', saveLocation=self.saveLocation, dtypes={'shot': 'int'})),
+            [(7,)])
+
+
+if __name__ == '__main__':
+    unittest.main()
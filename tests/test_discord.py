@@ -0,0 +1,167 @@
+import importlib
+import json
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+_repo = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_repo.parent))
+Hoshi = importlib.import_module(f"{_repo.name}.hoshi").Hoshi
+discord = importlib.import_module(f"{_repo.name}.hoshi.webhooks.discord")
+DiscordHook = discord.DiscordHook
+DISCORD_LIMITS = discord.DISCORD_LIMITS
+
+
+class _MockDiscord(BaseHTTPRequestHandler):
+    """Reply the scripted responses in order, then 204."""
+
+    def do_POST(self):
+        length = int(self.headers['Content-Length'])
+        self.server.received.append(
+            (time.monotonic(), json.loads(self.rfile.read(length))))
+        if len(self.server.script) > 0:
+            status, headers, body = self.server.script.pop(0)
+        else:
+            status, headers, body = 204, {}, None
+
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        text = b'' if body is None else json.dumps(body).encode()
+        if len(text) > 0:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(text)))
+        self.end_headers()
+        self.wfile.write(text)
+
+    def log_message(self, *args):
+        ...
+
+
+def _bigReport(sections: int = 40, lines: int = 40) -> Hoshi:
+    report = Hoshi(name='report')
+    for s in range(sections):
+        report.h2(f"section {s}")
+        for i in range(lines):
+            report.txt(f"line {i} of section {s} with some padding text")
+    return report
+
+
+class TestDiscordHook(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _MockDiscord)
+        self.server.script = []
+        self.server.received = []
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.hook = DiscordHook(
+            f"http://127.0.0.1:{self.server.server_port}/webhook")
+
+    def tearDown(self):
+        self.hook.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def gaps(self) -> list[float]:
+        times = [t for t, _ in self.server.received]
+        return [b - a for a, b in zip(times, times[1:])]
+
+    def test_429_retry_after_body(self):
+        self.server.script = [(429, {}, {'retry_after': 0.3, 'global': False})]
+        result = self.hook.send(self.hook.message('hello'))
+
+        self.assertEqual(result.status_code, 204)
+        self.assertEqual(len(self.server.received), 2)
+        self.assertGreaterEqual(self.gaps()[0], 0.3)
+
+    def test_429_retry_after_header(self):
+        self.server.script = [(429, {'Retry-After': '0.25'}, None)]
+        result = self.hook.send(self.hook.message('hello'))
+
+        self.assertEqual(result.status_code, 204)
+        self.assertEqual(len(self.server.received), 2)
+        self.assertGreaterEqual(self.gaps()[0], 0.25)
+
+    def test_429_global_delays_next_messages(self):
+        self.server.script = [
+            (429, {'X-RateLimit-Global': 'true'}, {'retry_after': 0.2, 'global': True})]
+        self.hook.send_many([self.hook.message('a'), self.hook.message('b')])
+
+        self.assertEqual(len(self.server.received), 3)
+        self.assertGreaterEqual(self.gaps()[0], 0.2)
+
+    def test_429_gives_up_after_retries(self):
+        self.hook.maxRetries = 2
+        self.server.script = [
+            (429, {'Retry-After': '0.05'}, None) for _ in range(5)]
+        result = self.hook.send(self.hook.message('hello'))
+
+        self.assertEqual(result.status_code, 429)
+        self.assertEqual(len(self.server.received), 3)
+
+    def test_rate_limit_bucket_is_waited(self):
+        self.server.script = [
+            (204, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset-After': '0.3'}, None)]
+        self.hook.send_many([self.hook.message('a'), self.hook.message('b')])
+
+        self.assertEqual(len(self.server.received), 2)
+        self.assertGreaterEqual(self.gaps()[0], 0.3)
+
+    def test_send_hoshi_embeds_under_limits(self):
+        report = _bigReport()
+        responses = self.hook.send_hoshi(report, render='embeds')
+
+        self.assertTrue(all(r.status_code == 204 for r in responses))
+        payloads = [payload for _, payload in self.server.received]
+        self.assertGreater(len(payloads), 1)
+        for payload in payloads:
+            self.assertLessEqual(len(payload['embeds']), DISCORD_LIMITS['embeds'])
+            self.assertLessEqual(
+                sum(discord.embedLength(e) for e in payload['embeds']),
+                DISCORD_LIMITS['embed_total'])
+            for embed in payload['embeds']:
+                self.assertLessEqual(len(embed['fields']), DISCORD_LIMITS['fields'])
+                for field in embed['fields']:
+                    self.assertLessEqual(len(field['name']), DISCORD_LIMITS['field_name'])
+                    self.assertLessEqual(len(field['value']), DISCORD_LIMITS['field_value'])
+
+        sent = ''.join(
+            field['value']
+            for payload in payloads
+            for embed in payload['embeds']
+            for field in embed['fields'])
+        for s in range(40):
+            self.assertIn(f"line 39 of section {s} ", sent)
+
+    def test_send_hoshi_content_under_limit(self):
+        report = _bigReport(sections=5)
+        self.hook.send_hoshi(report, render='content')
+
+        payloads = [payload for _, payload in self.server.received]
+        self.assertGreater(len(payloads), 1)
+        for payload in payloads:
+            self.assertLessEqual(len(payload['content']), DISCORD_LIMITS['content'])
+        sent = '\n'.join(payload['content'] for payload in payloads)
+        for line in report.lines:
+            self.assertIn(line, sent)
+
+    def test_post_forwards_request_arguments(self):
+        self.hook.post(self.hook.message('hello'), allow_redirects=False)
+        self.assertEqual(len(self.server.received), 1)
+        with self.assertRaises(TypeError):
+            self.hook.post(self.hook.message('hello'), not_an_option=True)
+
+    def test_message_rejects_long_embeds(self):
+        embeds = [
+            DiscordHook.embed(fields=[('name', 'x' * 1000)] * 2) for _ in range(4)]
+        with self.assertRaises(ValueError):
+            self.hook.message(embeds=embeds)
+
+
+if __name__ == '__main__':
+    unittest.main()
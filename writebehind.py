@@ -0,0 +1,258 @@
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Callable, Hashable, NamedTuple, Union, Iterable, Any
+import threading
+import os
+
+from .jsonablize import quickJSONExport
+from .mori.taglist import TagList
+
+
+class WriteBehindStats(NamedTuple):
+    submitted: int = 0
+    written: int = 0
+    coalesced: int = 0
+    failed: int = 0
+
+
+_containers = (dict, list, tuple, set)
+
+
+def freeze(o: Any) -> Any:
+    """Copy the containers of an object, the other values are shared.
+
+    It is much cheaper than serializing, and later changes of the containers
+    do not affect the copy. For :cls:`TagList`, only the lists of tags are
+    copied, the items in them are shared, since they are usually only appended.
+
+    Args:
+        o (Any): Python object.
+
+    Returns:
+        Any: The copy.
+    """
+    if isinstance(o, TagList):
+        return type(o)(o, name=o.__name__, tupleStrTransplie=False)
+    elif isinstance(o, dict):
+        return {k: freeze(v) for k, v in o.items()}
+    elif isinstance(o, list):
+        return [freeze(v) if isinstance(v, _containers) else v for v in o]
+    elif isinstance(o, tuple):
+        return tuple(freeze(v) if isinstance(v, _containers) else v for v in o)
+    elif isinstance(o, set):
+        return set(o)
+    return o
+
+
+class WriteBehindExporter(object):
+    """Export from a writer thread, so the caller only pays for a snapshot.
+
+    The exportations to the same file which are still waiting are coalesced,
+    only the latest one is written. The queue is bounded by `maxPending`
+    files, the caller waits when it is full.
+
+    >>> with WriteBehindExporter() as exporter:
+    ...     for step in range(1000):
+    ...         result.guider(step, run(step))
+    ...         exporter.export(result, saveLocation='./', name='run')
+    ...         exporter.quickJSON(summary, 'summary.json', 'w')
+
+    """
+    __version__ = (0, 1, 0)
+
+    def __init__(
+        self,
+        maxPending: int = 64,
+        snapshot: Union[bool, Callable[[Any], Any]] = True,
+        hide_print: bool = True,
+    ) -> None:
+        """Start the writer thread.
+
+        Args:
+            maxPending (int, optional): Max number of files waiting to be written. Defaults to 64.
+            snapshot (Union[bool, Callable[[Any], Any]], optional):
+                How to copy the content before it is queued, :func:`freeze` for True,
+                or no copy for False when the content will not be changed. Defaults to True.
+            hide_print (bool, optional): Whether to mute the message of each exportation. Defaults to True.
+        """
+        if maxPending < 1:
+            raise ValueError("'maxPending' needs to be positive.")
+
+        self.maxPending = maxPending
+        self.snapshot = freeze if snapshot is True else (
+            (lambda o: o) if snapshot is False else snapshot)
+        self.hide_print = hide_print
+        self.errors: list[tuple[Hashable, BaseException]] = []
+
+        self._pending: OrderedDict[Hashable, tuple[Callable, tuple, dict]] = OrderedDict()
+        self._running = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = {k: 0 for k in WriteBehindStats._fields}
+
+        self._thread = threading.Thread(
+            target=self._run, name='WriteBehindExporter', daemon=True)
+        self._thread.start()
+
+    @property
+    def stats(self) -> WriteBehindStats:
+        with self._cond:
+            return WriteBehindStats(**self._stats)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def submit(
+        self,
+        key: Optional[Hashable],
+        func: Callable,
+        *args,
+        **kwargs,
+    ) -> None:
+        """Queue a function call, replacing the waiting one with the same key.
+
+        Args:
+            key (Optional[Hashable]): The key of coalescing, usually the path of file. None for never coalescing.
+            func (Callable): The function to write.
+        """
+        key = object() if key is None else key
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("The exporter is already closed.")
+            self._stats['submitted'] += 1
+            if key in self._pending:
+                self._pending[key] = (func, args, kwargs)
+                self._stats['coalesced'] += 1
+                return
+            self._cond.wait_for(
+                lambda: len(self._pending) < self.maxPending or self._closed)
+            if self._closed:
+                raise RuntimeError("The exporter is already closed.")
+            self._pending[key] = (func, args, kwargs)
+            self._cond.notify_all()
+
+    def quickJSON(
+        self,
+        content: Iterable,
+        filename: Union[str, Path],
+        mode: str = 'w',
+        indent: int = 2,
+        encoding: str = 'utf-8',
+        jsonablize: bool = False,
+
+        saveLocation: Union[Path, str] = Path('./'),
+        mute: bool = True,
+    ) -> None:
+        """Queue :func:`quickJSON`, the arguments are the same.
+        The exportations with mode 'a' are never coalesced.
+        """
+        key = None if 'a' in mode else os.path.abspath(
+            Path(saveLocation) / filename)
+        self.submit(
+            key,
+            quickJSONExport,
+            content=self.snapshot(content),
+            filename=filename,
+            mode=mode,
+            indent=indent,
+            encoding=encoding,
+            jsonablize=jsonablize,
+            saveLocation=saveLocation,
+            mute=mute,
+        )
+
+    def export(
+        self,
+        tagList: TagList,
+        saveLocation: Union[Path, str] = Path('./'),
+        tagListName: Optional[str] = None,
+        name: Optional[str] = None,
+        filetype: str = 'json',
+        **exportArgs,
+    ) -> None:
+        """Queue :meth:`TagList.export`, the other arguments are the same.
+        The exportations with mode 'a' are never coalesced.
+
+        Args:
+            tagList (TagList): The `tagList`.
+            tagListName (Optional[str], optional): Name for this `tagList`. Defaults to None as :attr:`tagList.__name__`.
+        """
+        tagListName = tagList.__name__ if tagListName is None else tagListName
+        session = exportArgs.get('session', None)
+        location = saveLocation if session is None else session.saveLocation
+        filename = (
+            f"" if name is None else f"{name}.") + f"{tagListName}.{filetype}"
+        mode = exportArgs.get('openArgs', {}).get('mode', 'w')
+        key = None if 'a' in mode else os.path.abspath(Path(location) / filename)
+
+        self.submit(
+            key,
+            self._exportTagList,
+            self.snapshot(tagList),
+            saveLocation=saveLocation,
+            tagListName=tagListName,
+            name=name,
+            filetype=filetype,
+            **exportArgs,
+        )
+
+    def _exportTagList(self, tagList: TagList, **exportArgs) -> None:
+        path = tagList.export(**exportArgs)
+        if not self.hide_print:
+            print(f"'{path}' exported successfully.")
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: len(self._pending) > 0 or self._closed)
+                if len(self._pending) == 0:
+                    return
+                key, (func, args, kwargs) = self._pending.popitem(last=False)
+                self._running += 1
+                self._cond.notify_all()
+
+            try:
+                func(*args, **kwargs)
+            except Exception as e:
+                print(f"Exporting '{key}' failed with {type(e).__name__}: {e}")
+                failed = True
+                self.errors.append((key, e))
+            else:
+                failed = False
+
+            with self._cond:
+                self._running -= 1
+                self._stats['failed' if failed else 'written'] += 1
+                self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued exportations are written.
+
+        Args:
+            timeout (Optional[float], optional): Max seconds to wait. Defaults to None.
+
+        Returns:
+            bool: Whether all exportations are done.
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: len(self._pending) == 0 and self._running == 0, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Write the remaining exportations and stop the writer thread.
+
+        Args:
+            timeout (Optional[float], optional): Max seconds to wait. Defaults to None.
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()